@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the local (non-network) parts of pdf2md.py
+
+Usage:
+    # Image link rewriting: single-pass rewrite vs. one re.sub per image
+    python bench_pdf2md.py links
+
+    # Custom figure counts and repetitions
+    python bench_pdf2md.py links --images 10 100 500 2000 --repeat 5
+
+    # Full per-document pipeline against a fake Mistral: 16 documents of 50 pages,
+    # 4 images of 256 KB per page, 4 concurrent jobs, 50 ms simulated OCR latency
+    python bench_pdf2md.py pipeline --docs 16 --pages 50 --images-per-page 4 --image-kb 256 --latency 0.05
+
+    # Replay OCR responses recorded in an OCR cache (pdf2md --cache-dir) instead
+    python bench_pdf2md.py pipeline --replay ~/.cache/pdf2md --docs 32
+
+    # Machine-readable results for regression tracking
+    python bench_pdf2md.py pipeline --json > results.json
+
+Benchmarks:
+    links     Rewrites the ](img-N.jpeg) link targets of a synthetic page with N
+              figures (plus surrounding text) using the per-image re.sub loop that
+              pdf2md used before and the current pdf2md.rewrite_image_links, checks
+              both produce identical markdown, and reports the best time of each.
+
+    pipeline  Runs pdf2md.convert_pdf_document (or the async convert_pdf with
+              --api async) on generated PDFs with a FakeMistral client in place of
+              the SDK. The fake answers upload/signed-URL/OCR calls after a
+              configurable latency and serves either synthetic OCR responses (many
+              pages, many images, large base64 payloads) or responses recorded in
+              OCR cache entries (--replay, files or directories of *.json). Each
+              response is parsed from JSON per call, like the SDK does, so documents
+              never share payloads. Reports throughput, per-document latency
+              percentiles, peak memory and the summed per-stage timings.
+
+Requirements:
+    - rich: Terminal formatting
+    - the dependencies of pdf2md.py (it is imported, not executed)
+"""
+
+import argparse
+import asyncio
+import base64
+import glob
+import io
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import PyPDF2
+from rich.console import Console
+from rich.table import Table
+
+import pdf2md
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+console = Console()
+
+
+def make_page_markdown(num_images: int, words_between: int = 120) -> str:
+    """Builds a page with num_images figure links separated by paragraphs of text."""
+    filler = " ".join(["lorem"] * words_between)
+    parts = []
+    for i in range(num_images):
+        parts.append(f"{filler}\n\n![img-{i}.jpeg](img-{i}.jpeg)\n\nFigure {i}: caption.")
+    return "\n\n".join(parts)
+
+
+def rewrite_links_per_image(markdown: str, link_targets: Dict[str, str]) -> str:
+    """Reference implementation: one compiled substitution and full rescan per image."""
+    for image_id, rel_path in link_targets.items():
+        markdown = re.sub(rf"\]\({re.escape(image_id)}\)", f"]({rel_path})", markdown)
+    return markdown
+
+
+# Pages where OCR text around the image links looks like link syntax itself
+LINK_EDGE_CASES = [
+    "Interval [0, 1](\n\n![img-0.jpeg](img-0.jpeg)",
+    "See [a](b](img-0.jpeg) and f(x) = [x](y)",
+    "![img-0.jpeg](img-0.jpeg)![img-1.jpeg](img-1.jpeg) ](img-1.jpeg (unclosed",
+    "[text](img-0.jpeg)\n](\n)(img-1.jpeg)](img-1.jpeg)",
+]
+
+
+def check_link_rewriting():
+    """Exits if the single-pass rewrite differs from the per-image reference on edge cases."""
+    link_targets = {f"img-{i}.jpeg": f"doc_images/img-{i}.jpeg.jpg" for i in range(2)}
+    for markdown in LINK_EDGE_CASES:
+        expected = rewrite_links_per_image(markdown, link_targets)
+        if pdf2md.rewrite_image_links(markdown, link_targets) != expected:
+            raise SystemExit(f"Rewritten markdown differs for {markdown!r}")
+
+
+def best_time(func: Callable[[], str], repeat: int) -> float:
+    """Returns the fastest of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench_links(image_counts: List[int], repeat: int):
+    table = Table(title="Image link rewriting (per page)", show_header=True, header_style="bold magenta")
+    table.add_column("Images", justify="right", style="cyan")
+    table.add_column("Page chars", justify="right", style="blue")
+    table.add_column("re.sub per image", justify="right", style="yellow")
+    table.add_column("Single pass", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="bold")
+
+    check_link_rewriting()
+    for count in image_counts:
+        markdown = make_page_markdown(count)
+        link_targets = {f"img-{i}.jpeg": f"doc_images/img-{i}.jpeg.jpg" for i in range(count)}
+        expected = rewrite_links_per_image(markdown, link_targets)
+        if pdf2md.rewrite_image_links(markdown, link_targets) != expected:
+            raise SystemExit(f"Rewritten markdown differs for {count} images")
+
+        old = best_time(lambda: rewrite_links_per_image(markdown, link_targets), repeat)
+        new = best_time(lambda: pdf2md.rewrite_image_links(markdown, link_targets), repeat)
+        table.add_row(
+            f"{count:,}",
+            f"{len(markdown):,}",
+            f"{old * 1000:.2f} ms",
+            f"{new * 1000:.2f} ms",
+            f"{old / new:.1f}x" if new > 0 else "N/A",
+        )
+    console.print(table)
+
+
+# --- Fake Mistral backend ---
+class _FakeFiles:
+    def __init__(self, backend: "FakeMistral"):
+        self._backend = backend
+
+    def upload(self, file: Dict[str, Any], purpose: str) -> SimpleNamespace:
+        self._backend.sleep(self._backend.upload_latency)
+        return SimpleNamespace(id=self._backend.register_upload(file["file_name"]))
+
+    def get_signed_url(self, file_id: str, expiry: int) -> SimpleNamespace:
+        return SimpleNamespace(url=f"https://fake.invalid/{file_id}")
+
+    async def upload_async(self, file: Dict[str, Any], purpose: str) -> SimpleNamespace:
+        await asyncio.sleep(self._backend.jittered(self._backend.upload_latency))
+        return SimpleNamespace(id=self._backend.register_upload(file["file_name"]))
+
+    async def get_signed_url_async(self, file_id: str, expiry: int) -> SimpleNamespace:
+        return self.get_signed_url(file_id, expiry)
+
+
+class _FakeOCR:
+    def __init__(self, backend: "FakeMistral"):
+        self._backend = backend
+
+    def process(self, model: str, document: Dict[str, Any], include_image_base64: bool) -> SimpleNamespace:
+        self._backend.sleep(self._backend.latency)
+        return self._backend.response_for(document["document_url"], include_image_base64)
+
+    async def process_async(self, model: str, document: Dict[str, Any], include_image_base64: bool) -> SimpleNamespace:
+        await asyncio.sleep(self._backend.jittered(self._backend.latency))
+        return self._backend.response_for(document["document_url"], include_image_base64)
+
+
+class FakeMistral:
+    """Stand-in for the Mistral client that serves recorded OCR responses.
+
+    responses maps an uploaded file name to the JSON text of its OCR pages; every OCR
+    call parses it afresh, so each document gets its own payload objects as it would
+    from the SDK. Calls sleep for latency (+/- jitter, as a fraction) seconds.
+    """
+
+    def __init__(
+        self,
+        responses: Dict[str, str],
+        latency: float = 0.0,
+        upload_latency: float = 0.0,
+        jitter: float = 0.0,
+    ):
+        self.responses = responses
+        self.latency = latency
+        self.upload_latency = upload_latency
+        self.jitter = jitter
+        self.files = _FakeFiles(self)
+        self.ocr = _FakeOCR(self)
+        self._lock = threading.Lock()
+        self._uploads: Dict[str, str] = {}
+
+    def jittered(self, seconds: float) -> float:
+        if seconds <= 0:
+            return 0.0
+        return max(0.0, seconds * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def sleep(self, seconds: float):
+        seconds = self.jittered(seconds)
+        if seconds:
+            time.sleep(seconds)
+
+    def register_upload(self, file_name: str) -> str:
+        if file_name not in self.responses:
+            raise RuntimeError(f"No recorded OCR response for {file_name}")
+        with self._lock:
+            file_id = f"file-{len(self._uploads)}"
+            self._uploads[file_id] = file_name
+        return file_id
+
+    def response_for(self, document_url: str, include_image_base64: bool) -> SimpleNamespace:
+        pages = json.loads(self.responses[self._uploads[document_url.rsplit("/", 1)[1]]])
+        if not include_image_base64:
+            for page in pages:
+                for image in page.get("images") or []:
+                    image["image_base64"] = None
+        return SimpleNamespace(pages=pdf2md._to_namespace(pages))
+
+
+# --- Workloads ---
+def make_synthetic_pages(
+    num_pages: int,
+    images_per_page: int,
+    image_kb: int,
+    words_per_page: int,
+    duplicate_images: bool = False,
+) -> List[Dict[str, Any]]:
+    """Builds OCR pages shaped like Mistral's response, with random PNG-tagged payloads.
+
+    With duplicate_images every image carries the same bytes (repeated logos etc.).
+    """
+    filler = " ".join(["lorem"] * max(1, words_per_page // max(1, images_per_page + 1)))
+    shared = b"\x89PNG\r\n\x1a\n" + os.urandom(image_kb * 1024) if duplicate_images else None
+    pages = []
+    for index in range(num_pages):
+        images, parts = [], [f"# Page {index + 1}", filler]
+        for k in range(images_per_page):
+            image_id = f"img-{index * images_per_page + k}.png"
+            payload = shared or b"\x89PNG\r\n\x1a\n" + os.urandom(image_kb * 1024)
+            images.append({
+                "id": image_id,
+                "top_left_x": 50, "top_left_y": 100 + 200 * k,
+                "bottom_right_x": 550, "bottom_right_y": 280 + 200 * k,
+                "image_base64": "data:image/png;base64," + base64.b64encode(payload).decode("ascii"),
+            })
+            parts += [f"![{image_id}]({image_id})", filler]
+        pages.append({
+            "index": index,
+            "markdown": "\n\n".join(parts),
+            "images": images,
+            "dimensions": {"dpi": 200, "height": 2200, "width": 1700},
+        })
+    return pages
+
+
+def load_recorded_pages(paths: List[str]) -> List[List[Dict[str, Any]]]:
+    """Loads the pages of OCR cache entries (files, or directories searched for *.json)."""
+    files: List[str] = []
+    for path in paths:
+        path = os.path.expanduser(path)
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "*.json"), recursive=True)))
+        else:
+            files.append(path)
+    recordings = []
+    for path in files:
+        with open(path, "r", encoding="utf-8") as fd:
+            entry = json.load(fd)
+        if isinstance(entry, dict) and entry.get("pages"):
+            recordings.append(entry["pages"])
+    return recordings
+
+
+def write_blank_pdf(path: str, num_pages: int, title: str):
+    """Writes a PDF with num_pages blank pages (the fake never looks at the content)."""
+    writer = PyPDF2.PdfWriter()
+    for _ in range(max(1, num_pages)):
+        writer.add_blank_page(width=612, height=792)
+    writer.add_metadata({"/Title": title})
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    with open(path, "wb") as fd:
+        fd.write(buffer.getvalue())
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run_pipeline(
+    client: FakeMistral,
+    jobs: List[tuple],
+    options: "pdf2md.ConversionOptions",
+    workers: int,
+    api: str,
+) -> List["pdf2md.ConversionResult"]:
+    if api == "async":
+        async def run_all():
+            limit = asyncio.Semaphore(workers)
+
+            async def one(pdf_path: str, output_path: str):
+                async with limit:
+                    return await pdf2md.convert_pdf(pdf_path, output_path, client=client, options=options)
+
+            return await asyncio.gather(*(one(p, o) for p, o in jobs))
+
+        return asyncio.run(run_all())
+
+    def one(job: tuple) -> "pdf2md.ConversionResult":
+        pdf_path, output_path = job
+        return pdf2md.convert_pdf_document(
+            client, pdf_path, output_path, options, pdf2md._buffered_console()
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(one, jobs))
+
+
+def bench_pipeline(args: argparse.Namespace):
+    if args.replay:
+        recordings = load_recorded_pages(args.replay)
+        if not recordings:
+            raise SystemExit("No OCR cache entries with pages found in --replay paths")
+    else:
+        recordings = [make_synthetic_pages(
+            args.pages, args.images_per_page, args.image_kb, args.page_words, args.duplicate_images
+        )]
+    payloads = [json.dumps(pages) for pages in recordings]
+    include_images = not args.no_images
+
+    with tempfile.TemporaryDirectory(prefix="bench_pdf2md_") as workdir:
+        sources = []
+        for k, pages in enumerate(recordings):
+            source = os.path.join(workdir, f"recording-{k}.pdf")
+            write_blank_pdf(source, len(pages), f"recording {k}")
+            sources.append(source)
+
+        responses: Dict[str, str] = {}
+        jobs = []
+        for i in range(args.docs):
+            k = i % len(recordings)
+            pdf_path = os.path.join(workdir, "in", f"doc-{i:05d}.pdf")
+            os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
+            shutil.copyfile(sources[k], pdf_path)
+            responses[os.path.basename(pdf_path)] = payloads[k]
+            jobs.append((pdf_path, os.path.join(workdir, "out", f"doc-{i:05d}.md")))
+        del recordings
+
+        client = FakeMistral(responses, args.latency, args.upload_latency, args.jitter)
+        options = pdf2md.ConversionOptions(
+            include_images=include_images,
+            checkpoint=not args.no_checkpoint,
+            image_workers=args.image_workers,
+            dedupe_images=args.dedupe_images,
+        )
+
+        if args.trace_memory:
+            tracemalloc.start()
+        rss_before = _peak_rss_bytes()
+        started = time.perf_counter()
+        results = _run_pipeline(client, jobs, options, args.jobs, args.api)
+        elapsed = time.perf_counter() - started
+        traced_peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+        if args.trace_memory:
+            tracemalloc.stop()
+        rss_peak = _peak_rss_bytes()
+
+    failed = [r for r in results if not r.ok]
+    if failed:
+        raise SystemExit(f"{len(failed)} documents failed, e.g. {failed[0].pdf_path}: {failed[0].error}")
+
+    stages = pdf2md.StageTimer()
+    for r in results:
+        stages.merge(r.stages)
+    stage_totals = stages.snapshot()
+    latencies = [r.elapsed for r in results]
+    pages = sum(r.num_pages or 0 for r in results)
+    image_bytes = stage_totals.get("image_decode", {}).get("bytes", 0)
+    summary: Dict[str, Any] = {
+        "api": args.api,
+        "documents": len(results),
+        "pages": pages,
+        "image_mb": round(image_bytes / 1e6, 3),
+        "jobs": args.jobs,
+        "latency_s": args.latency,
+        "elapsed_s": round(elapsed, 4),
+        "docs_per_s": round(len(results) / elapsed, 3),
+        "pages_per_s": round(pages / elapsed, 2),
+        "image_mb_per_s": round(image_bytes / 1e6 / elapsed, 2),
+        "doc_latency_p50_s": round(percentile(latencies, 50), 4),
+        "doc_latency_p90_s": round(percentile(latencies, 90), 4),
+        "doc_latency_p99_s": round(percentile(latencies, 99), 4),
+        "doc_latency_max_s": round(max(latencies), 4),
+        "peak_rss_mb": round(rss_peak / 1e6, 1) if rss_peak else None,
+        "peak_rss_growth_mb": round((rss_peak - rss_before) / 1e6, 1) if rss_peak else None,
+        "traced_peak_mb": round(traced_peak / 1e6, 1) if traced_peak is not None else None,
+        "stages": stage_totals,
+    }
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    table = Table(title="pdf2md pipeline (fake Mistral)", show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right", style="green")
+    for key, value in summary.items():
+        if key != "stages" and value is not None:
+            table.add_row(key, f"{value:,}" if isinstance(value, (int, float)) else str(value))
+    console.print(table)
+
+    stage_table = Table(title="Per-stage totals (summed over documents and threads)", show_header=True, header_style="bold magenta")
+    stage_table.add_column("Stage", style="cyan")
+    stage_table.add_column("Calls", justify="right", style="blue")
+    stage_table.add_column("Seconds", justify="right", style="yellow")
+    stage_table.add_column("MB/s", justify="right", style="green")
+    stage_table.add_column("Pages/s", justify="right", style="green")
+    for name, values in stage_totals.items():
+        stage_table.add_row(
+            name,
+            f"{values['calls']:,}",
+            f"{values['seconds']:.3f}",
+            f"{values['bytes_per_sec'] / 1e6:,.1f}" if "bytes_per_sec" in values else "",
+            f"{values['pages_per_sec']:,.0f}" if "pages_per_sec" in values else "",
+        )
+    console.print(stage_table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local pdf2md.py processing stages.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    links = subparsers.add_parser("links", help="Image link rewriting micro-benchmark")
+    links.add_argument("--images", type=int, nargs="+", default=[10, 100, 300, 1000], help="Figures per page (default: 10 100 300 1000).")
+    links.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is reported (default: 5).")
+
+    pipeline = subparsers.add_parser("pipeline", help="End-to-end pipeline against a fake Mistral backend")
+    pipeline.add_argument("--docs", type=int, default=8, help="Documents to convert (default: 8).")
+    pipeline.add_argument("--pages", type=int, default=50, help="Synthetic pages per document (default: 50).")
+    pipeline.add_argument("--images-per-page", type=int, default=2, help="Synthetic images per page (default: 2).")
+    pipeline.add_argument("--image-kb", type=int, default=64, help="Decoded size of each synthetic image in KB (default: 64).")
+    pipeline.add_argument("--page-words", type=int, default=400, help="Words of text per synthetic page (default: 400).")
+    pipeline.add_argument("--duplicate-images", action="store_true", help="Give every synthetic image the same bytes.")
+    pipeline.add_argument("--replay", nargs="+", metavar="PATH", help="OCR cache entry files or directories to replay instead of synthetic pages.")
+    pipeline.add_argument("--latency", type=float, default=0.0, help="Simulated OCR call latency in seconds (default: 0).")
+    pipeline.add_argument("--upload-latency", type=float, default=0.0, help="Simulated upload latency in seconds (default: 0).")
+    pipeline.add_argument("--jitter", type=float, default=0.0, help="Latency jitter as a fraction, e.g. 0.2 = +/-20%% (default: 0).")
+    pipeline.add_argument("-j", "--jobs", type=int, default=pdf2md.DEFAULT_BATCH_JOBS, help=f"Concurrent documents (default: {pdf2md.DEFAULT_BATCH_JOBS}).")
+    pipeline.add_argument("--api", choices=["sync", "async"], default="sync", help="convert_pdf_document threads or async convert_pdf (default: sync).")
+    pipeline.add_argument("--image-workers", type=int, default=pdf2md.DEFAULT_IMAGE_WORKERS, help=f"pdf2md image threads per document (default: {pdf2md.DEFAULT_IMAGE_WORKERS}).")
+    pipeline.add_argument("--dedupe-images", action="store_true", help="Enable pdf2md image de-duplication.")
+    pipeline.add_argument("--no-images", action="store_true", help="Convert without images (payloads are dropped by the fake).")
+    pipeline.add_argument("--no-checkpoint", action="store_true", help="Disable the per-page checkpoint journal.")
+    pipeline.add_argument("--trace-memory", action="store_true", help="Also report the tracemalloc peak (slows the run).")
+    pipeline.add_argument("--json", action="store_true", help="Print the results as JSON instead of tables.")
+
+    args = parser.parse_args()
+    if args.benchmark == "links":
+        bench_links(args.images, args.repeat)
+    elif args.benchmark == "pipeline":
+        if args.docs < 1 or args.jobs < 1:
+            parser.error("--docs and --jobs must be at least 1")
+        bench_pipeline(args)
+
+
+if __name__ == "__main__":
+    main()
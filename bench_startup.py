@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the CLI tools (pdf2md.py, url2md.py)
+
+These tools are called thousands of times from shell pipelines, so interpreter and
+import time dominate short jobs. This script measures both and fails when a heavy
+dependency creeps back into module import.
+
+Usage:
+    # Both tools, best of 5 runs
+    python bench_startup.py
+
+    # One tool, more runs, show the 20 most expensive imports
+    python bench_startup.py pdf2md --runs 10 --top 20
+
+    # CI guard: exit 1 if importing a tool takes longer than 150 ms
+    python bench_startup.py --max-import-ms 150
+
+Measurements:
+    import    Cumulative time of `import <tool>` from `python -X importtime`
+              (best of --runs fresh interpreters).
+    --help    Wall time of `python <tool>.py --help` (best of --runs), i.e. the
+              whole interpreter startup as a shell pipeline sees it.
+    heaviest  Imports with the highest self time in the fastest import run.
+
+Checks:
+    Modules listed in LAZY_MODULES must not be imported by `import <tool>`; they
+    are loaded by the code paths that need them. Any violation (or an exceeded
+    --max-import-ms budget) makes the script exit with status 1.
+
+Requirements:
+    - rich: Terminal formatting
+    - the dependencies of the measured tools
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Top-level packages each tool must only import on demand
+LAZY_MODULES = {
+    "pdf2md": ["mistralai", "PyPDF2", "asyncio", "rich.progress", "rich.syntax", "rich.table", "rich.prompt"],
+    "url2md": ["requests", "charset_normalizer", "bs4", "trafilatura", "readability", "markdownify", "lxml"],
+}
+
+
+def run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """Imports module in a fresh interpreter; returns (self_us, cumulative_us, name) rows."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{proc.stderr}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def help_wall_time(script: str) -> float:
+    """Seconds taken by `python <script> --help` in a fresh interpreter."""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, os.path.join(REPO_DIR, script), "--help"],
+        cwd=REPO_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - started
+
+
+def bench_tool(module: str, runs: int, top: int) -> Dict[str, object]:
+    best_rows: List[Tuple[int, int, str]] = []
+    best_import_us = None
+    for _ in range(runs):
+        rows = run_importtime(module)
+        import_us = next(cumulative for _, cumulative, name in rows if name == module)
+        if best_import_us is None or import_us < best_import_us:
+            best_import_us, best_rows = import_us, rows
+    help_seconds = min(help_wall_time(f"{module}.py") for _ in range(runs))
+
+    imported = {name for _, _, name in best_rows}
+    violations = [
+        lazy for lazy in LAZY_MODULES.get(module, [])
+        if any(name == lazy or name.startswith(lazy + ".") for name in imported)
+    ]
+    heaviest = sorted(
+        (row for row in best_rows if row[2] != module), key=lambda row: row[0], reverse=True
+    )[:top]
+    return {
+        "module": module,
+        "import_ms": best_import_us / 1000,
+        "help_ms": help_seconds * 1000,
+        "modules": len(best_rows),
+        "violations": violations,
+        "heaviest": heaviest,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI startup and import time of the tools.")
+    parser.add_argument("tools", nargs="*", default=sorted(LAZY_MODULES), help="Tools to measure (default: pdf2md url2md).")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement; the best is reported (default: 5).")
+    parser.add_argument("--top", type=int, default=10, help="Most expensive imports to list per tool (default: 10).")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if importing any tool takes longer than this.")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    results = [bench_tool(tool, args.runs, args.top) for tool in args.tools]
+
+    table = Table(title=f"Startup time (best of {args.runs})", show_header=True, header_style="bold magenta")
+    table.add_column("Tool", style="cyan")
+    table.add_column("import", justify="right", style="green")
+    table.add_column("--help wall", justify="right", style="yellow")
+    table.add_column("Modules", justify="right", style="blue")
+    table.add_column("Eager heavy imports", style="red")
+    for r in results:
+        table.add_row(
+            f"{r['module']}.py",
+            f"{r['import_ms']:.1f} ms",
+            f"{r['help_ms']:.1f} ms",
+            str(r["modules"]),
+            ", ".join(r["violations"]) or "-",
+        )
+    console.print(table)
+
+    for r in results:
+        heavy = Table(title=f"Heaviest imports: {r['module']}", show_header=True, header_style="bold magenta")
+        heavy.add_column("Module", style="cyan")
+        heavy.add_column("Self", justify="right", style="yellow")
+        heavy.add_column("Cumulative", justify="right", style="green")
+        for self_us, cumulative_us, name in r["heaviest"]:
+            heavy.add_row(name, f"{self_us / 1000:.1f} ms", f"{cumulative_us / 1000:.1f} ms")
+        console.print(heavy)
+
+    failed = False
+    for r in results:
+        if r["violations"]:
+            console.print(f"[bold red]{r['module']} imports {', '.join(r['violations'])} at startup.[/]")
+            failed = True
+        if args.max_import_ms is not None and r["import_ms"] > args.max_import_ms:
+            console.print(
+                f"[bold red]{r['module']} import took {r['import_ms']:.1f} ms "
+                f"(budget {args.max_import_ms:.0f} ms).[/]"
+            )
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the local (non-network) parts of url2md.py
+
+Usage:
+    # Extraction on synthetic documentation pages of 20, 100 and 400 sections
+    python bench_url2md.py extract
+
+    # Custom page sizes and layouts, more repetitions
+    python bench_url2md.py extract --sections 50 500 --layouts docs sparse --repeat 10
+
+    # Saved pages (e.g. from url2md --save-html) instead of synthetic ones
+    python bench_url2md.py extract --html saved/*.html
+
+    # Bulk extraction throughput: thread pool vs. process pool (url2md --processes)
+    python bench_url2md.py pool --pages 256 --workers 1 2 4 8 16 32
+
+Benchmarks:
+    extract   Times url2md.extract_markdown per page (best of --repeat), shows the
+              tier that won and breaks the time down into the work each stage does on the shared lxml
+              tree: parse, trafilatura, readability (plus its text-length check),
+              container pick and markdownify of the picked container. Synthetic
+              layouts:
+                article  <article> page with a large nav/sidebar/footer
+                docs     Docs-site page: content in div.md-content, no <article>
+                reference  div.md-content holding mostly tables and code (API reference)
+                sparse   Short content in bare <div>s, so early tiers give up
+
+    pool      Extracts --pages synthetic pages (mixed layouts, encoded as bytes the
+              way bulk mode hands them over) with url2md's bulk extraction pool, as
+              threads and as warm worker processes, for each --workers count.
+              Reports pages/s and the speedup over one worker of the same kind;
+              process pools are started and warmed before timing.
+
+Requirements:
+    - rich: Terminal formatting
+    - the dependencies of url2md.py (it is imported, not executed)
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import wait
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+import url2md
+
+console = Console()
+
+LAYOUTS = ["article", "docs", "reference", "sparse"]
+WORDS = (
+    "request response session cache header token parser module option value "
+    "config default return client server thread process buffer stream record"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_docs_page(sections: int, layout: str, seed: int = 0) -> str:
+    """Builds a documentation-style page with `sections` headed sections of prose, code and tables."""
+    rng = random.Random(seed)
+    links = [f'<li><a href="/docs/page-{i}">{_sentence(rng, 3)}</a></li>' for i in range(max(20, sections))]
+    nav = "".join(links)
+    footer_links = "".join(links[:20])
+    body = []
+    for i in range(sections):
+        if layout == "sparse":
+            body.append(f"<div><b>{_sentence(rng, 3)}</b> {_sentence(rng, 6)}</div>")
+            continue
+        if layout == "reference":
+            rows = "".join(f"<tr><td><code>{rng.choice(WORDS)}_{j}</code></td><td>{_sentence(rng, 5)}</td></tr>" for j in range(8))
+            body.append(f'<h2 id="s{i}">{rng.choice(WORDS)}_{i}()</h2><table>{rows}</table>')
+            body.append(f"<pre><code>client.{rng.choice(WORDS)}_{i}(value={i}, timeout=30)\n</code></pre>")
+            continue
+        body.append(f'<h2 id="s{i}">Section {i}: {_sentence(rng, 4)}</h2>')
+        body.append("".join(f"<p>{_sentence(rng, 25)} <a href='#s{i}'>{rng.choice(WORDS)}</a> {_sentence(rng, 15)}</p>" for _ in range(3)))
+        body.append(f"<pre><code>def f{i}(x):\n    return x * {i}\n</code></pre>")
+        if i % 3 == 0:
+            rows = "".join(f"<tr><td>{rng.choice(WORDS)}</td><td>{_sentence(rng, 6)}</td></tr>" for _ in range(5))
+            body.append(f"<table><tr><th>Name</th><th>Description</th></tr>{rows}</table>")
+        body.append("<ul>" + "".join(f"<li>{_sentence(rng, 8)}</li>" for _ in range(4)) + "</ul>")
+    content = "\n".join(body)
+    if layout == "article":
+        main = f"<main><article><h1>{_sentence(rng, 5)}</h1>{content}</article></main>"
+    elif layout in ("docs", "reference"):
+        main = f'<div class="md-main__inner"><div class="md-content" data-md-component="content"><h1>{_sentence(rng, 5)}</h1>{content}</div></div>'
+    else:
+        main = f"<div>{content}</div>"
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Docs</title>"
+        "<style>body { font-family: sans-serif; }</style><script>var x = 1;</script></head><body>"
+        f"<header><nav class='navbar'><ul>{nav}</ul></nav></header>"
+        f"<aside class='sidebar'><ul>{nav}</ul></aside>{main}"
+        f"<footer><p>{_sentence(rng, 12)}</p><ul>{footer_links}</ul></footer></body></html>"
+    )
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Returns the fastest of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench_extract(pages: List[Tuple[str, str]], repeat: int):
+    table = Table(title=f"url2md extraction per page (best of {repeat})", show_header=True, header_style="bold magenta")
+    table.add_column("Page", style="cyan", no_wrap=True)
+    table.add_column("HTML KB", justify="right", style="blue")
+    table.add_column("MD KB", justify="right", style="blue")
+    table.add_column("Tier", style="magenta")
+    table.add_column("extract ms", justify="right", style="bold green")
+    table.add_column("parse", justify="right", style="yellow")
+    table.add_column("trafilatura", justify="right", style="yellow")
+    table.add_column("readability", justify="right", style="yellow")
+    table.add_column("container", justify="right", style="yellow")
+    table.add_column("markdownify", justify="right", style="yellow")
+
+    def ms(seconds: float) -> str:
+        return f"{seconds * 1000:.1f}"
+
+    for name, html in pages:
+        markdown, tier, _ = url2md.extract_markdown(html)
+        total = best_time(lambda: url2md.extract_markdown(html), repeat)
+
+        tree = url2md.parse_html(html)
+        container = url2md.pick_main_container(html, tree) or html
+        table.add_row(
+            name,
+            f"{len(html) / 1024:,.0f}",
+            f"{len(markdown) / 1024:,.1f}",
+            tier,
+            ms(total),
+            ms(best_time(lambda: url2md.parse_html(html), repeat)),
+            ms(best_time(lambda: url2md.extract_with_trafilatura(html, tree), repeat)),
+            ms(best_time(lambda: url2md.text_length(url2md.readability_to_html(html, tree) or ""), repeat)),
+            ms(best_time(lambda: url2md.pick_main_container(html, tree), repeat)),
+            ms(best_time(lambda: url2md.html_to_markdown(container), repeat)),
+        )
+    console.print(table)
+    console.print("[dim]Stage columns time each stage alone; extract runs only the tiers the page needs.[/]")
+
+
+def _pool_throughput(pages: List[bytes], workers: int, processes: bool, output_dir: Path) -> float:
+    """Pages per second for extracting pages with url2md's bulk extraction pool."""
+    with url2md._extract_pool(workers, processes) as pool:
+        # Start every worker (and run its initializer) before timing
+        wait([pool.submit(time.sleep, 0.05) for _ in range(workers * 2)])
+        started = time.perf_counter()
+        futures = [
+            pool.submit(url2md._extract_and_write, page, "utf-8", output_dir / f"{i}.md", None, None)
+            for i, page in enumerate(pages)
+        ]
+        for future in futures:
+            future.result()
+        return len(pages) / (time.perf_counter() - started)
+
+
+def bench_pool(num_pages: int, sections: int, worker_counts: List[int], modes: List[str]):
+    pages = [
+        make_docs_page(sections, LAYOUTS[i % len(LAYOUTS)], seed=i).encode("utf-8")
+        for i in range(num_pages)
+    ]
+    console.print(f"{num_pages} pages of {sum(map(len, pages)) / num_pages / 1024:.0f} KB on {os.cpu_count()} CPUs")
+    table = Table(title="url2md bulk extraction throughput", show_header=True, header_style="bold magenta")
+    table.add_column("Workers", justify="right", style="cyan")
+    for mode in modes:
+        table.add_column(f"{mode} pages/s", justify="right", style="green")
+        table.add_column("speedup", justify="right", style="bold")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_url2md_") as tmp:
+        for workers in worker_counts:
+            row = [str(workers)]
+            for mode in modes:
+                rate = _pool_throughput(pages, workers, mode == "process", Path(tmp))
+                base = results.setdefault(mode, rate)
+                row += [f"{rate:.1f}", f"{rate / base:.1f}x"]
+            table.add_row(*row)
+    console.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local url2md.py processing stages.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    extract = subparsers.add_parser("extract", help="HTML to Markdown extraction per page")
+    extract.add_argument("--sections", type=int, nargs="+", default=[20, 100, 400], help="Sections per synthetic page (default: 20 100 400).")
+    extract.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=LAYOUTS, help="Synthetic page layouts (default: all).")
+    extract.add_argument("--html", nargs="+", metavar="FILE", help="Saved HTML pages to use instead of synthetic ones.")
+    extract.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is reported (default: 3).")
+
+    pool = subparsers.add_parser("pool", help="Bulk extraction throughput: threads vs. worker processes")
+    pool.add_argument("--pages", type=int, default=64, help="Synthetic pages to extract (default: 64).")
+    pool.add_argument("--sections", type=int, default=40, help="Sections per synthetic page (default: 40).")
+    pool.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Pool sizes to measure; the first is the speedup baseline (default: 1 2 4).")
+    pool.add_argument("--modes", nargs="+", choices=["thread", "process"], default=["thread", "process"], help="Pool kinds (default: both).")
+
+    args = parser.parse_args()
+    if args.benchmark == "pool":
+        if args.pages < 1 or min(args.workers) < 1:
+            parser.error("--pages and --workers must be at least 1")
+        bench_pool(args.pages, args.sections, args.workers, args.modes)
+    elif args.benchmark == "extract":
+        if args.html:
+            pages = []
+            for path in args.html:
+                with open(path, "rb") as fd:
+                    pages.append((os.path.basename(path), url2md.decode_html(fd.read(), None)))
+        else:
+            pages = [
+                (f"{layout}-{sections}", make_docs_page(sections, layout))
+                for layout in args.layouts
+                for sections in args.sections
+            ]
+        bench_extract(pages, max(1, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -30,12 +30,53 @@ Usage:
     # Skip markdown preview after processing
     python pdf2md.py document.pdf --no-preview
 
+    # Batch mode: directories, globs and manifests with 8 concurrent jobs
+    python pdf2md.py papers/ "scans/**/*.pdf" --manifest todo.txt -y -j 8
+
+    # Batch mode with all outputs under one directory
+    python pdf2md.py papers/ -y --output-dir converted/
+
+    # Worker mode: queue PDFs, convert them in a long-lived worker, check progress
+    python pdf2md.py --enqueue papers/ --output-dir converted/ --include-images
+    python pdf2md.py --worker -j 4
+    python pdf2md.py --queue-status
+
+    # Watch folders: convert PDFs as they arrive or change
+    python pdf2md.py --watch inbox/ --output-dir converted/ -j 2
+
 Options:
-    pdf_path             Path to the PDF file to convert (required)
+    pdf_path             PDF file(s), directories or glob patterns to convert
     -y, --yes            Non-interactive mode - assume Yes to all prompts
     --include-images     Extract images from PDF, save to disk, and rewrite markdown links
     -o, --output PATH    Custom output file path (default: same location as PDF with .md extension)
     --no-preview         Skip the markdown preview display after processing
+    --manifest FILE      Text file listing PDF paths/directories/globs, one per line
+    -j, --jobs N         Number of concurrent upload/OCR jobs in batch mode (default: 4)
+    --output-dir DIR     Batch mode output root (default: alongside each PDF)
+    --cache-dir DIR      Cache OCR results on disk, keyed by PDF content hash (env: PDF2MD_CACHE_DIR)
+    --no-cache           Disable the OCR result cache even if PDF2MD_CACHE_DIR is set
+    --cache-max-size MB  Evict least recently used cache entries above this size (default: 2048)
+    --cache-max-age DAYS Evict cache entries older than this (default: 30)
+    --chunk-pages N      OCR PDFs longer than N pages as concurrent N-page shards (default: off)
+    --chunk-workers N    Concurrent shard uploads/OCR calls per document (default: 4)
+    --no-checkpoint      Do not keep a resumable per-page journal next to the output
+    --upload-registry P  Reuse Mistral file ids of previously uploaded identical PDFs (env: PDF2MD_UPLOAD_REGISTRY)
+    --rate-limit RPS     Maximum Mistral API calls per second across all jobs (default: unlimited)
+    --max-retries N      Retries for 429/5xx/network errors with jittered backoff (default: 5)
+    --image-workers N    Threads decoding/writing images (default: 4; 0 = inline)
+    --dedupe-images      Write identical images once and link all occurrences to it
+    --metrics FILE       Append per-stage timings as JSON lines to FILE, '-' for stderr (env: PDF2MD_METRICS)
+    --jsonl              Also write <output>.jsonl with one structured record per page
+    --enqueue            Add the given PDFs to the job queue instead of converting them
+    --worker             Convert queued jobs in a long-lived process (-j threads)
+    --queue-status       Show job counts and the most recent jobs
+    --queue PATH         SQLite job queue (env: PDF2MD_QUEUE, default: ~/.cache/pdf2md/queue.sqlite3)
+    --poll-interval S    Worker: seconds between checks of an empty queue (default: 2)
+    --exit-when-empty    Worker: exit once the queue is drained
+    --watch              Watch the given directories and convert new or modified PDFs
+    --settle S           Watch: convert once size and mtime are unchanged for S seconds (default: 2)
+    --watch-state PATH   Watch: record of converted PDFs (env: PDF2MD_WATCH_STATE)
+    --no-inotify         Watch: poll every --poll-interval seconds even on Linux
 
 Environment Setup:
     This script requires a Mistral API key set in the environment:
@@ -65,12 +106,134 @@ Output:
     - Console preview showing first 500 characters
     - Processing summary with file locations
 
+Batch Mode:
+    Batch mode is used when more than one PDF is given, when an input is a
+    directory or glob pattern, or when --manifest is set:
+    - Directories are scanned recursively for *.pdf files
+    - Manifest lines starting with '#' and blank lines are ignored
+    - An explicit file (argument or manifest line) that is missing or not a PDF
+      aborts the batch before anything is uploaded; only directories and globs
+      may match nothing
+    - Up to --jobs documents are uploaded and OCR'd concurrently
+    - Each document succeeds or fails on its own; a summary table is printed
+    - Exit code is 1 if any document failed
+
+Worker Mode:
+    Starting a process per PDF pays for imports, client construction and TLS
+    handshakes every time. --worker instead keeps one Mistral client (and its
+    connection pool), the OCR cache, upload registry and request scheduler warm and
+    converts jobs from a local SQLite queue with -j threads:
+    - --enqueue adds PDFs (same inputs and -o/--output-dir rules as batch mode;
+      --include-images is stored per job); pending duplicates are skipped
+    - Each job moves queued -> running -> done/failed with pages, time and error
+      recorded; --queue-status shows the counts and the latest jobs
+    - Several worker processes can drain one queue; a restarted worker requeues
+      jobs left running by a dead worker on its host
+    - SIGINT/SIGTERM stop claiming jobs and let running ones finish
+
+Watch Mode:
+    --watch DIR... replaces cron jobs that rescan directories and start the CLI per
+    file. Changes are picked up with inotify on Linux (subdirectories included) and
+    by polling (size, mtime) every --poll-interval seconds elsewhere:
+    - A PDF is converted once it has been unchanged for --settle seconds, so files
+      still being written or copied are not picked up half-finished
+    - Existing PDFs are checked at startup; the watch state records each PDF's size,
+      mtime, SHA-256 and output, so unchanged files, touched files and identical
+      re-copies are skipped while their output exists
+    - Conversions share one warm client and run up to -j at a time; outputs go next
+      to each PDF or are mirrored under --output-dir
+
+OCR Cache:
+    With --cache-dir (or PDF2MD_CACHE_DIR), OCR pages are stored as JSON under a
+    key derived from the SHA-256 of the PDF bytes, the OCR model and the image
+    option. Re-running on unchanged PDFs skips both upload and OCR. Entries older
+    than --cache-max-age are dropped and the least recently used entries are
+    evicted once the cache exceeds --cache-max-size. With --chunk-pages, each
+    shard's pages are appended to the entry as they arrive, so caching does not
+    keep a large document's pages (and images) in memory.
+
+Retries and Rate Limiting:
+    Every Mistral call goes through a shared scheduler: a token bucket enforces
+    --rate-limit, concurrency adapts to throttling (halved on each 429, slowly
+    regrown on success), and 429/5xx/network errors are retried up to
+    --max-retries times with exponential backoff and full jitter (Retry-After
+    is honored). Other errors fail the document immediately.
+
+Upload Registry:
+    With --upload-registry PATH (or PDF2MD_UPLOAD_REGISTRY), the Mistral file id
+    of every upload is recorded under the PDF's SHA-256. Converting the same bytes
+    again (e.g. with different image options) only requests a fresh signed URL;
+    if the file was deleted on Mistral's side it is uploaded again transparently.
+
+Sharded OCR:
+    With --chunk-pages N, documents with more than N pages are split locally
+    (PyPDF2) into N-page PDFs that are uploaded and OCR'd concurrently. Pages are
+    stitched back in order with their original page indices; image ids from later
+    shards are prefixed (e.g. p500-img-0.jpeg) so they stay unique. Latency then
+    scales with the shard size instead of the document size.
+
+Checkpoints:
+    While a document is converted, finished pages (final markdown and saved
+    images) are appended to <output>.md.ckpt.jsonl. If the run dies or an OCR
+    chunk fails, rerunning the same command on the same PDF reuses those pages:
+    fully finished documents need no network calls, and with --chunk-pages only
+    unfinished shards are OCR'd again. The journal is deleted once the Markdown
+    file is written; it is discarded automatically if the PDF content changes.
+
+Output Streaming:
+    Pages are appended to <output>.md.part in page order as soon as they are
+    processed (pages from out-of-order shards wait only for their predecessors),
+    and the file is renamed to <output>.md when complete. Page markdown and base64
+    image payloads are dropped once written, so memory stays flat with page count.
+
+JSONL Output:
+    With --jsonl, <output>.jsonl is written next to the Markdown file with one JSON
+    object per page, for loading into indexing/RAG pipelines without re-parsing:
+    {"source", "index", "page", "markdown", "images": [{"id", "path",
+    "top_left_x", ...}], "dimensions": {"dpi", "height", "width"}, "stats":
+    {"chars", "words", "lines", "images"}}. "index" is 0-based, "page" 1-based,
+    and image paths are relative to the output directory. Records are streamed to
+    <output>.jsonl.part as pages finish (so with --chunk-pages they appear in
+    completion order; sort by "index" if order matters) and the file is renamed
+    once all pages are present. Pages resumed from a checkpoint are taken from the
+    journal, so a resumed run produces the same records as an uninterrupted one.
+
+Python API (async):
+    pdf2md can be imported and driven from an asyncio service without blocking
+    the event loop and without any terminal output:
+
+        import asyncio
+        from mistralai import Mistral
+        from pdf2md import ConversionOptions, convert_pdf
+
+        async def run(paths):
+            async with Mistral(api_key="...") as client:
+                options = ConversionOptions(include_images=True)
+                return await asyncio.gather(
+                    *(convert_pdf(p, client=client, options=options) for p in paths)
+                )
+
+    convert_pdf() returns a ConversionResult (ok, error, num_pages, elapsed, ...).
+
+Metrics:
+    With --metrics FILE (or PDF2MD_METRICS), one JSON object per line is appended
+    for every document: {"event": "document", "pdf", "ok", "pages", "pdf_bytes",
+    "elapsed", "bytes_per_sec", "pages_per_sec", "stages": {...}}. Stages are read,
+    page_count, cache, split, upload, signed_url, ocr, extract, image_decode,
+    image_save, write and jsonl, each with seconds, calls, bytes, pages and the derived
+    rates. Stages run by concurrent shards or image workers are summed, so they can
+    add up to more than "elapsed". Batch runs end with an {"event": "batch"} record
+    holding the totals.
+
 Image Handling:
     When --include-images is enabled:
     - Images are extracted from Mistral OCR response (base64 encoded)
     - Saved to disk as {pdf_name}_images/{image_id}.{ext}
     - Markdown image links automatically rewritten to relative paths
     - Supports: PNG, JPEG, GIF, WebP, BMP, TIFF formats
+    - Decoding and writing run on a thread pool (--image-workers)
+    - With --dedupe-images, byte-identical images (e.g. repeated logos) are
+      written once per document and all links point to that file
 
 Requirements:
     - mistralai: Mistral AI Python SDK
@@ -80,7 +243,7 @@ Requirements:
 
 Exit Codes:
     0: Success
-    1: Processing error (file not found, upload failed, OCR failed)
+    1: Processing error (file not found, upload failed, OCR failed, any batch document failed)
     2: Configuration error (invalid arguments, missing API key)
 
 Notes:
@@ -91,40 +254,178 @@ Notes:
     - API usage may incur costs based on Mistral's pricing
 """
 
+from __future__ import annotations
+
 import os
 import argparse
-import base64
+import random
+import binascii
+import contextlib
+import glob
+import hashlib
+import io
+import json
 import sys
 import re
-from typing import Optional, Tuple, List, Any  # Added Any
+import sqlite3
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, Tuple, List, Any, Callable, Deque, Dict, Set  # Added Any
 
 from dotenv import load_dotenv
-from mistralai import Mistral
-import PyPDF2
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TimeElapsedColumn,
-)
-from rich.prompt import Confirm
-from rich.syntax import Syntax
+
+# Heavy dependencies (mistralai with pydantic/httpx, PyPDF2, asyncio and most rich
+# components) are imported by the functions that use them, so --help, argument errors
+# and fully cached or resumed documents never pay for them at startup.
+if TYPE_CHECKING:
+    from mistralai import Mistral
+
+OCR_MODEL = "mistral-ocr-latest"
+DEFAULT_BATCH_JOBS = 4
+DEFAULT_CACHE_MAX_MB = 2048
+DEFAULT_CACHE_MAX_AGE_DAYS = 30
+DEFAULT_CHUNK_WORKERS = 4
+DEFAULT_IMAGE_WORKERS = 4
+DEFAULT_MAX_RETRIES = 5
+PAGE_SEPARATOR = "\n\n---\n\n"
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting a single PDF document."""
+
+    pdf_path: str
+    output_path: str
+    ok: bool = False
+    num_pages: Optional[int] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    cached: bool = False
+    resumed_pages: int = 0
+    pdf_bytes: int = 0
+    stages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class ConversionOptions:
+    """Per-document processing options shared by single-file and batch runs."""
+
+    include_images: bool = False
+    chunk_pages: int = 0
+    chunk_workers: int = DEFAULT_CHUNK_WORKERS
+    cache: Optional["OCRCache"] = None
+    checkpoint: bool = True
+    image_workers: int = DEFAULT_IMAGE_WORKERS
+    dedupe_images: bool = False
+    registry: Optional["UploadRegistry"] = None
+    scheduler: Optional["MistralScheduler"] = None
+    metrics: Optional["MetricsLog"] = None
+    jsonl: bool = False
+
 
 def parse_and_validate_arguments(console: Console) -> Optional[argparse.Namespace]:
-    """Parses command-line arguments and validates the PDF path."""
+    """Parses command-line arguments and validates the PDF path(s).
+
+    Sets ``args.batch`` when more than one document may be processed (several inputs,
+    a directory or glob pattern, or a manifest file).
+    """
     parser = argparse.ArgumentParser(
         description="Convert a PDF to Markdown using Mistral OCR (no local fallback)."
     )
-    parser.add_argument("pdf_path", help="Path to the PDF file to be processed.")
+    parser.add_argument(
+        "pdf_paths",
+        nargs="*",
+        metavar="pdf_path",
+        help="PDF file(s) to be processed; directories and glob patterns enable batch mode.",
+    )
     parser.add_argument("-y", "--yes", action="store_true", help="Run non-interactively (assume Yes to prompts).")
     parser.add_argument("--include-images", action="store_true", help="Include images from OCR, save to disk, and rewrite links in Markdown.")
     parser.add_argument("-o", "--output", help="Output Markdown file path (default: alongside PDF with .md).")
     parser.add_argument("--no-preview", action="store_true", help="Do not print Markdown preview after processing.")
+    parser.add_argument("--manifest", help="Text file with one PDF path, directory or glob per line (batch mode).")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_BATCH_JOBS, help=f"Concurrent upload/OCR jobs in batch mode (default: {DEFAULT_BATCH_JOBS}).")
+    parser.add_argument("--output-dir", help="Batch mode: write outputs under this directory, mirroring input layout.")
+    parser.add_argument("--cache-dir", default=os.getenv("PDF2MD_CACHE_DIR"), help="Directory for the OCR result cache (default: $PDF2MD_CACHE_DIR, disabled if unset).")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the OCR result cache.")
+    parser.add_argument("--cache-max-size", type=float, default=DEFAULT_CACHE_MAX_MB, metavar="MB", help=f"Maximum OCR cache size in MB (default: {DEFAULT_CACHE_MAX_MB}).")
+    parser.add_argument("--cache-max-age", type=float, default=DEFAULT_CACHE_MAX_AGE_DAYS, metavar="DAYS", help=f"Maximum OCR cache entry age in days (default: {DEFAULT_CACHE_MAX_AGE_DAYS}).")
+    parser.add_argument("--chunk-pages", type=int, default=0, metavar="N", help="Split documents longer than N pages into concurrently OCR'd shards (default: off).")
+    parser.add_argument("--chunk-workers", type=int, default=DEFAULT_CHUNK_WORKERS, metavar="N", help=f"Concurrent shards per document (default: {DEFAULT_CHUNK_WORKERS}).")
+    parser.add_argument("--upload-registry", default=os.getenv("PDF2MD_UPLOAD_REGISTRY"), metavar="PATH", help="JSON registry of uploaded files; identical PDFs reuse their Mistral file id (default: $PDF2MD_UPLOAD_REGISTRY).")
+    parser.add_argument("--rate-limit", type=float, metavar="RPS", help="Maximum Mistral API calls per second across all jobs (default: unlimited).")
+    parser.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES, metavar="N", help=f"Retries for rate-limited (429), 5xx and network errors (default: {DEFAULT_MAX_RETRIES}).")
+    parser.add_argument("--image-workers", type=int, default=DEFAULT_IMAGE_WORKERS, metavar="N", help=f"Threads decoding and writing images (default: {DEFAULT_IMAGE_WORKERS}; 0 = inline).")
+    parser.add_argument("--dedupe-images", action="store_true", help="Write identical images once and link every occurrence to that file.")
+    parser.add_argument("--no-checkpoint", action="store_true", help="Do not keep a resumable per-page journal next to the output.")
+    parser.add_argument("--jsonl", action="store_true", help="Also write <output>.jsonl with one record per page (markdown, index, images, dimensions, stats).")
+    parser.add_argument("--queue", default=default_queue_path(), metavar="PATH", help="SQLite job queue used by --enqueue/--worker/--queue-status (default: $PDF2MD_QUEUE or ~/.cache/pdf2md/queue.sqlite3).")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--enqueue", action="store_true", help="Add the given PDFs to the job queue instead of converting them.")
+    mode.add_argument("--worker", action="store_true", help="Run a long-lived worker converting queued jobs with a warm client (-j threads).")
+    mode.add_argument("--queue-status", action="store_true", help="Show job counts and recent jobs of the queue.")
+    mode.add_argument("--watch", action="store_true", help="Watch the given directories and convert new or modified PDFs until stopped.")
+    parser.add_argument("--poll-interval", type=float, default=2.0, metavar="SECONDS", help="Worker: seconds between checks of an empty queue; watch: polling interval without inotify (default: 2).")
+    parser.add_argument("--settle", type=float, default=2.0, metavar="SECONDS", help="Watch: convert a PDF once its size and mtime are unchanged this long (default: 2).")
+    parser.add_argument("--watch-state", default=default_watch_state_path(), metavar="PATH", help="Watch: JSON record of converted PDFs (default: $PDF2MD_WATCH_STATE or ~/.cache/pdf2md/watch-state.json).")
+    parser.add_argument("--no-inotify", action="store_true", help="Watch: poll even where inotify is available.")
+    parser.add_argument("--exit-when-empty", action="store_true", help="Worker: exit once the queue is empty instead of waiting.")
+    parser.add_argument("--metrics", default=os.getenv("PDF2MD_METRICS"), metavar="FILE", help="Append per-document stage timings as JSON lines to FILE ('-' for stderr; default: $PDF2MD_METRICS).")
     args = parser.parse_args()
 
+    if args.worker or args.queue_status:
+        if args.pdf_paths or args.manifest:
+            parser.error("--worker and --queue-status take no pdf_path or --manifest")
+    elif not args.pdf_paths and not args.manifest:
+        parser.error("at least one pdf_path or --manifest is required")
+    if args.poll_interval <= 0:
+        parser.error("--poll-interval must be positive")
+    if args.settle < 0:
+        parser.error("--settle must not be negative")
+    if args.watch:
+        if args.manifest or args.output:
+            parser.error("--watch takes directories and optionally --output-dir, not --manifest or -o")
+        for path in args.pdf_paths:
+            if not os.path.isdir(path):
+                parser.error(f"--watch needs directories; {path} is not one")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.chunk_pages < 0:
+        parser.error("--chunk-pages must not be negative")
+    if args.chunk_workers < 1:
+        parser.error("--chunk-workers must be at least 1")
+    if args.image_workers < 0:
+        parser.error("--image-workers must not be negative")
+    if args.rate_limit is not None and args.rate_limit <= 0:
+        parser.error("--rate-limit must be positive")
+    if args.max_retries < 0:
+        parser.error("--max-retries must not be negative")
+
+    if args.enqueue or args.worker or args.queue_status or args.watch:
+        # Queue modes handle many documents; their inputs are validated by the mode itself
+        args.batch = True
+        return args
+
+    args.batch = bool(
+        args.manifest
+        or len(args.pdf_paths) > 1
+        or any(os.path.isdir(p) or glob.has_magic(p) for p in args.pdf_paths)
+    )
+    if args.batch:
+        if args.output:
+            console.print("[bold red]Error:[/] -o/--output is single-file only; use --output-dir in batch mode.")
+            return None
+        if args.manifest and not os.path.isfile(args.manifest):
+            console.print(f"[bold red]Error:[/] The manifest {args.manifest} does not exist.")
+            return None
+        return args
+
+    args.pdf_path = args.pdf_paths[0]
     if not os.path.exists(args.pdf_path):
         console.print(f"[bold red]Error:[/] The file {args.pdf_path} does not exist.")
         return None
@@ -143,25 +444,54 @@ def initialize_mistral_client(console: Console) -> Optional[Mistral]:
         )
         return None
     try:
+        from mistralai import Mistral
+
         return Mistral(api_key=api_key)
     except Exception as e:
         console.print(f"[bold red]Error initializing Mistral client:[/] {e}")
         return None
 
 
+def count_pdf_pages(pdf_content: bytes) -> int:
+    """Counts pages from the page tree root's /Count, without flattening the page tree.
+
+    PyPDF2 only parses the cross-reference table, trailer and the objects on the path to
+    /Root/Pages here. Falls back to the full page list if /Count is missing or invalid,
+    including a /Count larger than the file's size in bytes (every page takes at least
+    a byte), so a malformed or hostile value cannot make callers size work by it.
+    """
+    import PyPDF2
+
+    # BytesIO over bytes shares the buffer instead of copying it
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
+    try:
+        count = int(pdf_reader.trailer["/Root"]["/Pages"]["/Count"])
+        if 0 <= count <= len(pdf_content):
+            return count
+    except Exception:
+        pass
+    return len(pdf_reader.pages)
+
+
+def read_pdf(pdf_path: str, timer: Optional["StageTimer"] = None) -> Tuple[bytes, int]:
+    """Reads PDF content once and gets the number of pages; raises on unreadable files."""
+    with _timed(timer, "read") as sample:
+        with open(pdf_path, "rb") as pdf_file_obj:
+            pdf_content = pdf_file_obj.read()
+        sample["bytes"] = len(pdf_content)
+    with _timed(timer, "page_count") as sample:
+        num_pages = count_pdf_pages(pdf_content)
+        sample["pages"] = num_pages
+    return pdf_content, num_pages
+
+
 def get_pdf_details(
-    pdf_path: str, console: Console
+    pdf_path: str, console: Console, timer: Optional["StageTimer"] = None
 ) -> Tuple[Optional[bytes], Optional[int]]:
     """Reads PDF content and gets the number of pages."""
     with console.status("[bold green]Reading PDF file...", spinner="dots"):
         try:
-            with open(pdf_path, "rb") as pdf_file_obj:
-                pdf_content = pdf_file_obj.read()
-            # Re-open for PyPDF2 as it needs a seekable stream after full read
-            with open(pdf_path, "rb") as pdf_file_for_pypdf2:
-                pdf_reader = PyPDF2.PdfReader(pdf_file_for_pypdf2)
-                num_pages = len(pdf_reader.pages)
-            return pdf_content, num_pages
+            return read_pdf(pdf_path, timer)
         except Exception as e:
             console.print(
                 f"[bold red]Error reading PDF {os.path.basename(pdf_path)}:[/] {e}"
@@ -171,6 +501,8 @@ def get_pdf_details(
 
 def display_pdf_info(pdf_filename: str, num_pages: int, console: Console):
     """Displays PDF information in a Rich panel."""
+    from rich.panel import Panel
+
     console.print(
         Panel(
             f"[bold]PDF Details[/]\nFilename: [cyan]{pdf_filename}[/]\nPages: [yellow]{num_pages}[/]",
@@ -186,6 +518,7 @@ def confirm_and_configure_processing(
     """Handles proceed/include-images decisions with support for non-interactive mode."""
     if args.yes:
         return True, bool(args.include_images)
+    from rich.prompt import Confirm
 
     proceed = Confirm.ask(
         f"Do you want to proceed with processing {num_pages} pages of '{pdf_filename}'? (Y/n)",
@@ -210,22 +543,459 @@ def confirm_and_configure_processing(
     return True, bool(include_mistral_images)
 
 
+# --- Stage Metrics ---
+PIPELINE_STAGES = (
+    "read", "page_count", "cache", "split", "upload", "signed_url", "ocr",
+    "extract", "image_decode", "image_save", "write", "jsonl",
+)
+
+
+def _add_rates(values: Dict[str, Any], seconds: float, nbytes: int, pages: int):
+    """Adds bytes_per_sec / pages_per_sec to values when there is something to divide."""
+    if seconds > 0 and nbytes:
+        values["bytes_per_sec"] = round(nbytes / seconds, 1)
+    if seconds > 0 and pages:
+        values["pages_per_sec"] = round(pages / seconds, 3)
+
+
+class StageTimer:
+    """Accumulates wall time, call counts and byte/page volumes per pipeline stage.
+
+    Thread-safe: the shards and image workers of a document report into one timer, so
+    a stage's seconds are summed over concurrent calls and may exceed the document's
+    elapsed time. Failed calls are timed too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def add(self, name: str, seconds: float, nbytes: int = 0, pages: int = 0, calls: int = 1):
+        with self._lock:
+            stage = self._stages.setdefault(
+                name, {"seconds": 0.0, "calls": 0, "bytes": 0, "pages": 0}
+            )
+            stage["seconds"] += seconds
+            stage["calls"] += calls
+            stage["bytes"] += nbytes
+            stage["pages"] += pages
+
+    @contextlib.contextmanager
+    def stage(self, name: str, nbytes: int = 0, pages: int = 0):
+        """Times the with-block; "bytes"/"pages" of the yielded dict may be set inside it."""
+        sample = {"bytes": nbytes, "pages": pages}
+        started = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            self.add(name, time.perf_counter() - started, sample["bytes"], sample["pages"])
+
+    def merge(self, stages: Optional[Dict[str, Dict[str, Any]]]):
+        """Adds another timer's snapshot (e.g. per-document stages into a batch total)."""
+        for name, values in (stages or {}).items():
+            self.add(name, values["seconds"], values["bytes"], values["pages"], values["calls"])
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage totals with throughput, in pipeline order."""
+        with self._lock:
+            stages = {name: dict(values) for name, values in self._stages.items()}
+        order = {name: i for i, name in enumerate(PIPELINE_STAGES)}
+        snapshot = {}
+        for name in sorted(stages, key=lambda n: order.get(n, len(order))):
+            values = stages[name]
+            values["seconds"] = round(values["seconds"], 6)
+            _add_rates(values, values["seconds"], values["bytes"], values["pages"])
+            snapshot[name] = values
+        return snapshot
+
+
+def _timed(timer: Optional[StageTimer], name: str, nbytes: int = 0, pages: int = 0):
+    """timer.stage(...) when a timer is given, otherwise a no-op context."""
+    if timer is None:
+        return contextlib.nullcontext({"bytes": nbytes, "pages": pages})
+    return timer.stage(name, nbytes, pages)
+
+
+class MetricsLog:
+    """Appends one JSON object per line to a metrics file ("-" writes to stderr).
+
+    Each record is a single short append, so several processes (e.g. a fleet of batch
+    runs) can share one file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path if path == "-" else os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        if self.path != "-":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            open(self.path, "a", encoding="utf-8").close()
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            if self.path == "-":
+                sys.stderr.write(line)
+                sys.stderr.flush()
+                return
+            with open(self.path, "a", encoding="utf-8") as fd:
+                fd.write(line)
+
+
+def document_metrics_record(result: ConversionResult) -> Dict[str, Any]:
+    """Builds the "document" metrics record for one conversion."""
+    record: Dict[str, Any] = {
+        "event": "document",
+        "timestamp": round(time.time(), 3),
+        "pdf": result.pdf_path,
+        "output": result.output_path,
+        "ok": result.ok,
+        "error": result.error,
+        "pages": result.num_pages,
+        "pdf_bytes": result.pdf_bytes,
+        "cached": result.cached,
+        "resumed_pages": result.resumed_pages,
+        "elapsed": round(result.elapsed, 6),
+    }
+    _add_rates(record, result.elapsed, result.pdf_bytes, result.num_pages or 0)
+    record["stages"] = result.stages
+    return record
+
+
+def _record_metrics(options: ConversionOptions, result: ConversionResult):
+    """Writes the document's metrics record if a metrics log is configured."""
+    if options.metrics is None:
+        return
+    try:
+        options.metrics.write(document_metrics_record(result))
+    except OSError:
+        pass  # Metrics are best effort; they never fail a conversion
+
+
+def build_metrics_log(args: argparse.Namespace, console: Console) -> Optional[MetricsLog]:
+    """Creates the metrics log from CLI options, or None when not configured."""
+    if not args.metrics:
+        return None
+    try:
+        return MetricsLog(args.metrics)
+    except OSError as e:
+        console.print(f"[bold yellow]Warning:[/] Metrics disabled ({e}).")
+        return None
+
+
+# --- Request Scheduling ---
+RETRYABLE_STATUS_CODES = {408, 425, 429}
+
+
+def _classify_error(error: Exception) -> Tuple[bool, bool]:
+    """Returns (retryable, throttled) for an exception raised by a Mistral call.
+
+    HTTP errors expose ``status_code`` (SDK errors); transport failures are recognized by
+    class name (httpx.TransportError subclasses, the SDK's NoResponseError) so httpx does
+    not have to be imported here.
+    """
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES or status >= 500, status == 429
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True, False
+    names = {cls.__name__ for cls in type(error).__mro__}
+    return bool(names & {"TransportError", "NoResponseError"}), False
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Delay requested by a Retry-After header, given as seconds or as an HTTP date."""
+    headers = getattr(error, "headers", None)
+    try:
+        value = headers.get("retry-after") if headers is not None else None
+    except (TypeError, ValueError):
+        return None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    from datetime import timezone
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class MistralScheduler:
+    """Rate limiting, adaptive concurrency and retries around Mistral API calls.
+
+    - Token bucket: at most ``rate`` calls per second on average (bursts up to ``burst``).
+    - Adaptive concurrency (AIMD): up to ``max_concurrency`` calls in flight; the limit is
+      halved on every 429 and grows back by about one slot per window of successes.
+    - Retries: 429, 408/425, 5xx and transport errors are retried up to
+      ``max_retries`` times with exponential backoff and full jitter, honoring
+      Retry-After when the server sends it. Other errors are raised immediately.
+
+    One scheduler is shared by all threads (and event loops) of a run, so batch jobs and
+    shards jointly stay under the quota.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: int = 8,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, int(self._limit))
+
+    def _reserve_token(self) -> float:
+        """Takes one token, returning how long to wait before it is actually available."""
+        if not self.rate:
+            return 0.0
+        with self._cond:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _try_enter(self) -> bool:
+        with self._cond:
+            if self._in_flight < self.concurrency_limit:
+                self._in_flight += 1
+                self.calls += 1
+                return True
+            return False
+
+    def _leave(self, succeeded: bool, throttled: bool = False):
+        """Frees a slot: a 429 halves the limit, a success grows it, other errors leave it."""
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self._limit = max(1.0, self._limit / 2)
+            elif succeeded:
+                self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def _backoff(self, error: Exception, attempt: int) -> Optional[float]:
+        """Delay before the next attempt, or None if the error must be raised."""
+        retryable, _ = _classify_error(error)
+        if not retryable or attempt >= self.max_retries:
+            return None
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Runs func(*args, **kwargs) under the rate/concurrency limits, retrying as needed."""
+        attempt = 0
+        while True:
+            wait = self._reserve_token()
+            if wait:
+                time.sleep(wait)
+            with self._cond:
+                while self._in_flight >= self.concurrency_limit:
+                    self._cond.wait()
+                self._in_flight += 1
+                self.calls += 1
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._leave(succeeded=False, throttled=_classify_error(e)[1])
+                delay = self._backoff(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                with self._cond:
+                    self.retries += 1
+                time.sleep(delay)
+                continue
+            self._leave(succeeded=True)
+            return result
+
+    async def call_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Async counterpart of call() for coroutine functions; never blocks the loop."""
+        import asyncio
+
+        attempt = 0
+        while True:
+            wait = self._reserve_token()
+            if wait:
+                await asyncio.sleep(wait)
+            while not self._try_enter():
+                await asyncio.sleep(0.05)
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self._leave(succeeded=False, throttled=_classify_error(e)[1])
+                delay = self._backoff(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                with self._cond:
+                    self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            self._leave(succeeded=True)
+            return result
+
+
+def _scheduled(scheduler: Optional[MistralScheduler], func: Callable[..., Any], **kwargs) -> Any:
+    """Calls func(**kwargs) through the scheduler when one is configured."""
+    return scheduler.call(func, **kwargs) if scheduler else func(**kwargs)
+
+
+async def _scheduled_async(
+    scheduler: Optional[MistralScheduler], func: Callable[..., Any], **kwargs
+) -> Any:
+    return await (scheduler.call_async(func, **kwargs) if scheduler else func(**kwargs))
+
+
+def build_scheduler(args: argparse.Namespace, max_concurrency: int) -> MistralScheduler:
+    """Creates the shared request scheduler from CLI options."""
+    return MistralScheduler(
+        rate=args.rate_limit,
+        max_concurrency=max_concurrency,
+        max_retries=args.max_retries,
+    )
+
+
+# --- Upload Registry ---
+class UploadRegistry:
+    """Local JSON registry mapping PDF content hashes to uploaded Mistral file ids.
+
+    Lets later conversions of the same bytes request a fresh signed URL for the existing
+    file instead of uploading it again. Every change re-reads the file and merges before
+    an atomic rewrite, so several processes can share one registry without losing
+    entries wholesale.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _update(self, digest: str, entry: Optional[Dict[str, Any]]):
+        with self._lock:
+            entries = self._read()
+            if entry is None:
+                entries.pop(digest, None)
+            else:
+                entries[digest] = entry
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fd:
+                json.dump(entries, fd, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._entries = entries
+
+    def lookup(self, digest: str) -> Optional[str]:
+        """Returns the Mistral file id previously uploaded for this content hash."""
+        entry = self._entries.get(digest)
+        return entry.get("file_id") if entry else None
+
+    def record(self, digest: str, file_id: str, file_name: str, size: int):
+        self._update(
+            digest,
+            {"file_id": file_id, "file_name": file_name, "size": size, "uploaded_at": time.time()},
+        )
+
+    def forget(self, digest: str):
+        """Drops an entry whose file no longer exists on Mistral."""
+        self._update(digest, None)
+
+
+def build_upload_registry(args: argparse.Namespace, console: Console) -> Optional[UploadRegistry]:
+    """Creates the upload registry from CLI options, or None when not configured."""
+    if not args.upload_registry:
+        return None
+    try:
+        return UploadRegistry(args.upload_registry)
+    except OSError as e:
+        console.print(f"[bold yellow]Warning:[/] Upload registry disabled ({e}).")
+        return None
+
+
 def upload_pdf_to_mistral(
-    client: Mistral, pdf_path: str, pdf_content: bytes, console: Console
+    client: Mistral,
+    pdf_path: str,
+    pdf_content: bytes,
+    console: Console,
+    registry: Optional[UploadRegistry] = None,
+    pdf_digest: Optional[str] = None,
+    scheduler: Optional[MistralScheduler] = None,
+    timer: Optional[StageTimer] = None,
 ) -> Optional[str]:
-    """Uploads the PDF file to Mistral and returns the signed URL."""
+    """Uploads the PDF file to Mistral and returns the signed URL.
+
+    With a registry, content uploaded before (same SHA-256) only gets a fresh signed URL
+    for its existing file id; if that file is gone, the PDF is uploaded again. With a
+    scheduler, each API call is rate limited and retried on transient failures. With a
+    timer, the upload and signed-URL calls are recorded as separate stages.
+    """
     with console.status("[bold blue]Uploading PDF to Mistral...", spinner="dots"):
         try:
-            uploaded_file = client.files.upload(
-                file={
-                    "file_name": os.path.basename(pdf_path),
-                    "content": pdf_content,
-                },
-                purpose="ocr",
-            )
-            signed_url_response = client.files.get_signed_url(
-                file_id=uploaded_file.id, expiry=1
-            )  # expiry in minutes
+            if registry is not None:
+                pdf_digest = pdf_digest or hashlib.sha256(pdf_content).hexdigest()
+                known_file_id = registry.lookup(pdf_digest)
+                if known_file_id:
+                    try:
+                        with _timed(timer, "signed_url"):
+                            return _scheduled(
+                                scheduler, client.files.get_signed_url, file_id=known_file_id, expiry=1
+                            ).url
+                    except Exception:
+                        registry.forget(pdf_digest)
+            with _timed(timer, "upload", nbytes=len(pdf_content)):
+                uploaded_file = _scheduled(
+                    scheduler,
+                    client.files.upload,
+                    file={
+                        "file_name": os.path.basename(pdf_path),
+                        "content": pdf_content,
+                    },
+                    purpose="ocr",
+                )
+            if registry is not None:
+                registry.record(
+                    pdf_digest, uploaded_file.id, os.path.basename(pdf_path), len(pdf_content)
+                )
+            with _timed(timer, "signed_url"):
+                signed_url_response = _scheduled(
+                    scheduler, client.files.get_signed_url, file_id=uploaded_file.id, expiry=1
+                )  # expiry in minutes
             return signed_url_response.url
         except Exception as e:
             console.print(f"[bold red]Error uploading PDF to Mistral:[/] {e}")
@@ -233,22 +1003,178 @@ def upload_pdf_to_mistral(
 
 
 def process_ocr_with_mistral(
-    client: Mistral, document_url: str, include_image_base64: bool, console: Console
+    client: Mistral,
+    document_url: str,
+    include_image_base64: bool,
+    console: Console,
+    scheduler: Optional[MistralScheduler] = None,
+    timer: Optional[StageTimer] = None,
 ) -> Optional[Any]:  # Using Any for Mistral's response type
-    """Processes the document URL with Mistral OCR."""
+    """Processes the document URL with Mistral OCR (through the scheduler, if given)."""
     with console.status("[bold blue]Processing OCR with Mistral...", spinner="dots"):
         try:
-            response = client.ocr.process(
-                model="mistral-ocr-latest",
-                document={"type": "document_url", "document_url": document_url},
-                include_image_base64=include_image_base64,
-            )
+            with _timed(timer, "ocr") as sample:
+                response = _scheduled(
+                    scheduler,
+                    client.ocr.process,
+                    model=OCR_MODEL,
+                    document={"type": "document_url", "document_url": document_url},
+                    include_image_base64=include_image_base64,
+                )
+                sample["pages"] = len(getattr(response, "pages", None) or [])
             return response
         except Exception as e:
             console.print(f"[bold red]Error during Mistral OCR processing:[/] {e}")
             return None
 
 
+def _buffered_console() -> Console:
+    """Console writing to memory, for work running off the main thread.
+
+    Rich allows one live display (status/progress) per console, so concurrent workers each
+    get their own and the captured text can be surfaced as error detail afterwards.
+    """
+    return Console(file=io.StringIO(), width=200, color_system=None)
+
+
+# --- Sharded OCR ---
+def split_pdf_into_chunks(pdf_content: bytes, chunk_pages: int) -> List[Tuple[int, bytes]]:
+    """Splits a PDF into standalone PDFs of at most chunk_pages pages.
+
+    Returns (first_page_index, chunk_pdf_bytes) tuples in page order.
+    """
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
+    total = len(reader.pages)
+    chunks: List[Tuple[int, bytes]] = []
+    for start in range(0, total, chunk_pages):
+        writer = PyPDF2.PdfWriter()
+        for page_index in range(start, min(start + chunk_pages, total)):
+            writer.add_page(reader.pages[page_index])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        chunks.append((start, buffer.getvalue()))
+    return chunks
+
+
+def _rebase_chunk_pages(pages: List[Any], start: int) -> List[Any]:
+    """Shifts shard-local page indices to document indices and makes image ids unique.
+
+    Every shard numbers its images from scratch, so ids of shards after the first are
+    prefixed with the shard's first page and the markdown link targets are updated.
+    """
+    for page in pages:
+        page.index = page.index + start
+        if start and getattr(page, "images", None):
+            new_ids = {image.id: f"p{start}-{image.id}" for image in page.images}
+            page.markdown = rewrite_image_links(page.markdown or "", new_ids)
+            for image in page.images:
+                image.id = new_ids[image.id]
+    return pages
+
+
+def _ocr_pdf_chunk(
+    client: Mistral,
+    chunk_name: str,
+    chunk_content: bytes,
+    include_image_base64: bool,
+    registry: Optional[UploadRegistry] = None,
+    scheduler: Optional[MistralScheduler] = None,
+    timer: Optional[StageTimer] = None,
+) -> Tuple[Optional[Any], str]:
+    """Uploads and OCRs one shard; returns (response or None, captured console output)."""
+    chunk_console = _buffered_console()
+    response = None
+    signed_url_str = upload_pdf_to_mistral(
+        client, chunk_name, chunk_content, chunk_console,
+        registry=registry, scheduler=scheduler, timer=timer,
+    )
+    if signed_url_str:
+        response = process_ocr_with_mistral(
+            client, signed_url_str, include_image_base64, chunk_console,
+            scheduler=scheduler, timer=timer,
+        )
+    return response, chunk_console.file.getvalue().strip()
+
+
+def process_ocr_in_chunks(
+    client: Mistral,
+    pdf_path: str,
+    pdf_content: bytes,
+    include_image_base64: bool,
+    chunk_pages: int,
+    max_workers: int,
+    console: Console,
+    skip_chunk: Optional[Callable[[int, int], bool]] = None,
+    on_chunk: Optional[Callable[[int, List[Any]], None]] = None,
+    keep_pages: bool = True,
+    registry: Optional[UploadRegistry] = None,
+    scheduler: Optional[MistralScheduler] = None,
+    timer: Optional[StageTimer] = None,
+) -> Optional[Any]:
+    """OCRs a large PDF as concurrent page-range shards and stitches the pages in order.
+
+    skip_chunk(start, end) lets callers skip shards whose pages are already done, and
+    on_chunk(start, pages) is called on the calling thread as each shard completes, so
+    finished work can be persisted before later shards fail. Returns a response-like
+    object with the ``pages`` of the shards OCR'd here (document-wide indices), or None
+    if splitting or any shard fails. With keep_pages=False, shards are dropped after
+    on_chunk and the returned ``pages`` list is empty.
+    """
+    try:
+        with _timed(timer, "split", nbytes=len(pdf_content)):
+            chunks = split_pdf_into_chunks(pdf_content, chunk_pages)
+    except Exception as e:
+        console.print(f"[bold red]Error splitting PDF into chunks:[/] {e}")
+        return None
+
+    stem = os.path.splitext(os.path.basename(pdf_path))[0]
+    chunk_pages_by_start = {}
+    with console.status(
+        f"[bold blue]Processing OCR with Mistral (0/{len(chunks)} chunks)...", spinner="dots"
+    ) as status:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for start, chunk_content in chunks:
+                if skip_chunk and skip_chunk(start, start + chunk_pages):
+                    continue
+                chunk_name = f"{stem}.p{start + 1:05d}.pdf"
+                futures[executor.submit(
+                    _ocr_pdf_chunk, client, chunk_name, chunk_content, include_image_base64,
+                    registry, scheduler, timer,
+                )] = start
+            del chunks
+
+            for future in as_completed(futures):
+                start = futures[future]
+                response, log = future.result()
+                if not response or not hasattr(response, "pages"):
+                    for pending in futures:
+                        pending.cancel()
+                    console.print(
+                        f"[bold red]OCR chunk starting at page {start + 1} failed.[/] {log}"
+                    )
+                    return None
+                shard_pages = _rebase_chunk_pages(list(response.pages), start)
+                del response
+                if on_chunk:
+                    on_chunk(start, shard_pages)
+                chunk_pages_by_start[start] = shard_pages if keep_pages else []
+                del shard_pages
+                status.update(
+                    f"[bold blue]Processing OCR with Mistral "
+                    f"({len(chunk_pages_by_start)}/{len(futures)} chunks)..."
+                )
+
+    pages = [
+        page
+        for start in sorted(chunk_pages_by_start)
+        for page in chunk_pages_by_start[start]
+    ]
+    return SimpleNamespace(pages=pages)
+
+
 def _sanitize_filename(name: str) -> str:
     sanitized = re.sub(r"[^A-Za-z0-9._-]", "_", name)
     return sanitized[:255] if len(sanitized) > 255 else sanitized
@@ -257,7 +1183,9 @@ def _sanitize_filename(name: str) -> str:
 def _ext_from_b64_header(b64_data: str) -> str:
     try:
         if b64_data.startswith("data:"):
-            header = b64_data.split(",", 1)[0]
+            # Only look at the short data-URL header, never copy the payload
+            comma_index = b64_data.find(",", 0, 256)
+            header = b64_data[:comma_index] if comma_index != -1 else b64_data[:256]
             # e.g., data:image/png;base64
             if ";" in header:
                 mime = header.split(":", 1)[1].split(";", 1)[0]
@@ -277,43 +1205,300 @@ def _ext_from_b64_header(b64_data: str) -> str:
         return ".png"
 
 
+def _decode_base64_image(b64_data: str) -> Tuple[bytes, str]:
+    """Decodes a (data-URL or bare) base64 image; returns (image bytes, file extension).
+
+    Encoding the payload to ASCII still copies it once; decoding through a memoryview
+    slice of those bytes saves the intermediate copy made by slicing the string before
+    b64decode re-encodes it.
+    """
+    ext = _ext_from_b64_header(b64_data)
+    comma_index = b64_data.find(",", 0, 256) if b64_data.startswith("data:") else -1
+    raw = b64_data.encode("ascii")
+    return binascii.a2b_base64(memoryview(raw)[comma_index + 1 :]), ext
+
+
+def _write_image_file(images_dir: str, image_id: str, ext: str, image_bytes: bytes) -> str:
+    os.makedirs(images_dir, exist_ok=True)
+    img_path = os.path.join(images_dir, _sanitize_filename(image_id) + ext)
+    with open(img_path, "wb") as f:
+        f.write(image_bytes)
+    return img_path
+
+
 def _save_image_from_base64_data(images_dir: str, image_id: str, b64_data: str, console: Console) -> Optional[str]:
     """Decodes base64 image data and saves it to images_dir. Returns saved file path or None."""
     try:
-        os.makedirs(images_dir, exist_ok=True)
-        ext = _ext_from_b64_header(b64_data)
-        comma_index = b64_data.find(",")
-        b64_string = b64_data[comma_index + 1 :] if comma_index != -1 else b64_data
-        image_bytes = base64.b64decode(b64_string)
-        safe_id = _sanitize_filename(image_id)
-        img_path = os.path.join(images_dir, safe_id + ext)
-        with open(img_path, "wb") as f:
-            f.write(image_bytes)
-        return img_path
+        image_bytes, ext = _decode_base64_image(b64_data)
+        return _write_image_file(images_dir, image_id, ext, image_bytes)
     except Exception as img_e:
         console.print(f"[bold red]Error processing and saving image {image_id}:[/] {img_e}")
         return None
 
 
+class ImageWriter:
+    """Decodes and writes OCR images on a thread pool, optionally de-duplicating them.
+
+    File writes release the GIL, so a few threads overlap image I/O with OCR and markdown
+    work. base64 decoding (binascii) holds the GIL: it moves off the calling thread but
+    does not run in parallel. With dedupe, images with identical bytes in the same
+    images_dir are written once and every later copy resolves to the first file.
+    max_workers=0 runs everything inline on the calling thread. With a timer, decoding
+    and writing are recorded as the image_decode and image_save stages.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        max_workers: int = DEFAULT_IMAGE_WORKERS,
+        dedupe: bool = False,
+        timer: Optional[StageTimer] = None,
+    ):
+        self.console = console
+        self.max_workers = max_workers
+        self.dedupe = dedupe
+        self.timer = timer
+        self._executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+        self._lock = threading.Lock()
+        self._by_digest: Dict[Tuple[str, str], Tuple[threading.Event, List[Optional[str]]]] = {}
+
+    def _write(self, images_dir: str, image_id: str, ext: str, image_bytes: bytes) -> Optional[str]:
+        try:
+            with _timed(self.timer, "image_save", nbytes=len(image_bytes)):
+                return _write_image_file(images_dir, image_id, ext, image_bytes)
+        except Exception as img_e:
+            self.console.print(f"[bold red]Error processing and saving image {image_id}:[/] {img_e}")
+            return None
+
+    def _save(self, images_dir: str, image_id: str, b64_data: str) -> Optional[str]:
+        try:
+            with _timed(self.timer, "image_decode") as sample:
+                image_bytes, ext = _decode_base64_image(b64_data)
+                sample["bytes"] = len(image_bytes)
+        except Exception as img_e:
+            self.console.print(f"[bold red]Error processing and saving image {image_id}:[/] {img_e}")
+            return None
+        if not self.dedupe:
+            return self._write(images_dir, image_id, ext, image_bytes)
+        key = (images_dir, hashlib.sha256(image_bytes).hexdigest())
+        with self._lock:
+            entry = self._by_digest.get(key)
+            owner = entry is None
+            if owner:
+                entry = (threading.Event(), [None])
+                self._by_digest[key] = entry
+        done, slot = entry
+        if not owner:
+            done.wait()
+            return slot[0]
+        try:
+            slot[0] = self._write(images_dir, image_id, ext, image_bytes)
+        finally:
+            done.set()
+        return slot[0]
+
+    def submit(self, images_dir: str, image_id: str, b64_data: str) -> "Future[Optional[str]]":
+        """Schedules one image; the future resolves to the saved path (or None on error)."""
+        if self._executor is not None:
+            return self._executor.submit(self._save, images_dir, image_id, b64_data)
+        future: "Future[Optional[str]]" = Future()
+        future.set_result(self._save(images_dir, image_id, b64_data))
+        return future
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+# A target never spans whitespace or brackets, so a stray "](" in OCR text cannot swallow
+# the text (and real image links) up to the next ")"
+_LINK_TARGET_RE = re.compile(r"\]\(([^()\[\]\s]*)\)")
+
+
+def rewrite_image_links(markdown: str, link_targets: Dict[str, str]) -> str:
+    """Rewrites every ](ID) link target found in link_targets, in a single scan.
+
+    One pass over the markdown with a dict lookup per link replaces compiling and
+    running a substitution per image (O(images x page length)). Only link targets are
+    touched; alt text and other occurrences of an ID stay as they are. IDs are the
+    OCR image ids (img-N.jpeg), which contain no whitespace or brackets.
+    """
+    if not link_targets:
+        return markdown
+
+    def replace(match: "re.Match[str]") -> str:
+        target = link_targets.get(match.group(1))
+        return f"]({target})" if target is not None else match.group(0)
+
+    return _LINK_TARGET_RE.sub(replace, markdown)
+
+
+def _submit_page_images(
+    page: Any,
+    include_image_base64: bool,
+    images_dir: Optional[str],
+    output_dir: Optional[str],
+    image_writer: ImageWriter,
+    on_image: Optional[Callable[[Any], None]] = None,
+) -> List[Tuple[str, "Future[Optional[str]]"]]:
+    """Queues a page's images for saving; returns (image id, future path) pairs."""
+    pending = []
+    if include_image_base64 and getattr(page, "images", None):
+        for image in page.images:
+            if on_image:
+                on_image(image)
+            if images_dir and output_dir:
+                pending.append(
+                    (image.id, image_writer.submit(images_dir, image.id, image.image_base64))
+                )
+    return pending
+
+
+def _finish_page(
+    page: Any, pending: List[Tuple[str, "Future[Optional[str]]"]], output_dir: Optional[str]
+) -> Tuple[str, List[str], Dict[str, str]]:
+    """Waits for a page's images and rewrites their links to the saved files.
+
+    Returns (markdown, saved image paths, image id -> relative link target).
+    """
+    saved_paths: List[str] = []
+    link_targets: Dict[str, str] = {}
+    for image_id, future in pending:
+        saved = future.result()
+        if saved:
+            saved_paths.append(saved)
+            link_targets[image_id] = os.path.relpath(saved, start=output_dir)
+    return rewrite_image_links(page.markdown or "", link_targets), saved_paths, link_targets
+
+
+IMAGE_BBOX_FIELDS = ("top_left_x", "top_left_y", "bottom_right_x", "bottom_right_y")
+
+
+def build_page_record(page: Any, markdown: str, link_targets: Dict[str, str]) -> Dict[str, Any]:
+    """Structured record of a finished page for the JSONL output.
+
+    Keeps what the joined Markdown loses: the page index, every image id with its
+    saved path (relative to the output, None if not saved) and bounding box, the page
+    dimensions reported by OCR, and simple text statistics.
+    """
+    images = []
+    for image in getattr(page, "images", None) or []:
+        entry: Dict[str, Any] = {"id": image.id, "path": link_targets.get(image.id)}
+        for key in IMAGE_BBOX_FIELDS:
+            value = getattr(image, key, None)
+            if value is not None:
+                entry[key] = value
+        images.append(entry)
+    return {
+        "index": page.index,
+        "page": page.index + 1,
+        "markdown": markdown,
+        "images": images,
+        "dimensions": _to_plain(getattr(page, "dimensions", None)),
+        "stats": {
+            "chars": len(markdown),
+            "words": len(markdown.split()),
+            "lines": markdown.count("\n") + 1 if markdown else 0,
+            "images": len(images),
+        },
+    }
+
+
+def process_ocr_page(
+    page: Any,
+    include_image_base64: bool,
+    console: Console,
+    images_dir: Optional[str],
+    output_dir: Optional[str],
+    on_image: Optional[Callable[[Any], None]] = None,
+    image_writer: Optional[ImageWriter] = None,
+) -> Tuple[str, List[str]]:
+    """Saves one page's images (if requested) and rewrites their links.
+
+    Returns (page markdown, saved image paths). on_image is called before each image is
+    saved, which lets callers drive progress displays. Without an image_writer the
+    images are saved inline.
+    """
+    writer = image_writer or ImageWriter(console, max_workers=0)
+    pending = _submit_page_images(
+        page, include_image_base64, images_dir, output_dir, writer, on_image
+    )
+    page_md, saved_paths, _ = _finish_page(page, pending, output_dir)
+    return page_md, saved_paths
+
+
+def _release_page_payloads(page: Any):
+    """Drops a processed page's markdown and base64 image data (the bulk of its memory)."""
+    page.markdown = None
+    for image in getattr(page, "images", None) or []:
+        image.image_base64 = None
+
+
 def extract_pages_content_and_save_images_mistral(
     ocr_response: Any,
     include_image_base64: bool,
     console: Console,
     images_dir: Optional[str],
     output_dir: Optional[str],
+    skip_indices: Optional[Set[int]] = None,
+    on_page: Optional[Callable[[int, str, List[str]], None]] = None,
+    release_pages: bool = False,
+    image_writer: Optional[ImageWriter] = None,
+    total_pages: Optional[int] = None,
+    show_progress: bool = True,
+    on_page_record: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> List[str]:
     """Extracts markdown from Mistral OCR pages and saves images if requested, with progress.
 
     When include_image_base64 is True, images are saved under images_dir and markdown links
-    referencing image IDs are rewritten to relative file paths.
+    referencing image IDs are rewritten to relative file paths. Pages whose index is in
+    skip_indices are ignored. With on_page, each finished page is handed to
+    on_page(index, markdown, image_paths) instead of being collected (an empty list is
+    returned); release_pages additionally drops each page's markdown and base64 image
+    payloads once handled so memory does not grow with the document.
+
+    Images are decoded and written by image_writer's thread pool (a private one if not
+    given) while later pages are queued, within a window of a few pages so that pages
+    still finish strictly in order. total_pages is only used for progress text and
+    defaults to the number of pages in ocr_response; show_progress=False skips the
+    progress display entirely (e.g. for the async API). on_page_record, if given, gets
+    each page's build_page_record() dict just before on_page is called for that page.
     """
     all_markdown_parts: List[str] = []
-    total_tasks = len(ocr_response.pages)
+    pages = [
+        page for page in ocr_response.pages
+        if not skip_indices or page.index not in skip_indices
+    ]
+    total_pages = total_pages or len(ocr_response.pages)
+    total_tasks = len(pages)
     if include_image_base64:
-        for page in ocr_response.pages:
+        for page in pages:
             total_tasks += len(getattr(page, "images", []) or [])
 
-    with Progress(
+    owns_writer = image_writer is None
+    if owns_writer:
+        image_writer = ImageWriter(
+            console, max_workers=DEFAULT_IMAGE_WORKERS if include_image_base64 else 0
+        )
+    window_size = max(1, 2 * image_writer.max_workers)
+    window: Deque[Tuple[Any, List[Tuple[str, "Future[Optional[str]]"]]]] = deque()
+
+    def finish_oldest():
+        page, pending = window.popleft()
+        page_md, saved_paths, link_targets = _finish_page(page, pending, output_dir)
+        if on_page_record:
+            on_page_record(build_page_record(page, page_md, link_targets))
+        if release_pages:
+            _release_page_payloads(page)
+        if on_page:
+            on_page(page.index, page_md, saved_paths)
+        else:
+            all_markdown_parts.append(page_md)
+
+    if show_progress:
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    progress_display = Progress(
         SpinnerColumn(),
         TextColumn("[bold blue]{task.description}"),
         BarColumn(),
@@ -321,38 +1506,533 @@ def extract_pages_content_and_save_images_mistral(
         TimeElapsedColumn(),
         console=console,
         transient=True,
-    ) as progress:
-        task_id = progress.add_task(
-            "[bold green]Processing Mistral OCR content...", total=total_tasks
+    ) if show_progress else contextlib.nullcontext()
+
+    try:
+        with progress_display as progress:
+            task_id = progress.add_task(
+                "[bold green]Processing Mistral OCR content...", total=total_tasks
+            ) if progress else None
+
+            def advance(description: str):
+                if progress:
+                    progress.update(task_id, advance=1, description=description)
+
+            for page in pages:
+                advance(f"[bold green]Processing page {page.index + 1}/{total_pages} (Mistral)...")
+
+                def on_image(image: Any, page_number: int = page.index + 1):
+                    advance(f"[bold cyan]Saving image {image.id} (page {page_number})...")
+
+                window.append((page, _submit_page_images(
+                    page, include_image_base64, images_dir, output_dir, image_writer, on_image
+                )))
+                if len(window) >= window_size:
+                    finish_oldest()
+            while window:
+                finish_oldest()
+    finally:
+        if owns_writer:
+            image_writer.close()
+    return all_markdown_parts
+
+
+# --- OCR Result Cache ---
+def _to_plain(obj: Any) -> Any:
+    """Converts SDK models / namespaces into JSON-serializable builtins."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, dict):
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(v) for v in obj]
+    if isinstance(obj, SimpleNamespace):
+        return {k: _to_plain(v) for k, v in vars(obj).items()}
+    return obj
+
+
+def _to_namespace(obj: Any) -> Any:
+    """Inverse of _to_plain: dicts become attribute-accessible namespaces like SDK models."""
+    if isinstance(obj, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return [_to_namespace(v) for v in obj]
+    return obj
+
+
+_CREATED_RE = re.compile(rb'\{"created": ([0-9.eE+-]+)')
+
+
+class OCRCache:
+    """Content-addressed on-disk cache of OCR responses.
+
+    Entries live at <cache_dir>/<key[:2]>/<key>.json and hold the serialized OCR pages.
+    An entry's mtime is refreshed on every hit so size-based eviction drops the least
+    recently used entries first; age-based eviction uses the creation time stored in
+    the entry itself (its first field, so a scan reads only the head of each file).
+    Writes keep a running size total and only scan the directory once it exceeds
+    max_bytes (then evicting down to 90% of it) or the oldest known entry expires.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, max_age_seconds: float):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._evict_lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # approximate size on disk, set by the first scan
+        self._next_expiry = 0.0  # no entry known to the last scan expires before this time
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(pdf_digest: str, model: str, include_image_base64: bool) -> str:
+        """Cache key: SHA-256 over the PDF's SHA-256 hex digest, OCR model and image option."""
+        material = f"{pdf_digest}\0{model}\0{int(bool(include_image_base64))}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached OCR response (pages as namespaces) or None on miss/expiry."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fd:
+                entry = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created", 0) > self.max_age_seconds:
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return SimpleNamespace(pages=_to_namespace(entry.get("pages", [])))
+
+    def put(self, key: str, ocr_response: Any, model: str, include_image_base64: bool):
+        """Stores the OCR pages atomically, then enforces age and size limits."""
+        entry = self.open_entry(key, model, include_image_base64)
+        try:
+            entry.add_pages(ocr_response.pages)
+            entry.commit()
+        finally:
+            entry.abort()
+
+    def open_entry(self, key: str, model: str, include_image_base64: bool) -> "OCRCacheEntry":
+        """Starts an entry whose pages are added as they arrive (e.g. per shard)."""
+        return OCRCacheEntry(self, key, model, include_image_base64)
+
+    def _stored(self, size: int):
+        """Accounts for a newly published entry and evicts when a limit is reached."""
+        with self._evict_lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            if (
+                self._total_bytes is None
+                or self._total_bytes > self.max_bytes
+                or time.time() >= self._next_expiry
+            ):
+                self._evict()
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _created_time(path: str, fallback: float) -> float:
+        """Creation time from the head of an entry ({"created": ..., ...}), else fallback."""
+        try:
+            with open(path, "rb") as fd:
+                head = fd.read(64)
+        except OSError:
+            return fallback
+        match = _CREATED_RE.match(head)
+        return float(match.group(1)) if match else fallback
+
+    def evict(self):
+        """Drops entries older than max_age, then least recently used ones above max_bytes."""
+        with self._evict_lock:
+            self._evict()
+
+    def _evict(self):
+        now = time.time()
+        entries = []
+        oldest = now
+        for root, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith(".json"):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                created = self._created_time(path, st.st_mtime)
+                if now - created > self.max_age_seconds:
+                    self._remove(path)
+                    continue
+                oldest = min(oldest, created)
+                entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+        self._total_bytes = total
+        # Entries written after this scan are newer than `oldest`, so none expire sooner
+        self._next_expiry = oldest + self.max_age_seconds
+
+
+class OCRCacheEntry:
+    """A cache entry being written: pages are serialized to a temporary file as they are
+    added, so callers can release them, and commit() publishes the entry atomically.
+    abort() discards an uncommitted entry and is a no-op after commit().
+    """
+
+    def __init__(self, cache: OCRCache, key: str, model: str, include_image_base64: bool):
+        self._cache = cache
+        self._path = cache._entry_path(key)
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._tmp_path = f"{self._path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self._fd = open(self._tmp_path, "w", encoding="utf-8")
+        header = {
+            "created": time.time(),
+            "model": model,
+            "include_image_base64": bool(include_image_base64),
+        }
+        # Same layout as one json.dump of the whole entry, with "created" first
+        self._fd.write(json.dumps(header)[:-1] + ', "pages": [')
+        self._first = True
+
+    def add_pages(self, pages: List[Any]):
+        for page in pages:
+            if not self._first:
+                self._fd.write(", ")
+            json.dump(_to_plain(page), self._fd)
+            self._first = False
+
+    def commit(self):
+        self._fd.write("]}")
+        self._fd.close()
+        size = os.path.getsize(self._tmp_path)
+        os.replace(self._tmp_path, self._path)
+        self._fd = None
+        self._cache._stored(size)
+
+    def abort(self):
+        if self._fd is None:
+            return
+        self._fd.close()
+        self._fd = None
+        OCRCache._remove(self._tmp_path)
+
+
+def build_ocr_cache(args: argparse.Namespace, console: Console) -> Optional[OCRCache]:
+    """Creates the OCR cache from CLI options, or None when caching is disabled."""
+    if args.no_cache or not args.cache_dir:
+        return None
+    try:
+        return OCRCache(
+            args.cache_dir,
+            max_bytes=int(args.cache_max_size * 1024 * 1024),
+            max_age_seconds=args.cache_max_age * 86400,
         )
+    except OSError as e:
+        console.print(f"[bold yellow]Warning:[/] OCR cache disabled ({e}).")
+        return None
+
+
+# --- Checkpoint Journal ---
+def checkpoint_path_for_output(output_md_filename: str) -> str:
+    """Journal location: next to the output file, e.g. paper.md.ckpt.jsonl."""
+    return output_md_filename + ".ckpt.jsonl"
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of finished pages for resumable conversions.
+
+    The first line is a header identifying the source PDF (content hash) and options;
+    each following line records one finished page (final markdown and saved images).
+    Reopening a journal with a matching header resumes from the recorded pages, while a
+    mismatching or unreadable one is discarded. A torn last line from a crash is ignored.
+    Only each page's file offset is kept in memory; markdown is read back on demand.
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any]):
+        self.path = path
+        self.header = {"type": "header", **header}
+        self._offsets: Dict[int, int] = {}
+        self._load()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fd = open(path, "ab" if self._offsets else "wb")
+        self._reader = None
+        if not self._offsets:
+            self._append(self.header)
+
+    def _load(self):
+        try:
+            fd = open(self.path, "rb")
+        except OSError:
+            return
+        with fd:
+            try:
+                if json.loads(fd.readline()) != self.header:
+                    return
+            except ValueError:
+                return
+            good_end = fd.tell()
+            while True:
+                offset = fd.tell()
+                line = fd.readline()
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("type") == "page":
+                    self._offsets[record["index"]] = offset
+                good_end = fd.tell()
+        if self._offsets:
+            # Drop a torn trailing record so appends start on a fresh line
+            os.truncate(self.path, good_end)
+
+    def _append(self, record: Dict[str, Any]) -> int:
+        offset = self._fd.tell()
+        self._fd.write((json.dumps(record) + "\n").encode("utf-8"))
+        self._fd.flush()
+        return offset
+
+    @property
+    def done_pages(self) -> Set[int]:
+        """Indices of pages already recorded."""
+        return set(self._offsets)
+
+    def _read_record(self, index: int) -> Optional[Dict[str, Any]]:
+        offset = self._offsets.get(index)
+        if offset is None:
+            return None
+        if self._reader is None:
+            self._reader = open(self.path, "rb")
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline())
+
+    def load_markdown(self, index: int) -> Optional[str]:
+        """Reads a recorded page's markdown back from disk (None if not recorded)."""
+        record = self._read_record(index)
+        return record["markdown"] if record else None
+
+    def load_page_record(self, index: int) -> Optional[Dict[str, Any]]:
+        """Reads a recorded page's JSONL record back from disk (None if not recorded)."""
+        record = self._read_record(index)
+        return record.get("record") if record else None
+
+    def record_page(
+        self,
+        index: int,
+        markdown: str,
+        image_paths: List[str],
+        page_record: Optional[Dict[str, Any]] = None,
+    ):
+        """Persists a finished page; called after its images are on disk."""
+        record = {"type": "page", "index": index, "markdown": markdown, "images": image_paths}
+        if page_record is not None:
+            record["record"] = page_record
+        self._offsets[index] = self._append(record)
+
+    def close(self):
+        for fd in (self._fd, self._reader):
+            if fd is not None and not fd.closed:
+                fd.close()
+
+    def discard(self):
+        """Closes and deletes the journal (after the output has been written)."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+# --- Streaming Markdown Output ---
+class MarkdownStreamWriter:
+    """Writes page markdown to disk in page order as soon as each page is ready.
 
-        for page in ocr_response.pages:
-            progress.update(
-                task_id,
-                advance=1,
-                description=f"[bold green]Processing page {page.index + 1}/{len(ocr_response.pages)} (Mistral)...",
+    Pages may arrive out of order (e.g. from shards); only those waiting for an earlier
+    page are buffered. Pages finished in a previous run are pulled through load_done
+    when their turn comes. Output goes to <output>.part and is renamed into place by
+    close(), so an interrupted run never leaves a truncated file behind. With a timer,
+    close() records the time spent writing (and renaming) as the write stage.
+    """
+
+    def __init__(
+        self,
+        output_filename: str,
+        load_done: Optional[Callable[[int], Optional[str]]] = None,
+        separator: str = PAGE_SEPARATOR,
+        timer: Optional[StageTimer] = None,
+    ):
+        self.output_filename = output_filename
+        self.part_filename = output_filename + ".part"
+        self.load_done = load_done
+        self.separator = separator
+        self.timer = timer
+        self.write_seconds = 0.0
+        self.pages_written = 0
+        self._next_index = 0
+        self._pending: Dict[int, str] = {}
+        self._fd = open(self.part_filename, "w", encoding="utf-8")
+
+    def _write(self, markdown: str):
+        started = time.perf_counter()
+        if self.pages_written:
+            self._fd.write(self.separator)
+        self._fd.write(markdown)
+        self.pages_written += 1
+        self.write_seconds += time.perf_counter() - started
+
+    def _take(self, index: int) -> Optional[str]:
+        if index in self._pending:
+            return self._pending.pop(index)
+        return self.load_done(index) if self.load_done else None
+
+    def _drain(self):
+        while (markdown := self._take(self._next_index)) is not None:
+            self._write(markdown)
+            self._next_index += 1
+
+    def add_page(self, index: int, markdown: str):
+        """Queues a finished page and writes every page that is now in order."""
+        self._pending[index] = markdown
+        self._drain()
+
+    def close(self, total_pages: int):
+        """Writes the remaining pages (buffered stragglers, plus pages below total_pages
+        from load_done) and renames. Pass a total bounded by the pages actually produced."""
+        self._drain()
+        indices = set(self._pending)
+        if self.load_done:
+            indices.update(range(self._next_index, total_pages))
+        for index in sorted(indices):
+            markdown = self._take(index)
+            if markdown is not None:
+                self._write(markdown)
+        started = time.perf_counter()
+        self._fd.close()
+        os.replace(self.part_filename, self.output_filename)
+        self.write_seconds += time.perf_counter() - started
+        if self.timer is not None:
+            self.timer.add(
+                "write",
+                self.write_seconds,
+                nbytes=os.path.getsize(self.output_filename),
+                pages=self.pages_written,
             )
 
-            page_md = page.markdown or ""
-            if include_image_base64 and getattr(page, "images", None):
-                for image in page.images:
-                    progress.update(
-                        task_id,
-                        advance=1,
-                        description=f"[bold cyan]Saving image {image.id} (page {page.index + 1})...",
-                    )
-                    if images_dir and output_dir:
-                        saved = _save_image_from_base64_data(
-                            images_dir, image.id, image.image_base64, console
-                        )
-                        if saved:
-                            rel_path = os.path.relpath(saved, start=output_dir)
-                            # Replace only in link targets: ](ID)
-                            page_md = re.sub(
-                                rf"\]\({re.escape(image.id)}\)", f"]({rel_path})", page_md
-                            )
-            all_markdown_parts.append(page_md)
-    return all_markdown_parts
+    def abort(self):
+        """Closes and removes the partial output."""
+        if not self._fd.closed:
+            self._fd.close()
+        try:
+            os.remove(self.part_filename)
+        except OSError:
+            pass
+
+
+def jsonl_path_for_output(output_md_filename: str) -> str:
+    """Per-page JSONL location: the output path with .jsonl instead of .md."""
+    return os.path.splitext(output_md_filename)[0] + ".jsonl"
+
+
+class PageJsonlWriter:
+    """Streams one JSON record per page (see build_page_record) to a JSONL file.
+
+    Records are appended as pages finish, in completion order, each tagged with the
+    source PDF; consumers sort by "index" if they need page order. Pages finished in a
+    previous run are pulled through load_done when the file is closed. Like
+    MarkdownStreamWriter, output goes to <path>.part and is renamed by close().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        source: str,
+        load_done: Optional[Callable[[int], Optional[Dict[str, Any]]]] = None,
+        timer: Optional[StageTimer] = None,
+    ):
+        self.path = path
+        self.part_path = path + ".part"
+        self.source = source
+        self.load_done = load_done
+        self.timer = timer
+        self.write_seconds = 0.0
+        self._written: Set[int] = set()
+        self._fd = open(self.part_path, "w", encoding="utf-8")
+
+    def add_page(self, record: Dict[str, Any]):
+        started = time.perf_counter()
+        self._fd.write(json.dumps({"source": self.source, **record}, ensure_ascii=False) + "\n")
+        self._fd.flush()
+        self._written.add(record["index"])
+        self.write_seconds += time.perf_counter() - started
+
+    def close(self, total_pages: int):
+        """Adds recorded pages from earlier runs, then renames the file into place."""
+        if self.load_done:
+            for index in range(total_pages):
+                if index not in self._written:
+                    record = self.load_done(index)
+                    if record is not None:
+                        self.add_page(record)
+        started = time.perf_counter()
+        self._fd.close()
+        os.replace(self.part_path, self.path)
+        self.write_seconds += time.perf_counter() - started
+        if self.timer is not None:
+            self.timer.add(
+                "jsonl", self.write_seconds,
+                nbytes=os.path.getsize(self.path), pages=len(self._written),
+            )
+
+    def abort(self):
+        """Closes and removes the partial output."""
+        if not self._fd.closed:
+            self._fd.close()
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+
+
+def build_conversion_options(
+    args: argparse.Namespace, console: Console, include_images: bool
+) -> ConversionOptions:
+    """Builds per-document options (and shared resources like the cache) from CLI args."""
+    return ConversionOptions(
+        include_images=include_images,
+        chunk_pages=args.chunk_pages,
+        chunk_workers=args.chunk_workers,
+        cache=build_ocr_cache(args, console),
+        checkpoint=not args.no_checkpoint,
+        image_workers=args.image_workers,
+        dedupe_images=args.dedupe_images,
+        registry=build_upload_registry(args, console),
+        metrics=build_metrics_log(args, console),
+        jsonl=args.jsonl,
+        # Ceiling for adaptive concurrency: every document job and shard in flight at once
+        scheduler=build_scheduler(
+            args,
+            max_concurrency=(args.jobs if args.batch else 1)
+            * (args.chunk_workers if args.chunk_pages else 1),
+        ),
+    )
 
 
 # --- Common Utility Functions ---
@@ -363,16 +2043,31 @@ def generate_output_filename(pdf_path: str) -> str:
     return os.path.join(pdf_dir, base_name_without_ext + ".md")
 
 
+def images_dir_for_output(output_md_filename: str, pdf_path: str) -> str:
+    """Returns the images directory used for a given output file: <output_dir>/<pdf_stem>_images."""
+    pdf_stem = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(os.path.dirname(output_md_filename), f"{pdf_stem}_images")
+
+
 def save_markdown_to_file(final_markdown: str, output_filename: str):
     """Saves the final markdown content to a file."""
     with open(output_filename, "w", encoding="utf-8") as fd:
         fd.write(final_markdown)
 
 
+def read_markdown_preview(output_filename: str, limit: int = 500) -> str:
+    """Reads just enough of a saved markdown file to build the preview (limit + 1 chars)."""
+    with open(output_filename, "r", encoding="utf-8") as fd:
+        return fd.read(limit + 1)
+
+
 def display_results_summary(
     output_filename: str, final_markdown: str, console: Console, show_preview: bool = True
 ):
     """Displays a success message and a preview of the generated markdown."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     console.print(
         Panel(
             f"[bold green]Success![/] Output saved to [cyan]{output_filename}[/]",
@@ -390,6 +2085,1494 @@ def display_results_summary(
         )
 
 
+#
+# --- Per-Document Pipeline ---
+#
+def convert_pdf_document(
+    client: Mistral,
+    pdf_path: str,
+    output_md_filename: str,
+    options: ConversionOptions,
+    console: Console,
+    pdf_content: Optional[bytes] = None,
+    num_pages: Optional[int] = None,
+    timer: Optional[StageTimer] = None,
+) -> ConversionResult:
+    """Runs read -> upload -> OCR -> extract -> save for one PDF without any prompts.
+
+    Failures are reported in the returned ConversionResult instead of exiting, so the
+    same pipeline serves both the single-file CLI and batch workers. ``client`` only needs
+    the ``files.upload``, ``files.get_signed_url`` and ``ocr.process`` methods, so a local
+    fake can stand in for Mistral. With a cache, unchanged PDFs skip upload and OCR;
+    with options.chunk_pages, long documents are OCR'd as concurrent shards.
+
+    Per-stage timings end up in result.stages (pass the timer used to read pdf_content
+    to include the read); with options.metrics they are also written as a JSON line.
+    """
+    started = time.perf_counter()
+    result = ConversionResult(pdf_path=pdf_path, output_path=output_md_filename)
+    timer = timer or StageTimer()
+
+    def finish() -> ConversionResult:
+        result.elapsed = time.perf_counter() - started
+        result.stages = timer.snapshot()
+        _record_metrics(options, result)
+        return result
+
+    def fail(message: str) -> ConversionResult:
+        result.error = message
+        return finish()
+
+    if pdf_content is None or num_pages is None:
+        pdf_content, num_pages = get_pdf_details(pdf_path, console, timer)
+        if pdf_content is None or num_pages is None:
+            return fail("Failed to read PDF.")
+    result.num_pages = num_pages
+    result.pdf_bytes = len(pdf_content)
+
+    include_images = options.include_images
+    cache = options.cache
+    output_dir = os.path.dirname(output_md_filename)
+    images_dir = images_dir_for_output(output_md_filename, pdf_path) if include_images else None
+    pdf_digest = hashlib.sha256(pdf_content).hexdigest()
+
+    journal = None
+    if options.checkpoint:
+        header: Dict[str, Any] = {"pdf_sha256": pdf_digest, "include_images": include_images}
+        if options.jsonl:
+            # Resumed pages must come with their JSONL records
+            header["jsonl"] = True
+        try:
+            journal = CheckpointJournal(checkpoint_path_for_output(output_md_filename), header)
+        except OSError as e:
+            console.print(f"[bold yellow]Warning:[/] Checkpointing disabled ({e}).")
+    done_pages: Set[int] = journal.done_pages if journal else set()
+    result.resumed_pages = len(done_pages)
+
+    writer = jsonl_writer = None
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        writer = MarkdownStreamWriter(
+            output_md_filename,
+            load_done=journal.load_markdown if journal else None,
+            timer=timer,
+        )
+        if options.jsonl:
+            jsonl_writer = PageJsonlWriter(
+                jsonl_path_for_output(output_md_filename),
+                source=pdf_path,
+                load_done=journal.load_page_record if journal else None,
+                timer=timer,
+            )
+    except OSError as e:
+        if writer:
+            writer.abort()
+        if journal:
+            journal.close()
+        return fail(f"Failed to write output file '{output_md_filename}': {e}")
+
+    # on_page_record runs right before record_page for the same page
+    page_records: Dict[int, Dict[str, Any]] = {}
+
+    def record_page(index: int, markdown: str, image_paths: List[str]):
+        done_pages.add(index)
+        page_record = page_records.pop(index, None)
+        if journal:
+            journal.record_page(index, markdown, image_paths, page_record)
+        writer.add_page(index, markdown)
+        if jsonl_writer and page_record is not None:
+            jsonl_writer.add_page(page_record)
+
+    def extract(pages: List[Any], release_pages: bool = True):
+        if not pages:
+            return
+        with timer.stage("extract", pages=len(pages)):
+            extract_pages_content_and_save_images_mistral(
+                SimpleNamespace(pages=pages),
+                include_images,
+                console,
+                images_dir=images_dir,
+                output_dir=output_dir,
+                skip_indices=done_pages,
+                on_page=record_page,
+                release_pages=release_pages,
+                image_writer=image_writer,
+                total_pages=num_pages,
+                on_page_record=(
+                    (lambda record: page_records.__setitem__(record["index"], record))
+                    if jsonl_writer else None
+                ),
+            )
+
+    image_writer = ImageWriter(
+        console,
+        max_workers=options.image_workers if include_images else 0,
+        dedupe=options.dedupe_images,
+        timer=timer,
+    )
+    finished = False
+    try:
+        if len(done_pages) < num_pages:
+            cache_key = OCRCache.make_key(pdf_digest, OCR_MODEL, include_images) if cache else None
+            ocr_response = None
+            if cache:
+                with timer.stage("cache") as sample:
+                    ocr_response = cache.get(cache_key)
+                    sample["pages"] = len(ocr_response.pages) if ocr_response is not None else 0
+            if ocr_response is not None:
+                result.cached = True
+            elif options.chunk_pages and num_pages > options.chunk_pages:
+                cache_entry = None
+                # Only cache complete documents, not the remainder of a resumed one
+                if cache and not done_pages:
+                    try:
+                        cache_entry = cache.open_entry(cache_key, OCR_MODEL, include_images)
+                    except OSError as e:
+                        console.print(f"[bold yellow]Warning:[/] Could not write OCR cache entry: {e}")
+                cache = None  # Shards are cached as they arrive, not after the loop
+
+                def on_chunk(start: int, pages: List[Any]):
+                    nonlocal cache_entry
+                    if cache_entry:
+                        # Serialized before extraction releases the image payloads
+                        try:
+                            with timer.stage("cache"):
+                                cache_entry.add_pages(pages)
+                        except Exception as e:
+                            console.print(f"[bold yellow]Warning:[/] Could not write OCR cache entry: {e}")
+                            cache_entry.abort()
+                            cache_entry = None
+                    extract(pages)
+
+                try:
+                    ocr_response = process_ocr_in_chunks(
+                        client,
+                        pdf_path,
+                        pdf_content,
+                        include_images,
+                        options.chunk_pages,
+                        options.chunk_workers,
+                        console,
+                        registry=options.registry,
+                        scheduler=options.scheduler,
+                        timer=timer,
+                        skip_chunk=lambda start, end: all(
+                            i in done_pages for i in range(start, min(end, num_pages))
+                        ),
+                        on_chunk=on_chunk,
+                        keep_pages=False,
+                    )
+                    if ocr_response and cache_entry:
+                        try:
+                            with timer.stage("cache"):
+                                cache_entry.commit()
+                        except Exception as e:
+                            console.print(f"[bold yellow]Warning:[/] Could not write OCR cache entry: {e}")
+                finally:
+                    if cache_entry:
+                        cache_entry.abort()
+                del pdf_content
+                if not ocr_response:
+                    return fail("Mistral OCR processing failed for one or more chunks.")
+            else:
+                signed_url_str = upload_pdf_to_mistral(
+                    client, pdf_path, pdf_content, console,
+                    registry=options.registry, pdf_digest=pdf_digest,
+                    scheduler=options.scheduler, timer=timer,
+                )
+                if not signed_url_str:
+                    return fail("Failed to upload PDF to Mistral.")
+                del pdf_content
+
+                ocr_response = process_ocr_with_mistral(
+                    client, signed_url_str, include_images, console,
+                    scheduler=options.scheduler, timer=timer,
+                )
+                if not ocr_response or not hasattr(ocr_response, "pages"):
+                    return fail("Mistral OCR processing failed or returned no pages.")
+            if cache and not result.cached:
+                try:
+                    with timer.stage("cache"):
+                        cache.put(cache_key, ocr_response, OCR_MODEL, include_images)
+                except Exception as e:
+                    console.print(f"[bold yellow]Warning:[/] Could not write OCR cache entry: {e}")
+
+            pages = ocr_response.pages
+            del ocr_response
+            extract(pages)
+            del pages
+
+        # Only pages produced here or in an earlier run can be written; num_pages comes
+        # from the PDF's /Count and is not trusted to size the final scan
+        known_pages = min(num_pages, max(done_pages, default=-1) + 1)
+        try:
+            writer.close(known_pages)
+            if jsonl_writer:
+                jsonl_writer.close(known_pages)
+        except Exception as e:
+            return fail(f"Failed to write output file '{output_md_filename}': {e}")
+        finished = True
+    finally:
+        image_writer.close()
+        if not finished:
+            writer.abort()
+            if jsonl_writer:
+                jsonl_writer.abort()
+        if journal:
+            journal.close()
+
+    if journal:
+        journal.discard()
+    result.ok = True
+    return finish()
+
+
+#
+# --- Batch Mode ---
+#
+def collect_pdf_paths(
+    inputs: List[str], manifest_path: Optional[str] = None
+) -> Tuple[List[str], List[str]]:
+    """Expands files, directories (recursive) and glob patterns into a de-duplicated PDF list.
+
+    Manifest entries are treated like command-line inputs; blank lines and lines starting
+    with '#' are skipped. Input order is preserved. Returns (pdf_paths, unmatched), where
+    unmatched lists the explicit file entries that do not exist or are not PDFs;
+    directories and glob patterns that contain no PDFs are not reported.
+    """
+    entries = list(inputs)
+    if manifest_path:
+        with open(manifest_path, "r", encoding="utf-8") as fd:
+            for line in fd:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    entries.append(line)
+
+    found: List[str] = []
+    unmatched: List[str] = []
+    for entry in entries:
+        entry = os.path.expanduser(entry)
+        if os.path.isdir(entry):
+            for root, dirs, filenames in os.walk(entry):
+                dirs.sort()
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(".pdf"):
+                        found.append(os.path.join(root, filename))
+        elif glob.has_magic(entry):
+            found.extend(
+                p for p in sorted(glob.glob(entry, recursive=True))
+                if os.path.isfile(p) and p.lower().endswith(".pdf")
+            )
+        elif os.path.isfile(entry) and entry.lower().endswith(".pdf"):
+            found.append(entry)
+        else:
+            unmatched.append(entry)
+
+    seen = set()
+    unique: List[str] = []
+    for path in found:
+        key = os.path.realpath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(os.path.abspath(path))
+    return unique, unmatched
+
+
+def report_unmatched_inputs(unmatched: List[str], console: Console) -> None:
+    """Prints one error line per explicit input that is missing or not a PDF."""
+    for entry in unmatched:
+        reason = "is not a PDF" if os.path.exists(entry) else "does not exist"
+        console.print(f"[bold red]Error:[/] The file {entry} {reason}.")
+
+
+def plan_batch_outputs(pdf_paths: List[str], output_dir: Optional[str]) -> List[Tuple[str, str]]:
+    """Pairs each PDF with its output Markdown path.
+
+    Without output_dir the Markdown goes alongside each PDF; with it, the input layout
+    (relative to the inputs' common directory) is mirrored under output_dir.
+    """
+    if not output_dir:
+        return [(p, generate_output_filename(p)) for p in pdf_paths]
+    output_root = os.path.abspath(output_dir)
+    common_root = os.path.commonpath([os.path.dirname(p) for p in pdf_paths])
+    jobs = []
+    for pdf_path in pdf_paths:
+        rel_stem = os.path.splitext(os.path.relpath(pdf_path, common_root))[0]
+        jobs.append((pdf_path, os.path.join(output_root, rel_stem + ".md")))
+    return jobs
+
+
+def _run_batch_job(
+    client: Mistral,
+    pdf_path: str,
+    output_md_filename: str,
+    options: ConversionOptions,
+    pdf_content: Optional[bytes] = None,
+    num_pages: Optional[int] = None,
+) -> ConversionResult:
+    """Batch worker: runs the pipeline with a private, buffered console.
+
+    Whatever the pipeline printed becomes the error detail when the document fails.
+    """
+    worker_console = _buffered_console()
+    try:
+        result = convert_pdf_document(
+            client, pdf_path, output_md_filename, options, worker_console,
+            pdf_content=pdf_content, num_pages=num_pages,
+        )
+    except Exception as e:
+        result = ConversionResult(pdf_path=pdf_path, output_path=output_md_filename, error=str(e))
+    if not result.ok:
+        log = worker_console.file.getvalue().strip()
+        if log:
+            result.error = f"{result.error} {log}" if result.error else log
+    return result
+
+
+def run_batch(
+    client: Mistral,
+    jobs: List[Tuple[str, str]],
+    options: ConversionOptions,
+    max_workers: int,
+    console: Console,
+) -> List[ConversionResult]:
+    """Converts (pdf_path, output_path) jobs with a bounded pool of concurrent workers.
+
+    Upload and OCR are network bound, so a thread pool keeps up to max_workers requests
+    in flight while sharing one client (and its connection pool). Results are returned
+    in job order.
+    """
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    results: List[Optional[ConversionResult]] = [None] * len(jobs)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task_id = progress.add_task("[bold green]Converting PDFs...", total=len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_run_batch_job, client, pdf_path, output_path, options): i
+                for i, (pdf_path, output_path) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                result = future.result()
+                results[i] = result
+                status = "[green]ok[/]" if result.ok else "[red]failed[/]"
+                if result.cached:
+                    status += " [dim](cached)[/]"
+                elif result.resumed_pages:
+                    status += f" [dim](resumed {result.resumed_pages} pages)[/]"
+                progress.console.print(f"{status} {os.path.basename(result.pdf_path)}")
+                progress.advance(task_id)
+    return [r for r in results if r is not None]
+
+
+def display_batch_summary(results: List[ConversionResult], elapsed: float, console: Console):
+    """Displays per-document failures and overall batch statistics."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    failed = [r for r in results if not r.ok]
+    if failed:
+        table = Table(title="Failed Documents", show_header=True, header_style="bold magenta")
+        table.add_column("PDF", style="cyan", no_wrap=False)
+        table.add_column("Error", style="red", no_wrap=False)
+        for r in failed:
+            table.add_row(r.pdf_path, r.error or "unknown error")
+        console.print(table)
+
+    succeeded = len(results) - len(failed)
+    cached = sum(1 for r in results if r.cached)
+    total_pages = sum(r.num_pages or 0 for r in results if r.ok)
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    console.print(
+        Panel(
+            f"Documents: [cyan]{len(results)}[/]  Succeeded: [green]{succeeded}[/]  "
+            f"Failed: [red]{len(failed)}[/]  From cache: [cyan]{cached}[/]\nPages converted: [yellow]{total_pages}[/]\n"
+            f"Elapsed: [yellow]{elapsed:.1f}s[/] ({rate:.2f} docs/s)",
+            border_style="red" if failed else "green",
+            title="Batch Summary",
+        )
+    )
+
+
+def write_batch_metrics(
+    metrics: MetricsLog,
+    results: List[ConversionResult],
+    elapsed: float,
+    scheduler: Optional[MistralScheduler] = None,
+):
+    """Writes the closing "batch" metrics record: totals and summed per-stage timings."""
+    totals = StageTimer()
+    for r in results:
+        totals.merge(r.stages)
+    succeeded = [r for r in results if r.ok]
+    pages = sum(r.num_pages or 0 for r in succeeded)
+    pdf_bytes = sum(r.pdf_bytes for r in succeeded)
+    record: Dict[str, Any] = {
+        "event": "batch",
+        "timestamp": round(time.time(), 3),
+        "documents": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "cached": sum(1 for r in results if r.cached),
+        "pages": pages,
+        "pdf_bytes": pdf_bytes,
+        "elapsed": round(elapsed, 6),
+    }
+    _add_rates(record, elapsed, pdf_bytes, pages)
+    if scheduler:
+        record.update(
+            api_calls=scheduler.calls, retries=scheduler.retries, throttled=scheduler.throttled
+        )
+    record["stages"] = totals.snapshot()
+    try:
+        metrics.write(record)
+    except OSError:
+        pass
+
+
+def run_batch_mode(args: argparse.Namespace, console: Console) -> int:
+    """Batch entry point: collects PDFs, confirms, converts concurrently and returns an exit code."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    try:
+        pdf_paths, unmatched = collect_pdf_paths(args.pdf_paths, args.manifest)
+    except OSError as e:
+        console.print(f"[bold red]Error reading inputs:[/] {e}")
+        return 2
+    if unmatched:
+        report_unmatched_inputs(unmatched, console)
+        return 2
+    if not pdf_paths:
+        console.print("[bold red]Error:[/] No PDF files found in the given inputs.")
+        return 2
+
+    jobs = plan_batch_outputs(pdf_paths, args.output_dir)
+    workers = min(args.jobs, len(jobs))
+    console.print(
+        Panel(
+            f"[bold]Batch Details[/]\nDocuments: [yellow]{len(jobs)}[/]\nConcurrent jobs: [yellow]{workers}[/]",
+            border_style="green",
+            title="Batch Information",
+        )
+    )
+    if not args.yes and not Confirm.ask(
+        f"Do you want to proceed with processing {len(jobs)} PDFs? (Y/n)",
+        default=True,
+        show_default=False,
+    ):
+        console.print("[yellow]Processing cancelled by user.[/]")
+        return 0
+
+    mistral_client = initialize_mistral_client(console)
+    if not mistral_client:
+        console.print("[bold red]Mistral client not available or configured.[/]")
+        return 2
+
+    started = time.perf_counter()
+    options = build_conversion_options(args, console, bool(args.include_images))
+    results = run_batch(mistral_client, jobs, options, workers, console)
+    elapsed = time.perf_counter() - started
+    display_batch_summary(results, elapsed, console)
+    if options.metrics:
+        write_batch_metrics(options.metrics, results, elapsed, options.scheduler)
+    if options.scheduler and (options.scheduler.retries or options.scheduler.throttled):
+        console.print(
+            f"[dim]API calls: {options.scheduler.calls}, retries: {options.scheduler.retries}, "
+            f"rate-limited (429): {options.scheduler.throttled}[/]"
+        )
+    return 0 if all(r.ok for r in results) else 1
+
+
+#
+# --- Worker Mode ---
+#
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+
+def default_queue_path() -> str:
+    """Queue database location: $PDF2MD_QUEUE or ~/.cache/pdf2md/queue.sqlite3."""
+    return os.getenv("PDF2MD_QUEUE") or os.path.join(
+        os.path.expanduser("~"), ".cache", "pdf2md", "queue.sqlite3"
+    )
+
+
+@dataclass
+class QueuedJob:
+    """A claimed job from the local job queue."""
+
+    id: int
+    pdf_path: str
+    output_path: str
+    include_images: bool
+    attempts: int
+
+
+class JobQueue:
+    """SQLite-backed local job queue shared by --enqueue, --worker and --queue-status.
+
+    Every operation opens its own short-lived connection, so worker threads and separate
+    processes can use one database file; claims run in an immediate transaction, so each
+    job is handed to exactly one worker. Workers record "<host>:<pid>" on the jobs they
+    run, which lets a restarted worker requeue jobs left "running" by a dead process.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    pdf_path TEXT NOT NULL,
+                    output_path TEXT NOT NULL,
+                    include_images INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    error TEXT,
+                    num_pages INTEGER,
+                    elapsed REAL,
+                    cached INTEGER NOT NULL DEFAULT 0,
+                    enqueued_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def enqueue(self, jobs: List[Tuple[str, str]], include_images: bool) -> Tuple[int, int]:
+        """Adds (pdf_path, output_path) jobs; returns (added, skipped as already pending)."""
+        added = skipped = 0
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for pdf_path, output_path in jobs:
+                pending = conn.execute(
+                    "SELECT 1 FROM jobs WHERE pdf_path = ? AND output_path = ? "
+                    "AND include_images = ? AND status IN ('queued', 'running')",
+                    (pdf_path, output_path, int(include_images)),
+                ).fetchone()
+                if pending:
+                    skipped += 1
+                    continue
+                conn.execute(
+                    "INSERT INTO jobs (pdf_path, output_path, include_images, enqueued_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (pdf_path, output_path, int(include_images), time.time()),
+                )
+                added += 1
+            conn.execute("COMMIT")
+        return added, skipped
+
+    def claim(self, worker: str) -> Optional[QueuedJob]:
+        """Marks the oldest queued job as running for this worker and returns it."""
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1, "
+                "started_at = ?, error = NULL WHERE id = ?",
+                (worker, time.time(), row["id"]),
+            )
+            conn.execute("COMMIT")
+        return QueuedJob(
+            id=row["id"],
+            pdf_path=row["pdf_path"],
+            output_path=row["output_path"],
+            include_images=bool(row["include_images"]),
+            attempts=row["attempts"] + 1,
+        )
+
+    def finish(self, job_id: int, result: ConversionResult):
+        """Records a job's outcome."""
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, num_pages = ?, elapsed = ?, cached = ?, "
+                "finished_at = ? WHERE id = ?",
+                (
+                    "done" if result.ok else "failed",
+                    result.error,
+                    result.num_pages,
+                    result.elapsed,
+                    int(result.cached),
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def requeue_stale(self, host: str) -> int:
+        """Requeues jobs left running by workers on this host whose process is gone."""
+        requeued = 0
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for row in conn.execute(
+                "SELECT id, worker FROM jobs WHERE status = 'running'"
+            ).fetchall():
+                worker_host, _, pid = (row["worker"] or "").rpartition(":")
+                if worker_host != host or not pid.isdigit() or _process_alive(int(pid)):
+                    continue
+                conn.execute(
+                    "UPDATE jobs SET status = 'queued', worker = NULL WHERE id = ?", (row["id"],)
+                )
+                requeued += 1
+            conn.execute("COMMIT")
+        return requeued
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
+
+    def recent(self, limit: int = 20) -> List[Any]:
+        """The most recently enqueued jobs, newest first."""
+        with contextlib.closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+
+def _stop_on_signals(stop: threading.Event, console: Console, message: str):
+    """Sets stop on the first SIGINT/SIGTERM; a second one aborts with KeyboardInterrupt."""
+    import signal
+
+    def request_stop(signum, frame):
+        if stop.is_set():
+            raise KeyboardInterrupt
+        console.print(f"[yellow]{message} (repeat to abort)...[/]")
+        stop.set()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, request_stop)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # Exists but belongs to someone else
+    return True
+
+
+def enqueue_jobs(args: argparse.Namespace, console: Console) -> int:
+    """--enqueue: adds the given PDFs to the job queue and returns an exit code."""
+    try:
+        pdf_paths, unmatched = collect_pdf_paths(args.pdf_paths, args.manifest)
+    except OSError as e:
+        console.print(f"[bold red]Error reading inputs:[/] {e}")
+        return 2
+    if unmatched:
+        report_unmatched_inputs(unmatched, console)
+        return 2
+    if not pdf_paths:
+        console.print("[bold red]Error:[/] No PDF files found in the given inputs.")
+        return 2
+    if args.output:
+        if len(pdf_paths) > 1:
+            console.print("[bold red]Error:[/] -o/--output needs exactly one PDF; use --output-dir.")
+            return 2
+        jobs = [(pdf_paths[0], os.path.abspath(args.output))]
+    else:
+        jobs = plan_batch_outputs(pdf_paths, args.output_dir)
+
+    try:
+        queue = JobQueue(args.queue)
+        added, skipped = queue.enqueue(jobs, bool(args.include_images))
+    except (OSError, sqlite3.Error) as e:
+        console.print(f"[bold red]Error opening job queue {args.queue}:[/] {e}")
+        return 2
+    message = f"Queued [yellow]{added}[/] PDF(s) in [cyan]{queue.path}[/]"
+    if skipped:
+        message += f" ([dim]{skipped} already pending[/])"
+    console.print(message)
+    return 0
+
+
+def show_queue_status(args: argparse.Namespace, console: Console) -> int:
+    """--queue-status: prints job counts and the most recent jobs."""
+    from rich.table import Table
+
+    try:
+        queue = JobQueue(args.queue)
+        counts = queue.counts()
+        rows = queue.recent()
+    except (OSError, sqlite3.Error) as e:
+        console.print(f"[bold red]Error opening job queue {args.queue}:[/] {e}")
+        return 2
+
+    console.print(
+        f"[bold]{queue.path}[/]  "
+        + "  ".join(f"{status}: [cyan]{counts[status]}[/]" for status in JOB_STATUSES)
+    )
+    if not rows:
+        return 0
+    table = Table(title="Recent Jobs", show_header=True, header_style="bold magenta")
+    table.add_column("ID", justify="right", style="cyan")
+    table.add_column("Status")
+    table.add_column("PDF", no_wrap=False)
+    table.add_column("Pages", justify="right", style="yellow")
+    table.add_column("Time", justify="right", style="yellow")
+    table.add_column("Worker / Error", no_wrap=False)
+    styles = {"queued": "dim", "running": "blue", "done": "green", "failed": "red"}
+    for row in rows:
+        status = row["status"]
+        table.add_row(
+            str(row["id"]),
+            f"[{styles.get(status, 'white')}]{status}[/]",
+            row["pdf_path"],
+            str(row["num_pages"]) if row["num_pages"] is not None else "",
+            f"{row['elapsed']:.1f}s" if row["elapsed"] is not None else "",
+            (row["error"] or "") if status == "failed" else (row["worker"] or ""),
+        )
+    console.print(table)
+    return 0
+
+
+# Attempts at recording a finished job once the worker is stopping
+FINISH_ATTEMPTS_WHEN_STOPPING = 3
+
+
+def _record_job_result(
+    queue: JobQueue,
+    job: QueuedJob,
+    result: ConversionResult,
+    stop: threading.Event,
+    console: Console,
+    retry_interval: float,
+) -> bool:
+    """Marks a job done/failed, retrying on queue errors such as a locked database.
+
+    Retries every retry_interval seconds until the result is stored. Once the worker is
+    stopping it gives up after a few attempts; the job then stays 'running' and is
+    requeued by the next worker started on this host.
+    """
+    attempts = 0
+    while True:
+        try:
+            queue.finish(job.id, result)
+            return True
+        except sqlite3.Error as e:
+            attempts += 1
+            if stop.is_set() and attempts >= FINISH_ATTEMPTS_WHEN_STOPPING:
+                console.print(
+                    f"[bold red]Job queue error:[/] could not record job #{job.id} ({e}); "
+                    "it will be requeued when a worker restarts on this host"
+                )
+                return False
+            console.print(
+                f"[bold red]Job queue error:[/] recording job #{job.id} failed ({e}); "
+                f"retrying in {retry_interval:g}s"
+            )
+            time.sleep(retry_interval)
+
+
+def run_worker(args: argparse.Namespace, console: Console) -> int:
+    """--worker: converts queued jobs with one warm client until stopped.
+
+    The Mistral client (and its connection pool), OCR cache, upload registry and request
+    scheduler are created once and shared by --jobs worker threads. SIGINT/SIGTERM stop
+    claiming new jobs and let running ones finish; with --exit-when-empty the worker
+    returns once the queue is drained.
+    """
+    import socket
+
+    try:
+        queue = JobQueue(args.queue)
+    except (OSError, sqlite3.Error) as e:
+        console.print(f"[bold red]Error opening job queue {args.queue}:[/] {e}")
+        return 2
+    mistral_client = initialize_mistral_client(console)
+    if not mistral_client:
+        console.print("[bold red]Mistral client not available or configured.[/]")
+        return 2
+
+    host = socket.gethostname()
+    worker_id = f"{host}:{os.getpid()}"
+    requeued = queue.requeue_stale(host)
+    if requeued:
+        console.print(f"[yellow]Requeued {requeued} job(s) left running by a stopped worker.[/]")
+    base_options = build_conversion_options(args, console, include_images=False)
+    options_by_images = {
+        flag: replace(base_options, include_images=flag) for flag in (False, True)
+    }
+
+    stop = threading.Event()
+    _stop_on_signals(stop, console, "Stopping after the running jobs finish")
+
+    def work():
+        while not stop.is_set():
+            try:
+                job = queue.claim(worker_id)
+            except sqlite3.Error as e:
+                console.print(f"[bold red]Job queue error:[/] {e}")
+                stop.wait(args.poll_interval)
+                continue
+            if job is None:
+                if args.exit_when_empty:
+                    return
+                stop.wait(args.poll_interval)
+                continue
+            result = _run_batch_job(
+                mistral_client, job.pdf_path, job.output_path, options_by_images[job.include_images]
+            )
+            if not _record_job_result(queue, job, result, stop, console, args.poll_interval):
+                continue
+            if result.ok:
+                detail = "cached" if result.cached else f"{result.num_pages} pages"
+                console.print(
+                    f"[green]done[/] #{job.id} {os.path.basename(job.pdf_path)} "
+                    f"[dim]({detail}, {result.elapsed:.1f}s)[/]"
+                )
+            else:
+                console.print(
+                    f"[red]failed[/] #{job.id} {os.path.basename(job.pdf_path)}: {result.error}"
+                )
+
+    console.print(
+        f"[bold]pdf2md worker[/] [cyan]{worker_id}[/] on [cyan]{queue.path}[/] "
+        f"with [yellow]{args.jobs}[/] thread(s)"
+    )
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(args.jobs)]
+    for thread in threads:
+        thread.start()
+    # Join with a timeout so the main thread keeps handling signals
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(0.5)
+    return 0
+
+
+#
+# --- Watch Mode ---
+#
+def default_watch_state_path() -> str:
+    """Watch state location: $PDF2MD_WATCH_STATE or ~/.cache/pdf2md/watch-state.json."""
+    return os.getenv("PDF2MD_WATCH_STATE") or os.path.join(
+        os.path.expanduser("~"), ".cache", "pdf2md", "watch-state.json"
+    )
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, or None if it is gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class _Inotify:
+    """Minimal recursive inotify wrapper (Linux, via ctypes); raises OSError if unavailable."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._paths: Dict[int, str] = {}
+
+    def add_tree(self, root: str) -> List[str]:
+        """Watches root and its subdirectories; returns the directories now watched."""
+        added = []
+        for directory, dirs, _ in os.walk(root):
+            dirs.sort()
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd >= 0:
+                self._paths[wd] = directory
+                added.append(directory)
+        return added
+
+    def read(self, timeout: float) -> Tuple[Set[str], List[str], bool]:
+        """Waits up to timeout; returns (changed paths, new directories, queue overflowed)."""
+        import select
+
+        changed: Set[str] = set()
+        new_dirs: List[str] = []
+        overflow = False
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed, new_dirs, overflow
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+                name = data[offset + self._EVENT.size:offset + self._EVENT.size + length]
+                offset += self._EVENT.size + length
+                if mask & self.IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & self.IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
+                directory = self._paths.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name.rstrip(b"\0")))
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        new_dirs.extend(self.add_tree(path))
+                else:
+                    changed.add(path)
+        return changed, new_dirs, overflow
+
+    def close(self):
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """Reports PDFs created or modified under the given directories.
+
+    Uses inotify where available (no rescans of huge trees) and falls back to polling
+    (size, mtime) snapshots every poll_interval seconds otherwise.
+    """
+
+    def __init__(self, roots: List[str], poll_interval: float, use_inotify: bool = True):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.poll_interval = poll_interval
+        self._inotify: Optional[_Inotify] = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._last_scan = 0.0
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+                for root in self.roots:
+                    self._inotify.add_tree(root)
+            except OSError:
+                self._inotify = None
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify else "polling"
+
+    @staticmethod
+    def _pdfs_under(directories: List[str]) -> Dict[str, Tuple[int, int]]:
+        found = {}
+        for directory in directories:
+            for root, dirs, filenames in os.walk(directory):
+                dirs.sort()
+                for filename in filenames:
+                    if filename.lower().endswith(".pdf"):
+                        path = os.path.join(root, filename)
+                        signature = _file_signature(path)
+                        if signature:
+                            found[path] = signature
+        return found
+
+    def scan(self) -> List[str]:
+        """All PDFs currently under the roots (startup and inotify overflow)."""
+        self._snapshot = self._pdfs_under(self.roots)
+        self._last_scan = time.monotonic()
+        return sorted(self._snapshot)
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Blocks up to timeout and returns the PDFs that changed in the meantime."""
+        if self._inotify is None:
+            time.sleep(timeout)
+            if time.monotonic() - self._last_scan < self.poll_interval:
+                return set()
+            previous = self._snapshot
+            self.scan()
+            return {path for path, sig in self._snapshot.items() if previous.get(path) != sig}
+        changed, new_dirs, overflow = self._inotify.read(timeout)
+        if overflow:
+            return set(self.scan())
+        # Files may land in a new directory before its watch exists
+        changed.update(self._pdfs_under(new_dirs))
+        return {path for path in changed if path.lower().endswith(".pdf")}
+
+    def close(self):
+        if self._inotify:
+            self._inotify.close()
+
+
+class WatchState:
+    """JSON record of converted PDFs: signature, SHA-256 and output per source path.
+
+    A PDF is skipped when its (size, mtime) is unchanged, or when its content hash still
+    matches after a touch or copy, as long as the recorded output exists. Writes are
+    atomic rewrites, like the upload registry.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+            self._entries: Dict[str, Dict[str, Any]] = data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, pdf_path: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(os.path.realpath(pdf_path))
+
+    def record(self, pdf_path: str, signature: Tuple[int, int], digest: str, output_path: str):
+        with self._lock:
+            self._entries[os.path.realpath(pdf_path)] = {
+                "size": signature[0],
+                "mtime_ns": signature[1],
+                "sha256": digest,
+                "output": output_path,
+                "converted_at": time.time(),
+            }
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fd:
+                json.dump(self._entries, fd, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+def _watch_output_path(pdf_path: str, roots: List[str], output_dir: Optional[str]) -> str:
+    """Output for a watched PDF: alongside it, or mirrored under output_dir."""
+    if not output_dir:
+        return generate_output_filename(pdf_path)
+    root = next(
+        (r for r in roots if os.path.commonpath([r, pdf_path]) == r), os.path.dirname(pdf_path)
+    )
+    rel_stem = os.path.splitext(os.path.relpath(pdf_path, root))[0]
+    return os.path.join(os.path.abspath(output_dir), rel_stem + ".md")
+
+
+def _convert_watched_pdf(
+    client: Mistral,
+    pdf_path: str,
+    output_md_filename: str,
+    options: ConversionOptions,
+    state: WatchState,
+) -> Optional[ConversionResult]:
+    """Converts a settled PDF unless the recorded output already covers its content.
+
+    Returns None when the PDF was skipped.
+    """
+    signature = _file_signature(pdf_path)
+    entry = state.get(pdf_path)
+    covered = entry is not None and os.path.exists(entry.get("output", ""))
+    if signature is None or (covered and [entry["size"], entry["mtime_ns"]] == list(signature)):
+        return None
+    try:
+        pdf_content, num_pages = read_pdf(pdf_path)
+    except Exception as e:
+        return ConversionResult(
+            pdf_path=pdf_path, output_path=output_md_filename, error=f"Failed to read PDF: {e}"
+        )
+    digest = hashlib.sha256(pdf_content).hexdigest()
+    if covered and entry.get("sha256") == digest:
+        state.record(pdf_path, signature, digest, entry["output"])
+        return None
+    result = _run_batch_job(
+        client, pdf_path, output_md_filename, options,
+        pdf_content=pdf_content, num_pages=num_pages,
+    )
+    if result.ok:
+        state.record(pdf_path, signature, digest, output_md_filename)
+    return result
+
+
+def run_watch_mode(args: argparse.Namespace, console: Console) -> int:
+    """--watch: converts new or modified PDFs under the given directories until stopped.
+
+    A PDF is converted once its size and mtime have not changed for --settle seconds, so
+    files still being written or copied are left alone. Up to --jobs conversions run at
+    once with a single warm client.
+    """
+    roots = [os.path.abspath(os.path.expanduser(p)) for p in args.pdf_paths]
+    mistral_client = initialize_mistral_client(console)
+    if not mistral_client:
+        console.print("[bold red]Mistral client not available or configured.[/]")
+        return 2
+    options = build_conversion_options(args, console, bool(args.include_images))
+    state = WatchState(args.watch_state)
+    watcher = DirectoryWatcher(roots, args.poll_interval, use_inotify=not args.no_inotify)
+
+    stop = threading.Event()
+    _stop_on_signals(stop, console, "Stopping after the running conversions finish")
+
+    console.print(
+        f"[bold]Watching[/] [cyan]{', '.join(roots)}[/] ({watcher.backend}, "
+        f"settle {args.settle:g}s, [yellow]{args.jobs}[/] job(s))"
+    )
+    # path -> (last seen signature, time it was last seen changing)
+    pending: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {
+        path: (None, 0.0) for path in watcher.scan()
+    }
+    in_flight: Dict[str, Future] = {}
+    tick = min(0.5, args.settle / 2) if args.settle > 0 else 0.1
+
+    def report(future: Future):
+        try:
+            result = future.result()
+        except Exception as e:
+            console.print(f"[red]failed[/] {e}")
+            return
+        if result is None:
+            return
+        name = os.path.basename(result.pdf_path)
+        if result.ok:
+            console.print(f"[green]ok[/] {name} [dim]({result.num_pages} pages, {result.elapsed:.1f}s)[/]")
+        else:
+            console.print(f"[red]failed[/] {name}: {result.error}")
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        try:
+            while not stop.is_set():
+                now = time.monotonic()
+                for path in watcher.wait(tick):
+                    pending[path] = (None, now)
+                for path, future in list(in_flight.items()):
+                    if future.done():
+                        del in_flight[path]
+                for path, (seen, since) in list(pending.items()):
+                    signature = _file_signature(path)
+                    if signature is None:
+                        del pending[path]
+                    elif signature != seen:
+                        pending[path] = (signature, now)
+                    elif now - since >= args.settle and path not in in_flight:
+                        del pending[path]
+                        future = executor.submit(
+                            _convert_watched_pdf,
+                            mistral_client,
+                            path,
+                            _watch_output_path(path, roots, args.output_dir),
+                            options,
+                            state,
+                        )
+                        future.add_done_callback(report)
+                        in_flight[path] = future
+        finally:
+            watcher.close()
+    return 0
+
+
+#
+# --- Async API ---
+#
+async def upload_pdf_to_mistral_async(
+    client: Mistral,
+    file_name: str,
+    pdf_content: bytes,
+    registry: Optional[UploadRegistry] = None,
+    scheduler: Optional[MistralScheduler] = None,
+    timer: Optional[StageTimer] = None,
+) -> str:
+    """Uploads PDF bytes with the SDK's async client and returns a signed URL; raises on error.
+
+    With a registry, previously uploaded content only gets a fresh signed URL; with a
+    scheduler, calls are rate limited and retried on transient failures.
+    """
+    import asyncio
+
+    pdf_digest = None
+    if registry is not None:
+        pdf_digest = (await asyncio.to_thread(hashlib.sha256, pdf_content)).hexdigest()
+        known_file_id = registry.lookup(pdf_digest)
+        if known_file_id:
+            try:
+                with _timed(timer, "signed_url"):
+                    signed_url_response = await _scheduled_async(
+                        scheduler, client.files.get_signed_url_async, file_id=known_file_id, expiry=1
+                    )
+                return signed_url_response.url
+            except Exception:
+                await asyncio.to_thread(registry.forget, pdf_digest)
+    with _timed(timer, "upload", nbytes=len(pdf_content)):
+        uploaded_file = await _scheduled_async(
+            scheduler,
+            client.files.upload_async,
+            file={"file_name": file_name, "content": pdf_content},
+            purpose="ocr",
+        )
+    if registry is not None:
+        await asyncio.to_thread(
+            registry.record, pdf_digest, uploaded_file.id, file_name, len(pdf_content)
+        )
+    with _timed(timer, "signed_url"):
+        signed_url_response = await _scheduled_async(
+            scheduler, client.files.get_signed_url_async, file_id=uploaded_file.id, expiry=1
+        )  # expiry in minutes
+    return signed_url_response.url
+
+
+async def process_ocr_with_mistral_async(
+    client: Mistral,
+    document_url: str,
+    include_image_base64: bool,
+    scheduler: Optional[MistralScheduler] = None,
+    timer: Optional[StageTimer] = None,
+) -> Any:
+    """Runs Mistral OCR on a document URL with the SDK's async client; raises on error."""
+    with _timed(timer, "ocr") as sample:
+        response = await _scheduled_async(
+            scheduler,
+            client.ocr.process_async,
+            model=OCR_MODEL,
+            document={"type": "document_url", "document_url": document_url},
+            include_image_base64=include_image_base64,
+        )
+        sample["pages"] = len(getattr(response, "pages", None) or [])
+    if not response or not hasattr(response, "pages"):
+        raise RuntimeError("Mistral OCR returned no pages.")
+    return response
+
+
+async def _ocr_document_async(
+    client: Mistral,
+    pdf_path: str,
+    pdf_content: bytes,
+    num_pages: int,
+    options: ConversionOptions,
+    timer: Optional[StageTimer] = None,
+) -> Any:
+    """Async OCR for one document, sharded by options.chunk_pages like the sync pipeline."""
+    import asyncio
+
+    file_name = os.path.basename(pdf_path)
+    if not (options.chunk_pages and num_pages > options.chunk_pages):
+        url = await upload_pdf_to_mistral_async(
+            client, file_name, pdf_content, options.registry, options.scheduler, timer
+        )
+        return await process_ocr_with_mistral_async(
+            client, url, options.include_images, options.scheduler, timer
+        )
+
+    def split() -> List[Tuple[int, bytes]]:
+        with _timed(timer, "split", nbytes=len(pdf_content)):
+            return split_pdf_into_chunks(pdf_content, options.chunk_pages)
+
+    chunks = await asyncio.to_thread(split)
+    stem = os.path.splitext(file_name)[0]
+    limit = asyncio.Semaphore(options.chunk_workers)
+
+    async def ocr_chunk(start: int, chunk_content: bytes) -> List[Any]:
+        async with limit:
+            url = await upload_pdf_to_mistral_async(
+                client, f"{stem}.p{start + 1:05d}.pdf", chunk_content,
+                options.registry, options.scheduler, timer,
+            )
+            response = await process_ocr_with_mistral_async(
+                client, url, options.include_images, options.scheduler, timer
+            )
+        return _rebase_chunk_pages(list(response.pages), start)
+
+    tasks = [asyncio.ensure_future(ocr_chunk(start, content)) for start, content in chunks]
+    del chunks
+    try:
+        shards = await asyncio.gather(*tasks)
+    except BaseException:
+        # The document fails with its first shard: stop the others instead of letting them
+        # spend quota, and collect their outcomes so no exception goes unretrieved
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return SimpleNamespace(pages=[page for shard in shards for page in shard])
+
+
+def _write_document_pages(
+    ocr_response: Any,
+    pdf_path: str,
+    output_md_filename: str,
+    num_pages: int,
+    options: ConversionOptions,
+    console: Console,
+    timer: Optional[StageTimer] = None,
+):
+    """Blocking tail of the async pipeline: saves images and streams markdown (and JSONL) to disk."""
+    output_dir = os.path.dirname(output_md_filename)
+    images_dir = (
+        images_dir_for_output(output_md_filename, pdf_path) if options.include_images else None
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    writer = MarkdownStreamWriter(output_md_filename, timer=timer)
+    try:
+        jsonl_writer = PageJsonlWriter(
+            jsonl_path_for_output(output_md_filename), source=pdf_path, timer=timer
+        ) if options.jsonl else None
+    except BaseException:
+        writer.abort()
+        raise
+    image_writer = ImageWriter(
+        console,
+        max_workers=options.image_workers if options.include_images else 0,
+        dedupe=options.dedupe_images,
+        timer=timer,
+    )
+    try:
+        pages = ocr_response.pages
+        del ocr_response
+        with _timed(timer, "extract", pages=len(pages)):
+            extract_pages_content_and_save_images_mistral(
+                SimpleNamespace(pages=pages),
+                options.include_images,
+                console,
+                images_dir=images_dir,
+                output_dir=output_dir,
+                on_page=lambda index, markdown, _paths: writer.add_page(index, markdown),
+                release_pages=True,
+                image_writer=image_writer,
+                show_progress=False,
+                on_page_record=jsonl_writer.add_page if jsonl_writer else None,
+            )
+        writer.close(num_pages)
+        if jsonl_writer:
+            jsonl_writer.close(num_pages)
+    except BaseException:
+        writer.abort()
+        if jsonl_writer:
+            jsonl_writer.abort()
+        raise
+    finally:
+        image_writer.close()
+
+
+async def convert_pdf(
+    pdf_path: str,
+    output_path: Optional[str] = None,
+    *,
+    client: Optional[Mistral] = None,
+    options: Optional[ConversionOptions] = None,
+) -> ConversionResult:
+    """Converts one PDF to Markdown without blocking the event loop or touching the terminal.
+
+    Network calls use the SDK's async methods (upload_async, get_signed_url_async,
+    process_async); file reads, PDF splitting, cache access and image/markdown writing run
+    in worker threads. Pass one shared ``client`` to drive many conversions concurrently
+    over a single connection pool; without one, a client is created from MISTRAL_API_KEY
+    for this call. Honors include_images, cache, registry, scheduler,
+    chunk_pages/chunk_workers, image_workers, dedupe_images, metrics and jsonl from ``options``;
+    checkpoint journaling is CLI-only. Per-stage timings are returned in
+    result.stages. Failures are reported in the returned ConversionResult, never raised.
+
+    Example:
+        results = await asyncio.gather(*(convert_pdf(p, client=client) for p in paths))
+    """
+    import asyncio
+
+    options = options or ConversionOptions()
+    output_md_filename = os.path.abspath(output_path or generate_output_filename(pdf_path))
+    started = time.perf_counter()
+    result = ConversionResult(pdf_path=pdf_path, output_path=output_md_filename)
+    console = _buffered_console()
+    timer = StageTimer()
+
+    async def finish() -> ConversionResult:
+        result.elapsed = time.perf_counter() - started
+        result.stages = timer.snapshot()
+        if options.metrics:
+            await asyncio.to_thread(_record_metrics, options, result)
+        return result
+
+    async def fail(message: str) -> ConversionResult:
+        log = console.file.getvalue().strip()
+        result.error = f"{message} {log}" if log else message
+        return await finish()
+
+    if client is None:
+        api_key = os.getenv("MISTRAL_API_KEY")
+        if not api_key:
+            return await fail("MISTRAL_API_KEY environment variable not set.")
+        from mistralai import Mistral
+
+        async with Mistral(api_key=api_key) as owned_client:
+            return await convert_pdf(pdf_path, output_path, client=owned_client, options=options)
+
+    try:
+        pdf_content, num_pages = await asyncio.to_thread(read_pdf, pdf_path, timer)
+    except Exception as e:
+        return await fail(f"Failed to read PDF: {e}")
+    result.num_pages = num_pages
+    result.pdf_bytes = len(pdf_content)
+
+    cache = options.cache
+    cache_key = None
+    ocr_response = None
+    if cache:
+        pdf_digest = (await asyncio.to_thread(hashlib.sha256, pdf_content)).hexdigest()
+        cache_key = OCRCache.make_key(pdf_digest, OCR_MODEL, options.include_images)
+        with timer.stage("cache") as sample:
+            ocr_response = await asyncio.to_thread(cache.get, cache_key)
+            sample["pages"] = len(ocr_response.pages) if ocr_response is not None else 0
+        result.cached = ocr_response is not None
+
+    if ocr_response is None:
+        try:
+            ocr_response = await _ocr_document_async(
+                client, pdf_path, pdf_content, num_pages, options, timer
+            )
+        except Exception as e:
+            return await fail(f"Mistral upload/OCR failed: {e}")
+        if cache:
+            try:
+                with timer.stage("cache"):
+                    await asyncio.to_thread(
+                        cache.put, cache_key, ocr_response, OCR_MODEL, options.include_images
+                    )
+            except Exception:
+                pass  # A failed cache write only costs a future re-run
+    del pdf_content
+
+    try:
+        await asyncio.to_thread(
+            _write_document_pages,
+            ocr_response,
+            pdf_path,
+            output_md_filename,
+            num_pages,
+            options,
+            console,
+            timer,
+        )
+    except Exception as e:
+        return await fail(f"Failed to write output file '{output_md_filename}': {e}")
+
+    result.ok = True
+    return await finish()
+
+
 #
 # --- Main Orchestration Function ---
 #
@@ -402,17 +3585,26 @@ def main():
     if not args:
         sys.exit(2)
 
+    if args.queue_status:
+        sys.exit(show_queue_status(args, console))
+    if args.enqueue:
+        sys.exit(enqueue_jobs(args, console))
+    if args.worker:
+        sys.exit(run_worker(args, console))
+    if args.watch:
+        sys.exit(run_watch_mode(args, console))
+    if args.batch:
+        sys.exit(run_batch_mode(args, console))
+
     # Determine output path early for image link rewriting
     output_md_filename = (
         os.path.abspath(args.output)
         if args.output
         else generate_output_filename(args.pdf_path)
     )
-    output_dir = os.path.dirname(output_md_filename)
-    pdf_stem = os.path.splitext(os.path.basename(args.pdf_path))[0]
-    images_dir = os.path.join(output_dir, f"{pdf_stem}_images") if args.include_images else None
 
-    pdf_content, num_pages = get_pdf_details(args.pdf_path, console)
+    timer = StageTimer()
+    pdf_content, num_pages = get_pdf_details(args.pdf_path, console, timer)
     if pdf_content is None or num_pages is None:
         sys.exit(1)
 
@@ -434,46 +3626,26 @@ def main():
 
     console.print("\n[cyan]Processing with Mistral OCR...[/]")
     try:
-        signed_url_str = upload_pdf_to_mistral(
-            mistral_client, args.pdf_path, pdf_content, console
-        )
-        if not signed_url_str:
-            console.print("[bold red]Failed to upload PDF to Mistral.[/]")
-            sys.exit(1)
-
-        ocr_response = process_ocr_with_mistral(
+        result = convert_pdf_document(
             mistral_client,
-            signed_url_str,
-            include_mistral_images_in_output,
-            console,
-        )
-        if not ocr_response or not hasattr(ocr_response, "pages"):
-            console.print(
-                "[bold red]Mistral OCR processing failed or returned no pages.[/]"
-            )
-            sys.exit(1)
-
-        all_markdown_parts = extract_pages_content_and_save_images_mistral(
-            ocr_response,
-            include_mistral_images_in_output,
+            args.pdf_path,
+            output_md_filename,
+            build_conversion_options(args, console, include_mistral_images_in_output),
             console,
-            images_dir=images_dir,
-            output_dir=output_dir,
+            pdf_content=pdf_content,
+            num_pages=num_pages,
+            timer=timer,
         )
-        final_markdown = "\n\n---\n\n".join(all_markdown_parts)
-        # Save output
-        try:
-            os.makedirs(os.path.dirname(output_md_filename), exist_ok=True)
-            save_markdown_to_file(final_markdown, output_md_filename)
-        except Exception as e:
-            console.print(
-                f"[bold red]Failed to write output file '{output_md_filename}':[/] {e}"
-            )
+        if not result.ok:
+            console.print(f"[bold red]{result.error}[/]")
             sys.exit(1)
 
         # Display summary/preview
         display_results_summary(
-            output_md_filename, final_markdown, console, show_preview=(not args.no_preview)
+            output_md_filename,
+            read_markdown_preview(output_md_filename),
+            console,
+            show_preview=(not args.no_preview),
         )
         sys.exit(0)
     except Exception as e:
@@ -21,52 +21,476 @@ Usage:
     # Save cleaned HTML (post-extraction)
     python url2md.py https://example.com/article --save-clean-html clean.html
 
+    # Bulk mode: many URLs (arguments, a file, or '-' for stdin) into a directory
+    python url2md.py -i urls.txt --output-dir docs_md/ -j 16 --per-host 4
+    python url2md.py -i urls.txt --output-dir docs_md/ -j 64 --processes
+    cat urls.txt | python url2md.py -i - --output-dir docs_md/
+
+Extraction Routing:
+    A cheap structural pass (main container: <article>, a known docs-site class
+    or <main>; its text, paragraph and link-text lengths) picks the tier most
+    likely to win: link-only pages and containers of mostly tables/code go
+    straight to the container pick, everything else starts with Trafilatura.
+    Results are accepted when they are long enough and cover at least 20% of a
+    dedicated container's text; otherwise the next tier runs.
+
+Host Profiles:
+    In bulk mode each host's winning tier and matching container selector are
+    learned. After 3 pages, a host's pages try its usual tier first, skip tiers
+    that never won there and look up its usual selector before the full list
+    (every 20th page is routed afresh). Three consecutive pages that go another
+    way drop the profile, which is then learned again. With --profiles PATH (or
+    URL2MD_PROFILES) profiles are kept in a JSON file, so later runs, including
+    single-URL ones, start out routed.
+
+Bulk Mode:
+    Bulk mode is used when more than one URL is given or --input is set, and
+    requires --output-dir. Pages are fetched by -j/--jobs threads sharing one
+    requests.Session, so connections to each host are kept alive and reused;
+    --per-host caps concurrent requests to any single host (default: 4).
+    Extraction runs on a separate pool (--extract-workers) while fetching
+    continues, and fetched pages waiting for it are capped at jobs + 2 *
+    extract-workers. Each URL is written to <output-dir>/<host>/<path>.md
+    (".../" becomes index.md, query strings get a short hash suffix). Duplicate
+    URLs are fetched once. One status line per URL goes to stderr; the exit
+    status is 1 if any URL failed.
+
+    With --processes the extraction pool is made of worker processes (one per
+    CPU by default) instead of threads, so CPU-bound parsing and markdownify
+    scale with cores rather than sharing one GIL. Workers receive only the raw
+    page bytes and declared charset, decode and extract them, write the .md file
+    and return its length, tier and selector. They import the extraction
+    libraries once at startup and stay warm for the whole run. If a worker dies
+    (killed for memory, say), the pool is unusable: the run stops fetching and
+    reports the pages in progress and all remaining URLs as failed.
+
+Download Limits:
+    Bodies are streamed in 64 KB chunks into a per-thread buffer that is reused
+    across fetches. A response whose Content-Type is not HTML (text/html,
+    XHTML, XML or plain text) is rejected before its body is read, and a
+    download stops as soon as it exceeds --max-size MB (default: 20; checked
+    against Content-Length up front and against the decompressed bytes as they
+    arrive). The finished body is copied out of the buffer, so a fetch peaks at
+    about twice the body size (at most twice the limit); buffers that grew past
+    4 MB are dropped after every fetch, including failed or aborted ones.
+
+HTTP Cache:
+    With --cache-dir (or URL2MD_CACHE_DIR), responses carrying an ETag or
+    Last-Modified header are stored on disk keyed by URL. Later fetches send
+    If-None-Match / If-Modified-Since and reuse the cached HTML on a 304, so
+    re-crawls of unchanged pages cost one small request. In bulk mode a page
+    that is unchanged and whose .md already exists is not re-extracted either.
+    The least recently used entries are evicted once the cache exceeds
+    --cache-max-size MB.
+
+Encoding Detection:
+    Response bodies are decoded with the first encoding found by: a byte order
+    mark; the charset of the Content-Type header; a <meta charset> or http-equiv
+    declaration in the first 4 KB; strict UTF-8 validation (pure ASCII passes
+    too); and only then statistical detection by charset-normalizer on a 64 KB
+    sample starting near the first non-ASCII byte. Pages that are not UTF-8 and cannot be detected are read as
+    windows-1252.
+
 Features:
     - Robust character encoding detection
-    - Multiple extraction strategies for different site types
+    - Multiple extraction strategies for different site types, routed per page
+    - Each page is parsed once with lxml and the tree is shared by all strategies
     - Preserves document structure (headers, lists, tables, links)
     - Cleans up excessive whitespace and formatting
     - Works well with documentation sites, blogs, and articles
 
 Requirements:
     - requests: HTTP client for fetching pages
-    - chardet: Character encoding detection
+    - charset-normalizer: Character encoding detection (last resort, see below)
     - beautifulsoup4: HTML parsing
     - trafilatura: Content extraction
     - readability-lxml: Article isolation
     - markdownify: HTML to Markdown conversion
+
+    Only requests is mandatory. The other libraries are imported the first time an
+    extraction tier needs them (a page Trafilatura handles never loads readability,
+    bs4 or markdownify), and a missing one just disables its tier or fallback.
 """
 import argparse
+import codecs
+import copy
+import hashlib
+import json
+import os
 import sys
 import re
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
 
-import requests
-import chardet
-from bs4 import BeautifulSoup
-import trafilatura
-from readability.readability import Document
-from markdownify import markdownify as html_to_md
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
 
 
-def fetch_html(url: str, timeout: int = 20) -> str:
-    """Download page HTML with basic robustness."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
+# --- Lazy optional dependencies ---
+# Each loader imports its library on first use and returns None if it is not installed.
+@lru_cache(maxsize=None)
+def _load_charset_normalizer():
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return None
+    return from_bytes
+
+
+@lru_cache(maxsize=None)
+def _load_beautifulsoup():
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        return None
+    return BeautifulSoup
+
+
+@lru_cache(maxsize=None)
+def _load_trafilatura():
+    try:
+        import trafilatura
+    except ImportError:
+        return None
+    return trafilatura
+
+
+@lru_cache(maxsize=None)
+def _load_readability_document():
+    try:
+        from readability.readability import Document
+    except ImportError:
+        return None
+    return Document
+
+
+@lru_cache(maxsize=None)
+def _load_lxml_html():
+    try:
+        import lxml.html
+    except ImportError:
+        return None
+    return lxml.html
+
+
+@lru_cache(maxsize=None)
+def _load_markdownify():
+    try:
+        from markdownify import markdownify
+    except ImportError:
+        return None
+    return markdownify
+
+
+def html_text(html_fragment: str, separator: str = "\n", strip: bool = False) -> str:
+    """Visible text of an HTML fragment (bs4 if available, else a tag-splitting regex)."""
+    BeautifulSoup = _load_beautifulsoup()
+    if BeautifulSoup is None:
+        parts = re.split(r"<[^>]+>", html_fragment)
+        if strip:
+            parts = [part.strip() for part in parts if part.strip()]
+        return separator.join(parts)
+    return BeautifulSoup(html_fragment, "html.parser").get_text(separator, strip=strip)
+
+
+# --- HTTP cache ---
+class HTTPCache:
+    """On-disk cache of fetched pages, revalidated with conditional requests.
+
+    Entries live at <cache_dir>/<key[:2]>/<key>.entry (key: SHA-256 of the URL): one JSON
+    header line (url, etag, last_modified, charset) followed by the raw body, so
+    revalidation reads only the header. Only responses with a validator are stored. A
+    hit refreshes the entry's mtime; once the cache exceeds max_bytes, least recently
+    used entries are evicted down to 90% of it.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None  # approximate size on disk, set by the first eviction scan
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / (key + ".entry")
+
+    def lookup(self, url: str) -> dict | None:
+        """Header of the cached entry for url (body not read), or None."""
+        try:
+            with open(self._entry_path(url), "rb") as fd:
+                meta = json.loads(fd.readline())
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get("url") == url else None
+
+    @staticmethod
+    def conditional_headers(meta: dict) -> dict:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load_body(self, url: str) -> bytes | None:
+        """Body of the cached entry for url (None if it vanished); marks it recently used."""
+        path = self._entry_path(url)
+        try:
+            with open(path, "rb") as fd:
+                fd.readline()
+                body = fd.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return body
+
+    def store(self, url: str, headers, content: bytes):
+        """Caches a 200 response if it has a validator and allows storing."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in headers.get("Cache-Control", "").lower():
+            return
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "charset": charset_from_content_type(headers.get("Content-Type")),
+            "stored": time.time(),
+        }
+        path = self._entry_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as fd:
+            fd.write(json.dumps(meta).encode("utf-8") + b"\n")
+            fd.write(content)
+        size = tmp_path.stat().st_size
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            if self._total_bytes is None or self._total_bytes > self.max_bytes:
+                self._evict()
 
-    # Robust decode if server headers are wrong
-    content = resp.content
-    encoding = resp.encoding
-    if not encoding:
-        guess = chardet.detect(content)
-        encoding = guess.get("encoding") or "utf-8"
-    return content.decode(encoding, errors="replace")
+    def _evict(self):
+        entries = []
+        for path in self.cache_dir.glob("*/*.entry"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+        self._total_bytes = total
+
+
+def make_session(pool_size: int = 10):
+    """requests.Session keeping up to pool_size alive connections per host."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# The -sig/utf-16 codecs strip the BOM while decoding
+BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+META_PRESCAN_BYTES = 4096
+DETECT_PREFIX_BYTES = 64 * 1024
+_CHARSET_RE = re.compile(rb"""charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+_META_RE = re.compile(rb"<meta\b[^>]*>", re.IGNORECASE)
+_NON_ASCII_RE = re.compile(rb"[\x80-\xff]")
+
+
+def _known_codec(name: str | bytes | None) -> str | None:
+    """Python codec name for a declared charset, or None if Python does not know it."""
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode("ascii", errors="ignore")
+    try:
+        return codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+
+
+def charset_from_content_type(content_type: str | None) -> str | None:
+    """The charset parameter of a Content-Type header value, if any."""
+    match = _CHARSET_RE.search((content_type or "").encode("latin-1", errors="ignore"))
+    return match.group(1).decode("ascii") if match else None
+
+
+def detect_encoding(content: bytes, header_charset: str | None = None) -> str:
+    """Picks the codec for a response body (see "Encoding Detection" above)."""
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding
+    encoding = _known_codec(header_charset)
+    if encoding:
+        return encoding
+    for meta in _META_RE.findall(content[:META_PRESCAN_BYTES]):
+        match = _CHARSET_RE.search(meta)
+        encoding = _known_codec(match.group(1)) if match else None
+        if encoding:
+            # A document that could be read as ASCII-compatible cannot really be UTF-16
+            return "utf-8" if encoding.startswith("utf-16") else encoding
+    try:
+        content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    from_bytes = _load_charset_normalizer()
+    # Sample from just before the first non-ASCII byte: long ASCII <head>s tell nothing
+    first = _NON_ASCII_RE.search(content)
+    start = max(0, first.start() - 1024) if first else 0
+    sample = content[start:start + DETECT_PREFIX_BYTES]
+    matches = list(from_bytes(sample)) if from_bytes else []
+    if not matches:
+        return "windows-1252"
+    # Single-byte Latin code pages often tie; like browsers, prefer windows-1252
+    tied = [match.encoding for match in matches if match.chaos <= matches[0].chaos]
+    return "cp1252" if "cp1252" in tied else _known_codec(matches[0].encoding) or "windows-1252"
+
+
+def decode_html(content: bytes, charset: str | None = None) -> str:
+    """Decodes a response body, given the charset declared by the server (if any)."""
+    return content.decode(detect_encoding(content, charset), errors="replace")
+
+
+class FetchError(Exception):
+    """A download was refused: not HTML, or larger than the size limit."""
+
+
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+# Per-thread body buffers above this size are dropped after use instead of kept
+RETAIN_BUFFER_BYTES = 4 * 1024 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "application/xml", "text/xml", "text/plain")
+_buffers = threading.local()
+
+
+def _http_get(url: str, timeout: int, session, headers: dict):
+    """Streamed GET: only headers are read until the body is consumed (close the response)."""
+    if session is None:
+        import requests
+
+        return requests.get(url, headers={**DEFAULT_HEADERS, **headers}, timeout=timeout, stream=True)
+    return session.get(url, headers=headers, timeout=timeout, stream=True)
+
+
+def _check_response(resp, max_bytes: int):
+    """Rejects non-HTML responses and declared oversize bodies before any body is read."""
+    content_type = resp.headers.get("Content-Type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and media_type not in HTML_CONTENT_TYPES:
+        raise FetchError(f"not HTML (Content-Type: {content_type})")
+    length = resp.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise FetchError(f"body of {int(length):,} bytes exceeds the {max_bytes:,}-byte limit")
+
+
+def _read_body(resp, max_bytes: int) -> bytes:
+    """Reads a streamed body in chunks into this thread's reusable buffer.
+
+    Aborts as soon as more than max_bytes arrive (decompressed size, so compressed
+    bombs and endless streams are cut off too). Reuse only saves re-growing the
+    buffer chunk by chunk: the returned body is a copy, so peak memory is about
+    twice the body size. The buffer keeps its capacity between fetches unless it
+    grew beyond RETAIN_BUFFER_BYTES, which is checked on every exit path.
+    """
+    buffer = getattr(_buffers, "body", None)
+    if buffer is None:
+        buffer = _buffers.body = bytearray()
+    try:
+        size = 0
+        for chunk in resp.iter_content(CHUNK_BYTES):
+            end = size + len(chunk)
+            if end > max_bytes:
+                raise FetchError(f"body exceeds the {max_bytes:,}-byte limit")
+            buffer[size:end] = chunk  # overwrites in place while the buffer is large enough
+            size = end
+        with memoryview(buffer) as view:
+            return bytes(view[:size])
+    finally:
+        if len(buffer) > RETAIN_BUFFER_BYTES:
+            _buffers.body = bytearray()
+
+
+def download(
+    url: str,
+    timeout: int = 20,
+    session=None,
+    cache: HTTPCache | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> tuple[bytes, str | None, bool]:
+    """Downloads a page body; returns (body, declared charset, not_modified).
+
+    Uses session's pooled connections if given. The body is streamed and the
+    download aborted with FetchError on a non-HTML Content-Type or once it exceeds
+    max_bytes. With a cache, a cached page is revalidated with a conditional request
+    and reused on 304 (not_modified=True).
+    """
+    meta = cache.lookup(url) if cache else None
+    with _http_get(url, timeout, session, HTTPCache.conditional_headers(meta) if meta else {}) as resp:
+        if resp.status_code == 304 and meta:
+            body = cache.load_body(url)
+            if body is not None:
+                return body, meta.get("charset"), True
+        else:
+            resp.raise_for_status()
+            _check_response(resp, max_bytes)
+            content = _read_body(resp, max_bytes)
+            if cache:
+                cache.store(url, resp.headers, content)
+            return content, charset_from_content_type(resp.headers.get("Content-Type")), False
+    # The cached body vanished between lookup and 304: fetch in full (uncached this once)
+    return download(url, timeout, session, None, max_bytes)
+
+
+def fetch_page(
+    url: str,
+    timeout: int = 20,
+    session=None,
+    cache: HTTPCache | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> tuple[str, bool]:
+    """Downloads and decodes page HTML; returns (html, not_modified). See download()."""
+    content, charset, not_modified = download(url, timeout, session, cache, max_bytes)
+    return decode_html(content, charset), not_modified
+
+
+def fetch_html(
+    url: str,
+    timeout: int = 20,
+    session=None,
+    cache: HTTPCache | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> str:
+    """Download page HTML with basic robustness."""
+    return fetch_page(url, timeout=timeout, session=session, cache=cache, max_bytes=max_bytes)[0]
 
 
 def clean_markdown(md: str) -> str:
@@ -78,35 +502,24 @@ def clean_markdown(md: str) -> str:
     return md.strip() + "\n"
 
 
-def extract_with_trafilatura(html: str) -> str | None:
-    """Try extracting main content via trafilatura, preferring markdown output if supported."""
+def extract_with_trafilatura(html: str, tree=None) -> str | None:
+    """Try extracting main content via trafilatura, preferring markdown output if supported.
+
+    Given the page's parsed tree, trafilatura works on a copy of it instead of parsing html.
+    """
+    trafilatura = _load_trafilatura()
     if trafilatura is None:
         return None
+    source = html if tree is None else tree
+    options = dict(include_comments=False, include_tables=True, include_links=True, favor_recall=True)
     try:
         # Some versions support output_format="markdown"
-        md = trafilatura.extract(
-            html,
-            include_comments=False,
-            include_tables=True,
-            include_links=True,
-            favor_recall=True,
-            output_format="markdown",  # will be ignored on older versions -> TypeError
-        )
-        if md:
-            return md
+        return trafilatura.extract(source, output_format="markdown", **options) or None
     except TypeError:
-        # Older trafilatura: no markdown output—get cleaned text/HTML and convert
+        # Older trafilatura: no markdown output—get plain text and convert
         pass
 
-    # Older versions return plain text; try to get cleaned HTML and convert
-    # (trafilatura.extract returns str, often text. We'll fall back to readability + markdownify next.)
-    txt = trafilatura.extract(
-        html,
-        include_comments=False,
-        include_tables=True,
-        include_links=True,
-        favor_recall=True,
-    )
+    txt = trafilatura.extract(source, **options)
     if txt and len(txt.strip()) > 0:
         # Convert plain text to rudimentary Markdown paragraphs
         return "\n\n".join(p.strip() for p in txt.splitlines() if p.strip())
@@ -114,105 +527,639 @@ def extract_with_trafilatura(html: str) -> str | None:
     return None
 
 
-def pick_main_container(html: str) -> str | None:
-    """Heuristic: pick likely main content container and return its inner HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+# Docs sites often have these containers (checked in order)
+CONTAINER_CLASSES = [
+    "markdown", "md-content", "prose", "content", "article-content",
+    "main-content", "docs-content", "md-main__inner", "docMainContainer"
+]
+# Fallback selectors that match almost every page; never used as a learned hint, since
+# they would hide a more specific container on later pages
+GENERIC_SELECTORS = ("main", "body")
 
-    # Prefer <article>
-    article = soup.find("article")
-    if article:
-        return str(article)
 
-    # Docs sites often have these containers:
-    for cls in [
-        "markdown", "md-content", "prose", "content", "article-content",
-        "main-content", "docs-content", "md-main__inner", "docMainContainer"
-    ]:
-        node = soup.find(attrs={"class": re.compile(rf"\b{re.escape(cls)}\b")})
-        if node:
-            return str(node)
+@lru_cache(maxsize=None)
+def _container_xpaths():
+    """One compiled XPath per container class: first element whose class matches \\b<cls>\\b.
 
-    # As a last resort, the <main> tag
-    main = soup.find("main")
-    if main:
-        return str(main)
+    The C-level contains() runs first so the EXSLT regex (a Python callback) only sees
+    candidate elements.
+    """
+    from lxml import etree
 
-    # Fallback: body (risky, but better than nothing)
-    body = soup.find("body")
-    if body:
-        return str(body)
-    return None
+    namespaces = {"re": "http://exslt.org/regular-expressions"}
+    return [
+        etree.XPath(
+            f"(//*[contains(@class, '{cls}') and re:test(@class, '\\b{re.escape(cls)}\\b')])[1]",
+            namespaces=namespaces,
+        )
+        for cls in CONTAINER_CLASSES
+    ]
+
+
+def parse_html(html: str):
+    """Parses page HTML into an lxml tree shared by the extraction tiers.
+
+    Returns None if lxml is not installed or the page does not parse; callers then
+    fall back to parsing the HTML string themselves.
+    """
+    lxml_html = _load_lxml_html()
+    if lxml_html is None:
+        return None
+    parser = lxml_html.HTMLParser(
+        encoding="utf-8", remove_comments=True, remove_pis=True, collect_ids=False, default_doctype=False
+    )
+    try:
+        return lxml_html.document_fromstring(html.encode("utf-8", errors="replace"), parser=parser)
+    except Exception:
+        return None
+
+
+def _outer_html(node) -> str:
+    return _load_lxml_html().tostring(node, encoding="unicode", with_tail=False)
+
+
+def _select(tree, selector: str):
+    """First element matching a find_main_container selector, or None."""
+    if selector.startswith("."):
+        cls = selector[1:]
+        if cls not in CONTAINER_CLASSES:
+            return None
+        found = _container_xpaths()[CONTAINER_CLASSES.index(cls)](tree)
+        return found[0] if found else None
+    return tree.find(".//" + selector)
+
+
+def find_main_container(tree, hint: str | None = None) -> tuple:
+    """Likely main content element of a parsed page and the selector that found it.
+
+    Prefers <article>, then docs containers (selector ".<class>"), then <main>, then
+    <body> (risky, but better than nothing). A hint (a selector learned for the site)
+    is tried first, falling back to the full search if it does not match; generic
+    hints (GENERIC_SELECTORS) are ignored. Returns (None, None) if there is no candidate.
+    """
+    if hint and hint not in GENERIC_SELECTORS:
+        node = _select(tree, hint)
+        if node is not None:
+            return node, hint
+    node = tree.find(".//article")
+    if node is not None:
+        return node, "article"
+    for cls, xpath in zip(CONTAINER_CLASSES, _container_xpaths()):
+        found = xpath(tree)
+        if found:
+            return found[0], "." + cls
+    for tag in ("main", "body"):
+        node = tree.find(".//" + tag)
+        if node is not None:
+            return node, tag
+    return None, None
+
+
+def pick_main_container(html: str, tree=None, hint: str | None = None) -> str | None:
+    """Heuristic: pick likely main content container and return its inner HTML."""
+    if tree is None:
+        tree = parse_html(html)
+    if tree is None:
+        return _pick_main_container_bs4(html)
+    node, _ = find_main_container(tree, hint)
+    return _outer_html(node) if node is not None else None
+
+
+def _pick_main_container_bs4(html: str) -> str | None:
+    """pick_main_container without lxml."""
+    BeautifulSoup = _load_beautifulsoup()
+    if BeautifulSoup is None:
+        return None
+    soup = BeautifulSoup(html, "html.parser")
+    node = soup.find("article")
+    for cls in CONTAINER_CLASSES:
+        if node:
+            break
+        node = soup.find(attrs={"class": re.compile(rf"\b{re.escape(cls)}\b")})
+    node = node or soup.find("main") or soup.find("body")
+    return str(node) if node else None
 
 
-def readability_to_html(html: str) -> str | None:
-    """Use readability-lxml to isolate article HTML."""
+def readability_to_html(html: str, tree=None) -> str | None:
+    """Use readability-lxml to isolate article HTML (on a copy of tree, if given)."""
+    Document = _load_readability_document()
     if Document is None:
         return None
     try:
-        doc = Document(html)
+        doc = Document(html if tree is None else copy.deepcopy(tree))
         return doc.summary(html_partial=True)
     except Exception:
         return None
 
 
+def text_length(html_fragment: str) -> int:
+    """Length of the fragment's visible text with whitespace around text nodes stripped."""
+    lxml_html = _load_lxml_html()
+    if lxml_html is None:
+        return len(html_text(html_fragment, separator="", strip=True))
+    try:
+        fragment = lxml_html.fragment_fromstring(html_fragment, create_parent="div")
+    except Exception:
+        return 0
+    return sum(len(text.strip()) for text in fragment.itertext())
+
+
 def html_to_markdown(html_fragment: str) -> str:
     """Convert HTML to Markdown via markdownify if available; else naive text fallback."""
+    html_to_md = _load_markdownify()
     if html_to_md is None:
         # Bare text fallback
-        soup = BeautifulSoup(html_fragment, "html.parser")
-        return soup.get_text("\n")
+        return html_text(html_fragment)
     return html_to_md(
         html_fragment,
         heading_style="ATX",
         strip=["script", "style", "noscript"],
+        # lxml's C parser instead of the pure-Python html.parser (ignored by old markdownify)
+        bs4_options="lxml" if _load_lxml_html() is not None else "html.parser",
         # Optional tweaks:
         # bullets="*",
         # code_language_detection=False,
     )
 
 
+# --- Tier routing ---
+TIERS = ("trafilatura", "readability", "container")
+MIN_CHARS = {"trafilatura": 100, "readability": 80, "container": 80}
+# An article/main/docs-container result shorter than this fraction of the container's
+# text most likely missed the content (a teaser, a caption, a comment block)
+MIN_COVERAGE = 0.2
+
+
+def analyze_page(tree, hint: str | None = None) -> dict:
+    """Cheap structural pass over a parsed page, used to route it and score results.
+
+    Returns the main container's selector (see find_main_container) and the lengths
+    of its text, of the text inside its <p> elements and of its link text (raw
+    text_content() lengths: whitespace included, which is fine for ratios).
+    """
+    node, selector = find_main_container(tree, hint)
+    if node is None:
+        return {"selector": None, "text": 0, "paragraph_text": 0, "link_text": 0}
+    return {
+        "selector": selector,
+        "text": len(node.text_content()),
+        "paragraph_text": sum(len(p.text_content()) for p in node.iter("p")),
+        "link_text": sum(len(a.text_content()) for a in node.iter("a")),
+    }
+
+
+def route_tiers(analysis: dict | None) -> list[str]:
+    """Order in which to try the tiers, starting with the one most likely to win.
+
+    - Very little text outside links: every tier would fall through to the
+      container pick anyway, so start there.
+    - A dedicated container (<article>, docs-site class, <main>) that is mostly
+      tables, code and lists rather than <p> prose: Trafilatura and readability
+      score such content poorly and tend to drop it, while the container pick
+      keeps it whole.
+    - Otherwise the default order, trafilatura first.
+    """
+    first = "trafilatura"
+    if analysis:
+        text = analysis["text"]
+        if text - analysis["link_text"] < 100:
+            first = "container"
+        elif analysis["selector"] not in (None, "body") and text >= 200 and analysis["paragraph_text"] < 0.2 * text:
+            first = "container"
+    return [first] + [tier for tier in TIERS if tier != first]
+
+
+def acceptable(tier: str, md: str | None, analysis: dict | None) -> bool:
+    """Quality check for a tier's Markdown: long enough and, when the page has a
+    dedicated content container, covering a reasonable share of its text."""
+    if not md:
+        return False
+    length = len(md.strip())
+    if length <= MIN_CHARS[tier]:
+        return False
+    if tier != "container" and analysis and analysis["selector"] not in (None, "body") and analysis["text"] >= 500:
+        return length >= MIN_COVERAGE * analysis["text"]
+    return True
+
+
+def _run_tier(tier: str, html: str, tree, selector: str | None = None) -> str | None:
+    if tier == "trafilatura":
+        return extract_with_trafilatura(html, tree)
+    if tier == "readability":
+        readable = readability_to_html(html, tree)
+        if readable and text_length(readable) > MIN_CHARS["readability"]:
+            return html_to_markdown(readable)
+        return None
+    return html_to_markdown(pick_main_container(html, tree, selector) or html)
+
+
+def extract_markdown(
+    html: str, tiers: list[str] | None = None, selector: str | None = None
+) -> tuple[str, str, str | None]:
+    """Produces Markdown from page HTML; returns (markdown, winning tier, container selector).
+
+    The page is parsed once with lxml and the tree is shared by all tiers. Tiers run
+    in the given order (default: route_tiers on a structural analysis of the page)
+    until one passes the acceptable() check; tiers left out are skipped. If none
+    passes, the heuristic container pick is used regardless of quality, as tier
+    "container". selector is a learned container selector tried before the full
+    search; the returned one is the selector that actually matched (None without lxml).
+    """
+    tree = parse_html(html)
+    analysis = analyze_page(tree, selector) if tree is not None else None
+    selector = analysis["selector"] if analysis else None
+    results = {}
+    for tier in tiers or route_tiers(analysis):
+        results[tier] = _run_tier(tier, html, tree, selector)
+        if acceptable(tier, results[tier], analysis):
+            return clean_markdown(results[tier]), tier, selector
+    if "container" not in results:
+        results["container"] = _run_tier("container", html, tree, selector)
+    return clean_markdown(results["container"]), "container", selector
+
+
 def extract_markdown_from_html(html: str) -> str:
     """Best-effort pipeline to produce Markdown from page HTML."""
-    # 1) Try Trafilatura direct to Markdown
-    md = extract_with_trafilatura(html)
-    if md and len(md.strip()) > 100:
-        return clean_markdown(md)
+    return extract_markdown(html)[0]
+
+
+class HostProfiles:
+    """Per-host extraction profiles: which tier wins and which container selector matches.
+
+    After MIN_PAGES pages from a host, its pages try the host's most frequent winning
+    tier first, then only the other tiers that have won there at least once, and look
+    up the usual container selector before the full selector list (generic <main> and
+    <body> picks are not learned as selectors). A page that goes another way (profiled
+    tier rejected, selector missing) is a miss; RELEARN_AFTER consecutive misses drop
+    the host's profile so it is learned again. Every
+    EXPLORE_EVERY-th page is routed by its own structure, so a tier that starts
+    winning again is noticed.
+
+    With a path, profiles are loaded from and saved to a JSON file (atomic rewrite,
+    last writer wins), so later crawls of the same site start out routed.
+    """
+
+    MIN_PAGES = 3
+    RELEARN_AFTER = 3
+    EXPLORE_EVERY = 20
+
+    def __init__(self, path: str | None = None):
+        self.path = Path(path).expanduser() if path else None
+        self._lock = threading.Lock()
+        self._routed: dict[str, int] = {}
+        self._hosts: dict[str, dict] = {}
+        if self.path:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if isinstance(data.get("hosts"), dict):
+                    self._hosts = data["hosts"]
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    @staticmethod
+    def _best(counts: dict[str, int]) -> str | None:
+        return max(counts, key=counts.get) if counts else None
+
+    def route(self, host: str) -> tuple[list[str] | None, str | None]:
+        """(tier order, container selector) for the next page from host; (None, None) to
+        route it by its own structure."""
+        with self._lock:
+            profile = self._hosts.get(host)
+            if not profile or sum(profile["tiers"].values()) < self.MIN_PAGES:
+                return None, None
+            self._routed[host] = self._routed.get(host, 0) + 1
+            if self._routed[host] % self.EXPLORE_EVERY == 0:
+                return None, None
+            wins = dict(profile["tiers"])
+            selector = self._best(profile["selectors"])
+        best = self._best(wins)
+        return [best] + [tier for tier in TIERS if tier != best and wins.get(tier)], selector
+
+    def record(self, host: str, tier: str, selector: str | None):
+        """Counts a page's outcome, tracking misses against the host's current profile."""
+        with self._lock:
+            profile = self._hosts.setdefault(host, {"tiers": {}, "selectors": {}, "misses": 0})
+            if sum(profile["tiers"].values()) >= self.MIN_PAGES:
+                best_selector = self._best(profile["selectors"])
+                missed = tier != self._best(profile["tiers"]) or (best_selector and selector != best_selector)
+                profile["misses"] = profile["misses"] + 1 if missed else 0
+                if profile["misses"] >= self.RELEARN_AFTER:
+                    profile.update(tiers={}, selectors={}, misses=0)
+            profile["tiers"][tier] = profile["tiers"].get(tier, 0) + 1
+            if selector and selector not in GENERIC_SELECTORS:
+                profile["selectors"][selector] = profile["selectors"].get(selector, 0) + 1
+            profile["updated"] = time.time()
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            payload = json.dumps({"version": 1, "hosts": self._hosts}, indent=1, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {host: dict(profile["tiers"]) for host, profile in self._hosts.items()}
+
+
+# --- Bulk mode ---
+class HostLimiter:
+    """Caps the number of concurrent requests to each host."""
+
+    def __init__(self, per_host: int):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            semaphore = self._slots.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        with semaphore:
+            yield
+
+
+def read_url_list(path: str) -> list[str]:
+    """URLs from a file ('-' for stdin), one per line; blank lines and # comments are skipped."""
+    text = sys.stdin.read() if path == "-" else Path(path).read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+
+
+def url_output_path(url: str, output_dir: Path) -> Path:
+    """Maps a URL to <output_dir>/<host>/<path>.md; query strings get a short hash suffix."""
+    parts = urlsplit(url)
+    host = re.sub(r"[^\w.-]", "_", parts.netloc.lower()) or "_"
+    segments = [re.sub(r"[^\w.-]", "_", s) for s in parts.path.split("/") if s not in ("", ".", "..")]
+    if not segments or parts.path.endswith("/"):
+        segments.append("index")
+    stem = re.sub(r"\.(html?|php|aspx?)$", "", segments[-1], flags=re.IGNORECASE) or "index"
+    if parts.query:
+        stem += "-" + hashlib.sha1(parts.query.encode("utf-8")).hexdigest()[:8]
+    segments[-1] = stem + ".md"
+    return output_dir.joinpath(host, *segments)
+
+
+def _fetch_for_bulk(
+    url: str,
+    session,
+    limiter: HostLimiter,
+    in_flight: threading.Semaphore,
+    timeout: int,
+    cache: HTTPCache | None,
+    max_bytes: int,
+) -> tuple[bytes, str | None, bool]:
+    # The in-flight slot is held until the page is extracted (or dropped), so fetching
+    # cannot run arbitrarily far ahead of extraction
+    in_flight.acquire()
+    try:
+        with limiter.slot(url):
+            return download(url, timeout=timeout, session=session, cache=cache, max_bytes=max_bytes)
+    except BaseException:
+        in_flight.release()
+        raise
 
-    # 2) If not good enough, try readability + markdownify
-    readable = readability_to_html(html)
-    if readable and len(BeautifulSoup(readable, "html.parser").get_text(strip=True)) > 80:
-        md2 = html_to_markdown(readable)
-        if md2 and len(md2.strip()) > 80:
-            return clean_markdown(md2)
 
-    # 3) Heuristic container pick + markdownify
-    container = pick_main_container(html) or html
-    md3 = html_to_markdown(container)
-    return clean_markdown(md3)
+def _init_extract_worker():
+    """Process pool initializer: imports the extraction libraries once per worker."""
+    for load in (
+        _load_lxml_html, _load_trafilatura, _load_readability_document,
+        _load_markdownify, _load_beautifulsoup, _load_charset_normalizer,
+    ):
+        load()
+    if _load_lxml_html() is not None:
+        _container_xpaths()
+
+
+def _extract_and_write(
+    content: bytes, charset: str | None, output_path: Path, tiers: list[str] | None, selector: str | None
+) -> tuple[int, str, str | None]:
+    """Decodes and extracts a page to Markdown at output_path; returns (Markdown length, tier, selector).
+
+    Runs in an extraction thread or worker process: it takes only the raw body and
+    returns only small values, so nothing large crosses a process boundary twice.
+    """
+    md, tier, selector = extract_markdown(decode_html(content, charset), tiers, selector)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(md, encoding="utf-8")
+    return len(md), tier, selector
+
+
+def _extract_pool(workers: int, processes: bool):
+    if not processes:
+        return ThreadPoolExecutor(max_workers=workers)
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # spawn, not fork: the fetch threads are already running when the pool starts
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_extract_worker
+    )
+
+
+def convert_urls(
+    urls: list[str],
+    output_dir: Path,
+    jobs: int = 8,
+    per_host: int = 4,
+    extract_workers: int = 4,
+    timeout: int = 20,
+    cache: HTTPCache | None = None,
+    profiles: HostProfiles | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    processes: bool = False,
+) -> int:
+    """Fetches and converts urls concurrently; returns the number of failed URLs.
+
+    Pages the cache revalidates as unchanged are not re-extracted if their output exists.
+    Each host's winning tier and container selector are learned (HostProfiles, in memory
+    unless profiles are given) to route its later pages. With processes, extraction
+    runs in extract_workers worker processes instead of threads. At most jobs +
+    2 * extract_workers pages are held in memory (fetching or waiting for extraction).
+    """
+    urls = list(dict.fromkeys(urls))
+    session = make_session(pool_size=per_host)
+    limiter = HostLimiter(per_host)
+    profiles = profiles or HostProfiles()
+    counts = {"failed": 0, "unchanged": 0}
+    counts_lock = threading.Lock()
+    in_flight = threading.BoundedSemaphore(jobs + 2 * extract_workers)
+    started = time.perf_counter()
+
+    def report(url: str, message: str):
+        print(f"{message}  {url}", file=sys.stderr, flush=True)
+
+    broken: list[BaseException] = []  # set once the extraction pool is unusable
+
+    def pool_broke(error: BaseException):
+        # A dead worker process (OOM, SIGKILL) breaks the whole pool: stop fetching
+        # instead of filling in-flight slots that no extraction will ever release
+        with counts_lock:
+            if broken:
+                return
+            broken.append(error)
+        print(f"Extraction pool failed ({error}); skipping the remaining URLs", file=sys.stderr, flush=True)
+        for pending in fetches:
+            pending.cancel()
+
+    def extracted(future, url: str, output_path: Path):
+        in_flight.release()
+        try:
+            chars, tier, selector = future.result()
+        except Exception as e:
+            with counts_lock:
+                counts["failed"] += 1
+            report(url, f"FAIL extract: {e}")
+            if isinstance(e, BrokenExecutor):
+                pool_broke(e)
+            return
+        profiles.record(urlsplit(url).netloc.lower(), tier, selector)
+        report(url, f"ok   {output_path} ({chars} chars, {tier})")
+
+    # One session for all fetch threads, so each host's keep-alive connections are
+    # shared (urllib3's connection pools are thread-safe).
+    with session, ThreadPoolExecutor(max_workers=jobs) as fetch_pool, \
+            _extract_pool(extract_workers, processes) as extract_pool:
+        fetches = {
+            fetch_pool.submit(_fetch_for_bulk, url, session, limiter, in_flight, timeout, cache, max_bytes): url
+            for url in urls
+        }
+        for future in as_completed(fetches):
+            url = fetches[future]
+            if broken:
+                # Successful fetches still hold their in-flight slot; cancelled ones never took one
+                if not future.cancelled() and future.exception() is None:
+                    in_flight.release()
+                with counts_lock:
+                    counts["failed"] += 1
+                report(url, "FAIL skipped: extraction pool failed")
+                continue
+            try:
+                content, charset, not_modified = future.result()
+            except Exception as e:
+                with counts_lock:
+                    counts["failed"] += 1
+                report(url, f"FAIL fetch: {e}")
+                continue
+            output_path = url_output_path(url, output_dir)
+            if not_modified and output_path.exists():
+                in_flight.release()
+                counts["unchanged"] += 1
+                report(url, f"same {output_path}")
+                continue
+            tiers, selector = profiles.route(urlsplit(url).netloc.lower())
+            try:
+                extraction = extract_pool.submit(_extract_and_write, content, charset, output_path, tiers, selector)
+            except Exception as e:
+                in_flight.release()
+                with counts_lock:
+                    counts["failed"] += 1
+                report(url, f"FAIL extract: {e}")
+                if isinstance(e, BrokenExecutor):
+                    pool_broke(e)
+                continue
+            # Recorded as soon as each page finishes, so later submissions see it
+            extraction.add_done_callback(lambda f, url=url, path=output_path: extracted(f, url, path))
+            del content
+
+    failed, unchanged = counts["failed"], counts["unchanged"]
+    try:
+        profiles.save()
+    except OSError as e:
+        print(f"Warning: could not save extraction profiles ({e})", file=sys.stderr)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Converted {len(urls) - failed}/{len(urls)} URLs in {elapsed:.1f}s"
+        + (f", {unchanged} unchanged" if unchanged else "")
+        + (f" ({failed} failed)" if failed else ""),
+        file=sys.stderr,
+    )
+    for host, wins in sorted(profiles.summary().items()):
+        tiers = ", ".join(f"{tier} {count}" for tier, count in sorted(wins.items(), key=lambda item: -item[1]))
+        print(f"  {host}: {tiers}", file=sys.stderr)
+    return failed
 
 
 def main():
     ap = argparse.ArgumentParser(
-        description="Download a web page and extract the main content as Markdown."
+        description="Download web pages and extract the main content as Markdown."
     )
-    ap.add_argument("url", help="Page URL to download")
+    ap.add_argument("urls", nargs="*", metavar="url", help="Page URL(s) to download")
     ap.add_argument("-o", "--output", help="Path to write .md file (default: stdout)")
     ap.add_argument("--save-html", help="Also save the original HTML to this path")
     ap.add_argument("--save-clean-html", help="Save cleaned/isolated HTML (post-extraction)")
+    ap.add_argument("-i", "--input", metavar="FILE", help="Read URLs from FILE, one per line ('-' for stdin); implies bulk mode")
+    ap.add_argument("--output-dir", metavar="DIR", help="Bulk mode: write <DIR>/<host>/<path>.md per URL")
+    ap.add_argument("-j", "--jobs", type=int, default=8, help="Bulk mode: concurrent fetches (default: 8)")
+    ap.add_argument("--per-host", type=int, default=4, help="Bulk mode: concurrent fetches per host (default: 4)")
+    ap.add_argument("--extract-workers", type=int, help="Bulk mode: extraction threads, or processes with --processes (default: 4, or the CPU count)")
+    ap.add_argument("--processes", action="store_true", help="Bulk mode: extract in worker processes to use all cores")
+    ap.add_argument("--timeout", type=int, default=20, help="Per-request timeout in seconds (default: 20)")
+    ap.add_argument("--cache-dir", default=os.getenv("URL2MD_CACHE_DIR"), metavar="DIR", help="Cache pages on disk and revalidate them with ETag/Last-Modified (default: $URL2MD_CACHE_DIR)")
+    ap.add_argument("--no-cache", action="store_true", help="Disable the HTTP cache even if URL2MD_CACHE_DIR is set")
+    ap.add_argument("--cache-max-size", type=float, default=1024, metavar="MB", help="Evict least recently used cache entries above this size (default: 1024)")
+    ap.add_argument("--max-size", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024), metavar="MB", help="Abort downloads larger than this (default: 20)")
+    ap.add_argument("--profiles", default=os.getenv("URL2MD_PROFILES"), metavar="PATH", help="Persist learned per-host extraction profiles in this JSON file (default: $URL2MD_PROFILES)")
     args = ap.parse_args()
+    cache = None
+    if args.cache_dir and not args.no_cache:
+        cache = HTTPCache(args.cache_dir, max_bytes=int(args.cache_max_size * 1024 * 1024))
+    profiles = HostProfiles(args.profiles) if args.profiles else None
+    max_bytes = int(args.max_size * 1024 * 1024)
 
-    html = fetch_html(args.url)
+    urls = list(args.urls)
+    if args.input:
+        urls += read_url_list(args.input)
+    if not urls:
+        ap.error("no URL given")
+    if args.input or len(urls) > 1:
+        if not args.output_dir:
+            ap.error("bulk mode (several URLs or --input) requires --output-dir")
+        if args.output or args.save_html or args.save_clean_html:
+            ap.error("-o/--save-html/--save-clean-html take a single URL")
+        if args.extract_workers is None:
+            args.extract_workers = (os.cpu_count() or 1) if args.processes else 4
+        if min(args.jobs, args.per_host, args.extract_workers) < 1:
+            ap.error("--jobs, --per-host and --extract-workers must be at least 1")
+        failed = convert_urls(
+            urls,
+            Path(args.output_dir),
+            jobs=args.jobs,
+            per_host=args.per_host,
+            extract_workers=args.extract_workers,
+            timeout=args.timeout,
+            cache=cache,
+            profiles=profiles,
+            max_bytes=max_bytes,
+            processes=args.processes,
+        )
+        sys.exit(1 if failed else 0)
+
+    try:
+        html = fetch_html(urls[0], timeout=args.timeout, cache=cache, max_bytes=max_bytes)
+    except FetchError as e:
+        sys.exit(f"Error: {urls[0]}: {e}")
 
     if args.save_html:
         Path(args.save_html).write_text(html, encoding="utf-8")
 
-    md = extract_markdown_from_html(html)
+    if profiles:
+        host = urlsplit(urls[0]).netloc.lower()
+        md, tier, selector = extract_markdown(html, *profiles.route(host))
+        profiles.record(host, tier, selector)
+        profiles.save()
+    else:
+        md = extract_markdown_from_html(html)
 
     # Optionally save cleaned HTML (using readability/container heuristic)
     if args.save_clean_html:
-        readable = readability_to_html(html)
+        tree = parse_html(html)
+        readable = readability_to_html(html, tree)
         if not readable:
-            readable = pick_main_container(html) or html
+            readable = pick_main_container(html, tree) or html
         Path(args.save_clean_html).write_text(readable, encoding="utf-8")
 
     if args.output: